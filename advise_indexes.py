@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Check the database's indexes against a query workload.
+Replays the API's named queries, or a recorded query log, through
+EXPLAIN QUERY PLAN and reports full scans, redundant indexes and the
+recommended index set.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Import database module
+try:
+    from vbdb_fetch import init_db
+    from vbdb_fetch.indexes import load_query_log, print_advice
+except ImportError:
+    logger.error("Cannot import vbdb_fetch. Make sure you've installed the package.")
+    logger.error("Run 'pip install vbdb-fetch' or install it from source.")
+    sys.exit(1)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Advise on volleyball database indexes"
+    )
+    parser.add_argument(
+        "--db-path", default="./vbdb.db", help="Path to the database file"
+    )
+    parser.add_argument(
+        "--query-log",
+        help="File of semicolon-terminated queries to analyze (default: API queries)",
+    )
+    parser.add_argument(
+        "--plans", action="store_true", help="Print the query plan of every query"
+    )
+    parser.add_argument(
+        "--sql",
+        action="store_true",
+        help="Print the recommended index set as CREATE INDEX statements",
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Main function."""
+    args = parse_arguments()
+
+    if not os.path.exists(args.db_path):
+        logger.error(f"Database not found: {args.db_path}")
+        sys.exit(1)
+
+    queries = load_query_log(args.query_log) if args.query_log else None
+
+    db = init_db(args.db_path)
+    advice = db.advise_indexes(queries)
+    db.close()
+
+    if args.plans:
+        for name, details in advice["plans"].items():
+            print(f"\n{name}:")
+            for detail in details:
+                print(f"  {detail}")
+
+    print_advice(advice)
+
+    if args.sql:
+        print("\nRecommended indexes:")
+        for statement in advice["recommended"]:
+            print(f"{statement};")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark Database writer throughput (rows/sec) for each supported input format:
+list of dicts, column-ordered tuples, and a pandas DataFrame.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to Python path so the benchmark runs from a checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vbdb_fetch import TABLE_COLUMNS, init_db  # noqa: E402
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+N_TEAMS = 300
+
+
+def make_players(n_players, n_teams):
+    """Generate synthetic ncaam_players rows as column-ordered tuples."""
+    return [
+        (
+            str(100000 + i),
+            f"Player {i}",
+            str(i % 30),
+            f"https://stats.ncaa.org/players/{100000 + i}",
+            str(i % n_teams),
+            "NCAA",
+            "OH",
+            "6-5",
+            "Somewhere, CA",
+            "Some High School",
+            f"Team {i % n_teams}",
+            "Sr.",
+            f"T{i % n_teams}",
+            "2024-25",
+            "600000",
+        )
+        for i in range(n_players)
+    ]
+
+
+def make_teams(n_teams):
+    """Generate synthetic ncaam_teams rows as dicts."""
+    return [
+        {
+            "team_id": str(i),
+            "name": f"Team {i}",
+            "name_short": f"T{i}",
+            "img": None,
+            "url": None,
+            "division": "I",
+            "conference": "Conf",
+            "conference_short": "C",
+            "level": "NCAA M",
+        }
+        for i in range(n_teams)
+    ]
+
+
+def run(label, data, n_rows, repeat):
+    """Load data into a fresh in-memory database and report the best rate."""
+    best = float("inf")
+    for _ in range(repeat):
+        db = init_db(in_memory=True)
+        db.add_ncaam_teams(make_teams(N_TEAMS))
+        start = time.perf_counter()
+        db.add_ncaam_players(data)
+        best = min(best, time.perf_counter() - start)
+        db.close()
+    print(f"  {label:<8} {n_rows / best:>12,.0f} rows/sec  ({best * 1000:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk-load input formats")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows per load")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per format")
+    args = parser.parse_args()
+
+    columns = TABLE_COLUMNS["ncaam_players"]
+    tuples = make_players(args.rows, N_TEAMS)
+    dicts = [dict(zip(columns, row)) for row in tuples]
+
+    print(f"Loading {args.rows:,} ncaam_players rows:")
+    run("dicts", dicts, args.rows, args.repeat)
+    run("tuples", tuples, args.rows, args.repeat)
+    if pd is not None:
+        run("frame", pd.DataFrame(tuples, columns=columns), args.rows, args.repeat)
+    else:
+        print("  frame    skipped (pandas not installed)")
+
+
+if __name__ == "__main__":
+    main()
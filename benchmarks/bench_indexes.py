@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark the NCAAM tables under the previous and the current index set:
+write throughput (rows/sec) for roster and results loads, and median read
+latency for each of the API's named NCAAM queries.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to Python path so the benchmark runs from a checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vbdb_fetch import init_db  # noqa: E402
+from vbdb_fetch.indexes import API_QUERIES  # noqa: E402
+
+N_TEAMS = 300
+
+# Index set before redundant indexes were pruned, applied over the current schema
+PREVIOUS_INDEXES = """
+CREATE INDEX idx_ncaam_team_id ON ncaam_teams(team_id);
+DROP INDEX idx_ncaam_conference;
+CREATE INDEX idx_ncaam_conference ON ncaam_teams(conference);
+CREATE INDEX idx_ncaam_player_id ON ncaam_players(player_id);
+CREATE INDEX idx_ncaam_match_id ON ncaam_results(match_id);
+CREATE INDEX idx_ncaam_teams ON ncaam_results(home_team_id, away_team_id);
+DROP INDEX idx_ncaam_status;
+CREATE INDEX idx_ncaam_status ON ncaam_results(status);
+"""
+
+PARAMS = {
+    "team_id": "7",
+    "conference": "Conf 3",
+    "player_id": "100042",
+    "match_id": "m42",
+    "start": "2025-02-01",
+    "end": "2025-02-15",
+    "status": "completed",
+    "limit": 25,
+}
+
+
+def make_teams(n_teams):
+    """Generate synthetic ncaam_teams rows as tuples."""
+    return [
+        (str(i), f"Team {i}", f"T{i}", None, None, "I", f"Conf {i % 20}", "C", "NCAA M")
+        for i in range(n_teams)
+    ]
+
+
+def make_players(n_rows):
+    """Generate synthetic ncaam_players rows as tuples."""
+    return [
+        (
+            str(100000 + i), f"Player {i}", str(i % 30), None, str(i % N_TEAMS),
+            "NCAA", "OH", "6-5", "Somewhere, CA", None, f"Team {i % N_TEAMS}",
+            "Sr.", f"T{i % N_TEAMS}", "2025", "600000",
+        )
+        for i in range(n_rows)
+    ]
+
+
+def make_results(n_rows):
+    """Generate synthetic ncaam_results rows as tuples."""
+    return [
+        (
+            f"m{i}", f"{1 + i % 4:02d}/{1 + i % 28:02d}/2025", "19:00", None,
+            str(i % N_TEAMS), f"Team {i % N_TEAMS}",
+            str((i * 7 + 1) % N_TEAMS), f"Team {(i * 7 + 1) % N_TEAMS}",
+            "3-1", None, None, None, None, None, "I", "I", "2025",
+            "completed" if i % 10 else "unknown",
+        )
+        for i in range(n_rows)
+    ]
+
+
+def run(label, previous, players, results, repeat):
+    """Load and query a fresh in-memory database under one index set."""
+    db = init_db(in_memory=True)
+    if previous:
+        db.conn.executescript(PREVIOUS_INDEXES)
+    db.add_ncaam_teams(make_teams(N_TEAMS))
+
+    start = time.perf_counter()
+    db.add_ncaam_players(players)
+    player_rate = len(players) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    db.add_ncaam_results(results)
+    result_rate = len(results) / (time.perf_counter() - start)
+
+    db.conn.execute("ANALYZE")
+
+    print(f"\n{label}:")
+    print(f"  {'write ncaam_players':<28} {player_rate:>12,.0f} rows/sec")
+    print(f"  {'write ncaam_results':<28} {result_rate:>12,.0f} rows/sec")
+
+    for name, sql in API_QUERIES.items():
+        if not name.startswith("ncaam_"):
+            continue
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            db.conn.execute(sql, PARAMS).fetchall()
+            timings.append(time.perf_counter() - start)
+        print(f"  {'read ' + name:<28} {statistics.median(timings) * 1e6:>12,.0f} us")
+
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark index sets")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows per table")
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per query")
+    args = parser.parse_args()
+
+    players = make_players(args.rows)
+    results = make_results(args.rows)
+
+    print(f"Loading {args.rows:,} ncaam_players and ncaam_results rows:")
+    run("previous indexes", True, players, results, args.repeat)
+    run("current indexes", False, players, results, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
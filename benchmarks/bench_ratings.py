@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark team ratings for an NCAA-sized season: a full rebuild of every
+daily snapshot, then the incremental update after one more match day.
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add src directory to Python path so the benchmark runs from a checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vbdb_fetch import init_db  # noqa: E402
+
+SEASON_START = date(2025, 1, 2)
+
+
+def make_results(n_teams, n_days, per_day, seed=7):
+    """Generate synthetic ncaaw_results rows grouped by day, as tuples."""
+    rng = random.Random(seed)
+    strength = [rng.gauss(0, 1) for _ in range(n_teams)]
+    days = []
+    for day in range(n_days):
+        played = (SEASON_START + timedelta(days=day)).strftime("%m/%d/%Y")
+        teams = rng.sample(range(n_teams), 2 * per_day)
+        rows = []
+        for k in range(per_day):
+            home, away = teams[2 * k], teams[2 * k + 1]
+            home_won = rng.random() < 1 / (1 + 10 ** (strength[away] - strength[home]))
+            loser_sets = rng.randint(0, 2)
+            score = f"3-{loser_sets}" if home_won else f"{loser_sets}-3"
+            rows.append(
+                (
+                    f"d{day}m{k}", played, "19:00", None,
+                    str(home), f"Team {home}", str(away), f"Team {away}",
+                    score, None, None, None, None, None, "I", "I", "2025",
+                    "completed",
+                )
+            )
+        days.append(rows)
+    return days
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark team ratings")
+    parser.add_argument("--teams", type=int, default=1000, help="Teams in the league")
+    parser.add_argument("--days", type=int, default=120, help="Match days")
+    parser.add_argument("--per-day", type=int, default=125, help="Matches per day")
+    args = parser.parse_args()
+
+    days = make_results(args.teams, args.days + 1, args.per_day)
+    db = init_db(in_memory=True)
+    db.add_ncaaw_teams(
+        [
+            (str(i), f"Team {i}", f"T{i}", None, None, "I", f"Conf {i % 30}", "C", "I")
+            for i in range(args.teams)
+        ]
+    )
+    db.add_ncaaw_results([row for rows in days[:-1] for row in rows])
+
+    n_matches = args.days * args.per_day
+    print(f"{args.teams:,} teams, {n_matches:,} matches over {args.days} days:")
+
+    start = time.perf_counter()
+    written = db.update_ratings("ncaaw", "2025", rebuild=True)
+    print(f"  {'full rebuild':<20} {time.perf_counter() - start:>8.3f} s "
+          f"({written} snapshots)")
+
+    db.add_ncaaw_results(days[-1])
+    start = time.perf_counter()
+    written = db.update_ratings("ncaaw", "2025")
+    print(f"  {'one new day':<20} {time.perf_counter() - start:>8.3f} s "
+          f"({written} snapshot)")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
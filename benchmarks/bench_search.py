@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark typeahead search over a multi-season NCAA roster corpus: median
+and p95 latency of Database.search() for each typed prefix length, against
+the LIKE '%...%' scan it replaces.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to Python path so the benchmark runs from a checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vbdb_fetch import init_db  # noqa: E402
+
+N_TEAMS = 1000
+SYLLABLES = (
+    "an bel cor da el fin ga hol is jo ka lin mar nor os pe ri sa ton vi".split()
+)
+
+
+def make_name(rng):
+    """Generate a pronounceable first and last name."""
+    first = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+    last = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    return f"{first.title()} {last.title()}"
+
+
+def make_players(n_players, seasons, seed=11):
+    """Generate ncaaw_players rows, each player listed once per season."""
+    rng = random.Random(seed)
+    people = [
+        (make_name(rng), f"{make_name(rng).split()[1]}ville, CA")
+        for _ in range(n_players)
+    ]
+    return [
+        (
+            str(100000 + i), name, str(i % 30), None, str(i % N_TEAMS), "NCAA",
+            "OH", "6-1", hometown, f"{hometown.split(',')[0]} High School",
+            f"Team {i % N_TEAMS}", "Sr.", f"T{i % N_TEAMS}", season, f"{season}{i}",
+        )
+        for season in seasons
+        for i, (name, hometown) in enumerate(people)
+    ], [name for name, _ in people]
+
+
+def time_query(run, repeat):
+    """Median and p95 seconds of run() over repeat calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return statistics.median(timings), timings[int(0.95 * (len(timings) - 1))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-text search")
+    parser.add_argument("--players", type=int, default=25000, help="Players")
+    parser.add_argument("--seasons", type=int, default=4, help="Seasons each")
+    parser.add_argument("--queries", type=int, default=50, help="Names to type")
+    args = parser.parse_args()
+
+    seasons = [str(2025 - k) for k in range(args.seasons)]
+    rows, names = make_players(args.players, seasons)
+
+    db = init_db(in_memory=True)
+    db.add_ncaaw_teams(
+        [
+            (str(i), f"Team {i}", f"T{i}", None, None, "I", f"Conf {i % 30}", "C", "I")
+            for i in range(N_TEAMS)
+        ]
+    )
+    start = time.perf_counter()
+    db.add_ncaaw_players(rows)
+    rate = len(rows) / (time.perf_counter() - start)
+    print(f"Loaded {len(rows):,} ncaaw_players rows ({rate:,.0f} rows/sec)")
+
+    typed = random.Random(3).sample(names, args.queries)
+    print(f"\n{'typed':<24} {'search median':>14} {'p95':>10} {'LIKE median':>14}")
+    for length in (2, 3, 5, 8):
+        prefixes = [name[:length] for name in typed]
+        queue = iter(prefixes * 3)
+        median, p95 = time_query(
+            lambda: db.search(next(queue), limit=10), len(prefixes)
+        )
+        queue = iter(prefixes * 3)
+        like, _ = time_query(
+            lambda: db.execute(
+                "SELECT * FROM ncaaw_players WHERE name LIKE :text "
+                "OR hometown LIKE :text OR high_school LIKE :text "
+                "ORDER BY name LIMIT 10",
+                {"text": f"%{next(queue)}%"},
+            ).fetchall(),
+            min(len(prefixes), 10),
+        )
+        print(
+            f"  {f'{length} characters':<22} {median * 1e3:>11.2f} ms "
+            f"{p95 * 1e3:>7.2f} ms {like * 1e3:>11.2f} ms"
+        )
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ import time
 import sys
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Callable, Optional, Any
 
 # Set up logging
@@ -20,6 +22,12 @@ logger = logging.getLogger(__name__)
 # Import database module - assuming vbdb_fetch is installed as a package
 try:
     from vbdb_fetch import init_db
+    from vbdb_fetch.browser import (
+        DEFAULT_DRIVERS,
+        close_shared_browser_pool,
+        configure_browsers,
+    )
+    from vbdb_fetch.page_cache import DEFAULT_TTL, configure_page_cache
 except ImportError:
     logger.error("Cannot import vbdb_fetch. Make sure you've installed the package.")
     logger.error("Run 'pip install vbdb-fetch' or install it from source.")
@@ -78,6 +86,11 @@ registry = FetcherRegistry()
 # Data Import Functions
 # ========================
 
+# What import_league counts per league, each from its own guarded step
+COUNT_KINDS = (
+    "teams", "players", "schedules", "rating_days", "player_lines", "pbp_matches"
+)
+
 
 def fetch_and_add_teams(db: Any, league: str, fetch_func: Callable) -> int:
     """
@@ -96,12 +109,15 @@ def fetch_and_add_teams(db: Any, league: str, fetch_func: Callable) -> int:
 
     try:
         teams = fetch_func()
-        if not teams:
+        if teams is None or len(teams) == 0:
             logger.warning(f"No {league} teams found")
             return 0
 
         # Debug: Check level values
-        levels = set(team.get("level", "None") for team in teams)
+        if hasattr(teams, "columns"):
+            levels = set(teams["level"].fillna("None"))
+        else:
+            levels = set(team.get("level", "None") for team in teams)
         logger.info(f"{league} teams have these levels: {levels}")
 
         # Use the appropriate method based on the league
@@ -140,8 +156,12 @@ def fetch_and_add_players(db: Any, league: str, fetch_func: Callable) -> int:
     start_time = time.time()
 
     try:
-        players = fetch_func()
-        if not players:
+        # NCAA rosters are crawled for the teams already in the database
+        if league.upper() in ("NCAAM", "NCAAW"):
+            players = fetch_func(db)
+        else:
+            players = fetch_func()
+        if players is None or len(players) == 0:
             logger.warning(f"No {league} players found")
             return 0
 
@@ -181,7 +201,11 @@ def fetch_and_add_schedule(db: Any, league: str, fetch_func: Callable) -> int:
     start_time = time.time()
 
     try:
-        matches = fetch_func()
+        # LOVB reuses the match details resolved on earlier runs
+        if league.upper() == "LOVB":
+            matches = fetch_func(db)
+        else:
+            matches = fetch_func()
         if not matches:
             logger.warning(f"No {league} matches found")
             return 0
@@ -206,17 +230,145 @@ def fetch_and_add_schedule(db: Any, league: str, fetch_func: Callable) -> int:
         logger.exception(e)  # This will print the full traceback
         return 0
 
+
+def update_league_ratings(db: Any, league: str) -> int:
+    """
+    Extend a league's daily rating snapshots over its stored results.
+
+    Args:
+        db: Database connection
+        league: League name for logging
+
+    Returns:
+        Number of match days rated
+    """
+    try:
+        days = db.update_ratings(league.lower())
+        logger.info(f"Updated {league} ratings for {days} match days")
+        return days
+    except Exception as e:
+        logger.error(f"Error updating {league} ratings: {e}")
+        logger.exception(e)
+        return 0
+
+
+def fetch_and_add_player_lines(db: Any, league: str) -> int:
+    """
+    Import player box score lines for NCAA matches that have none yet.
+
+    Args:
+        db: Database connection
+        league: League name for logging
+
+    Returns:
+        Number of player match lines imported
+    """
+    try:
+        from schedule.fetch_ncaa_individual_stats import fetch_new_individual_stats
+
+        lines = fetch_new_individual_stats(db, league.lower())
+        logger.info(f"Imported {lines} {league} player match lines")
+        return lines
+    except Exception as e:
+        logger.error(f"Error importing {league} player match lines: {e}")
+        logger.exception(e)
+        return 0
+
+
+def fetch_and_add_pbp(db: Any, league: str) -> int:
+    """
+    Import play-by-play for NCAA matches that have none yet.
+
+    Args:
+        db: Database connection
+        league: League name for logging
+
+    Returns:
+        Number of matches whose play-by-play was imported
+    """
+    try:
+        from schedule.fetch_ncaa_pbp import fetch_new_pbp
+
+        plays = fetch_new_pbp(db, league.lower())
+        logger.info(f"Imported play-by-play for {plays} {league} matches")
+        return plays
+    except Exception as e:
+        logger.error(f"Error importing {league} play-by-play: {e}")
+        logger.exception(e)
+        return 0
+
 # ========================
 # Database Build Function
 # ========================
 
 
+def import_league(
+    db: Any,
+    league: str,
+    should_import_teams: bool = True,
+    import_rosters: bool = True,
+    import_schedules: bool = True,
+) -> Dict[str, int]:
+    """
+    Import teams, players, and schedules for a single league.
+
+    Args:
+        db: Database connection
+        league: League to import
+        should_import_teams: Whether to import team data
+        import_rosters: Whether to import player rosters
+        import_schedules: Whether to import schedules
+
+    Returns:
+        Dictionary with the count of each of COUNT_KINDS imported
+    """
+    counts = {kind: 0 for kind in COUNT_KINDS}
+
+    # Import teams if specified
+    if should_import_teams:
+        team_fetcher = registry.get_team_fetcher(league)
+        if team_fetcher:
+            counts["teams"] = fetch_and_add_teams(db, league, team_fetcher)
+        else:
+            logger.warning(f"No team fetcher for: {league}")
+
+    # Import rosters if specified
+    if import_rosters:
+        player_fetcher = registry.get_player_fetcher(league)
+        if player_fetcher:
+            counts["players"] = fetch_and_add_players(db, league, player_fetcher)
+        else:
+            logger.warning(f"No player fetcher for: {league}")
+
+    # Import schedules if specified
+    if import_schedules:
+        schedule_fetcher = registry.get_schedule_fetcher(league)
+        if schedule_fetcher:
+            counts["schedules"] = fetch_and_add_schedule(
+                db, league, schedule_fetcher
+            )
+            # Each step below runs even if the one before it failed
+            counts["rating_days"] = update_league_ratings(db, league)
+            if league.upper() in ("NCAAM", "NCAAW"):
+                counts["player_lines"] = fetch_and_add_player_lines(db, league)
+                # After the player lines, which name the players plays refer to
+                counts["pbp_matches"] = fetch_and_add_pbp(db, league)
+        else:
+            logger.warning(f"No schedule fetcher for: {league}")
+
+    return counts
+
+
 def build_database(
     leagues: List[str] = None,
     db_path: str = None,
     should_import_teams: bool = True,
     import_rosters: bool = True,
     import_schedules: bool = True,
+    parallel: bool = False,
+    maintain: bool = False,
+    browsers: int = DEFAULT_DRIVERS,
+    page_cache_ttl: Optional[float] = DEFAULT_TTL,
 ) -> Dict[str, Dict[str, int]]:
     """
     Build the volleyball database by importing teams, players, and schedules data.
@@ -227,6 +379,16 @@ def build_database(
         should_import_teams: Whether to import team data (default: True)
         import_rosters: Whether to import player rosters (default: True)
         import_schedules: Whether to import schedules (default: True)
+        parallel: Import leagues concurrently through one shared writer
+            (default: False)
+        maintain: Run post-build maintenance (team alias rebuild, dedupe,
+            ANALYZE, vacuum, integrity check) when the import finishes
+            (default: False)
+        browsers: Headless Chrome drivers shared by the LOVB fetchers
+            (default: 2)
+        page_cache_ttl: Seconds fetched LOVB pages are reused for; 0
+            disables the page cache, None reuses pages of any age
+            (default: 3600)
 
     Returns:
         Dictionary with count of teams, players, and schedules imported by league
@@ -239,48 +401,48 @@ def build_database(
     ensure_directory_exists(os.path.dirname(db_path))
 
     logger.info(f"Initializing database at: {db_path}")
-    db = init_db(db_path)
+    db = init_db(db_path, concurrent=parallel)
+
+    # Browser-driven fetchers share one pool of drivers for the whole build
+    configure_browsers(browsers)
+    configure_page_cache(page_cache_ttl)
 
     # Default to all leagues if none specified
     if not leagues:
         leagues = registry.get_all_leagues()
 
     # Initialize results dictionary
-    results = {"teams": {}, "players": {}, "schedules": {}}
+    results = {kind: {} for kind in COUNT_KINDS}
 
-    for league in leagues:
-        # Initialize result counts for this league
-        results["teams"][league] = 0
-        results["players"][league] = 0
-        results["schedules"][league] = 0
-
-        # Import teams if specified
-        if should_import_teams:
-            team_fetcher = registry.get_team_fetcher(league)
-            if team_fetcher:
-                results["teams"][league] = fetch_and_add_teams(db, league, team_fetcher)
-            else:
-                logger.warning(f"No team fetcher for: {league}")
-
-        # Import rosters if specified
-        if import_rosters:
-            player_fetcher = registry.get_player_fetcher(league)
-            if player_fetcher:
-                results["players"][league] = fetch_and_add_players(
-                    db, league, player_fetcher
-                )
-            else:
-                logger.warning(f"No player fetcher for: {league}")
-
-        # Import schedules if specified
-        if import_schedules:
-            schedule_fetcher = registry.get_schedule_fetcher(league)
-            if schedule_fetcher:
-                results["schedules"][league] = fetch_and_add_schedule(
-                    db, league, schedule_fetcher
-                )
-            else:
-                logger.warning(f"No schedule fetcher for: {league}")
+    import_one = partial(
+        import_league,
+        db,
+        should_import_teams=should_import_teams,
+        import_rosters=import_rosters,
+        import_schedules=import_schedules,
+    )
+
+    if parallel:
+        # Each league runs in its own thread; writes share one writer queue
+        with ThreadPoolExecutor(max_workers=len(leagues)) as executor:
+            league_counts = dict(zip(leagues, executor.map(import_one, leagues)))
+    else:
+        league_counts = {league: import_one(league) for league in leagues}
+    close_shared_browser_pool()
+
+    unresolved = db.team_resolver().unresolved
+    if unresolved:
+        logger.warning(f"{len(unresolved)} team names could not be resolved")
+
+    if maintain:
+        logger.info("Running post-build maintenance...")
+        db.maintain()
+
+    db.close()
+
+    for league, counts in league_counts.items():
+        for kind, count in counts.items():
+            results[kind][league] = count
 
     # Log summary
     log_build_summary(results)
@@ -353,6 +515,34 @@ def parse_arguments():
     parser.add_argument(
         "--schedules", action="store_true", help="Import match schedules"
     )
+    parser.add_argument(
+        "--maintain",
+        action="store_true",
+        help="Rebuild team aliases and run ANALYZE, vacuum, dedupe and integrity "
+        "checks after the build",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Import leagues concurrently through a single database writer",
+    )
+    parser.add_argument(
+        "--browsers",
+        type=int,
+        default=DEFAULT_DRIVERS,
+        help="Headless Chrome drivers shared by the LOVB fetchers",
+    )
+    parser.add_argument(
+        "--page-cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help="Seconds fetched LOVB pages are reused for (0 disables the cache)",
+    )
+    parser.add_argument(
+        "--reparse",
+        action="store_true",
+        help="Parse cached LOVB pages of any age instead of fetching them again",
+    )
 
     return parser.parse_args()
 
@@ -498,6 +688,10 @@ def main():
         should_import_teams=import_teams,
         import_rosters=import_rosters,
         import_schedules=import_schedules,  # Pass this parameter to build_database
+        parallel=args.parallel,
+        maintain=args.maintain,
+        browsers=args.browsers,
+        page_cache_ttl=None if args.reparse else args.page_cache_ttl,
     )
 
     # Copy to API directory if needed
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Run maintenance on an existing volleyball database.
+Refreshes planner statistics, removes duplicate rows, reclaims free pages and
+checks integrity, printing table and index sizes before and after.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Import database module
+try:
+    from vbdb_fetch import init_db
+except ImportError:
+    logger.error("Cannot import vbdb_fetch. Make sure you've installed the package.")
+    logger.error("Run 'pip install vbdb-fetch' or install it from source.")
+    sys.exit(1)
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Maintain volleyball database")
+    parser.add_argument(
+        "--db-path", default="./vbdb.db", help="Path to the database file"
+    )
+    parser.add_argument(
+        "--no-dedupe", action="store_true", help="Do not remove duplicate rows"
+    )
+    parser.add_argument(
+        "--no-vacuum", action="store_true", help="Do not reclaim free pages"
+    )
+    parser.add_argument(
+        "--full-vacuum",
+        action="store_true",
+        help="Rebuild the whole file instead of an incremental vacuum",
+    )
+    parser.add_argument(
+        "--full-integrity",
+        action="store_true",
+        help="Run integrity_check instead of the faster quick_check",
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Main function."""
+    args = parse_arguments()
+
+    if not os.path.exists(args.db_path):
+        logger.error(f"Database not found: {args.db_path}")
+        sys.exit(1)
+
+    db = init_db(args.db_path)
+    summary = db.maintain(
+        dedupe=not args.no_dedupe,
+        vacuum_db=not args.no_vacuum,
+        full_vacuum=args.full_vacuum,
+        full_integrity=args.full_integrity,
+    )
+    db.close()
+
+    if summary["integrity"] != ["ok"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
+import argparse
 import re
 import logging
 from bs4 import BeautifulSoup
-from seleniumbase import Driver
 import sys
 from pathlib import Path
 
 # Add parent directory to Python path for imports
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 from teams.fetch_lovb_teams import fetch_lovb_teams
+from vbdb_fetch.page_cache import configure_page_cache
+from vbdb_fetch.pages import check_parity, fetch_pages
 
 # Set up logging
 logging.basicConfig(
@@ -15,97 +17,118 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Present once the roster has rendered
+ROSTER_READY = "table.roster-table"
 
-def fetch_lovb_players():
+# Badges rendered inside the name cell
+UNWANTED_TERMS = ["Founding Athlete", "NEW", "-founding-athlete"]
+
+
+def parse_roster(url, html):
+    """
+    Parse the roster tables of a rendered LOVB team page
+
+    Args:
+        url: Roster page URL, kept on each row to tell the team
+        html: Page HTML
+
+    Returns:
+        list: Raw row dictionaries keyed by table heading
+    """
+    all_data = []
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Find all the tables with class 'roster-table'
+    tables = soup.find_all("table", class_="roster-table")
+
+    if not tables:  # If no tables are found, skip this URL
+        logger.warning(f"No roster table found at {url}")
+        return all_data
+
+    # Loop through each table
+    for table in tables:
+        headers = [header.text.strip() for header in table.find_all("th")]
+
+        # Extract data from each row in the table
+        for row in table.find_all("tr")[1:]:  # Skip the header row
+            columns = row.find_all("td")
+
+            if columns:
+                row_data = {}
+                row_data["url"] = url  # Store URL for team name extraction later
+
+                # Extract and clean up the player's name and number from the first column
+                player_name_column = columns[0].get_text(strip=True)
+
+                # Use regex to separate the player number from the name
+                match = re.match(r"(\d+)([A-Za-z\s]+)", player_name_column)
+                if match:
+                    player_number = match.group(1)  # The number (e.g., '1')
+                    raw_player_name = match.group(
+                        2
+                    ).strip()  # The name (e.g., 'Jordyn Poulter')
+                    player_name = re.sub(r"(?<!^)([A-Z])", r" \1", raw_player_name)
+                else:
+                    player_number = ""
+                    player_name = player_name_column
+
+                for term in UNWANTED_TERMS:
+                    player_name = player_name.replace(term, "").strip()
+                    player_name = player_name.replace("  ", " ").strip()
+
+                # Add the player number and name to the dictionary
+                row_data["Player Number"] = player_number
+                row_data["Name"] = player_name
+
+                # For each other column, map it to the corresponding header
+                for header, column in zip(headers[1:], columns[1:]):
+                    column_text = column.get_text(strip=True)
+                    row_data[header] = column_text
+
+                # Add the row's dictionary to all_data
+                all_data.append(row_data)
+
+    return all_data
+
+
+def roster_urls():
+    """Roster page URL of every LOVB team"""
+    return [team["url"] + "/roster" for team in fetch_lovb_teams()]
+
+
+def fetch_lovb_players(use_browser=True):
     """
     Fetch and process LOVB team rosters
 
+    Args:
+        use_browser: Render rosters in Chrome when the HTTP response lacks them
+
     Returns:
         list: List of player dictionaries with standardized fields
     """
     logger.info("Fetching LOVB rosters...")
 
     try:
-        teams = fetch_lovb_teams()
-        roster_urls = []
-        for team in teams:
-            roster_urls.append(team["url"] + "/roster")
+        urls = roster_urls()
 
-        if not roster_urls:
+        if not urls:
             logger.warning("No roster URLs found for LOVB teams")
             return []
 
-        driver = Driver(browser="chrome", headless=True)
+        # Server-rendered pages are read over HTTP; the rest go to Chrome
+        logger.info(f"Fetching {len(urls)} rosters")
+        pages = fetch_pages(urls, ROSTER_READY, use_browser=use_browser)
+
         all_data = []
-        unwanted_terms = ["Founding Athlete", "NEW", "-founding-athlete"]
 
-        for url in roster_urls:
+        for url, page in zip(urls, pages):
+            if page is None:
+                continue
             try:
-                logger.info(f"Fetching roster from {url}")
-                driver.get(url)  # Open the URL
-                page_source = driver.page_source
-                soup = BeautifulSoup(page_source, "html.parser")
-
-                # Find all the tables with class 'roster-table'
-                tables = soup.find_all("table", class_="roster-table")
-
-                if not tables:  # If no tables are found, skip this URL
-                    logger.warning(f"No roster table found at {url}")
-                    continue
-
-                # Loop through each table
-                for table in tables:
-                    headers = [header.text.strip() for header in table.find_all("th")]
-
-                    # Extract data from each row in the table
-                    for row in table.find_all("tr")[1:]:  # Skip the header row
-                        columns = row.find_all("td")
-
-                        if columns:
-                            row_data = {}
-                            row_data["url"] = (
-                                url  # Store URL for team name extraction later
-                            )
-
-                            # Extract and clean up the player's name and number from the first column
-                            player_name_column = columns[0].get_text(strip=True)
-
-                            # Use regex to separate the player number from the name
-                            match = re.match(r"(\d+)([A-Za-z\s]+)", player_name_column)
-                            if match:
-                                player_number = match.group(1)  # The number (e.g., '1')
-                                raw_player_name = match.group(
-                                    2
-                                ).strip()  # The name (e.g., 'Jordyn Poulter')
-                                player_name = re.sub(
-                                    r"(?<!^)([A-Z])", r" \1", raw_player_name
-                                )
-                            else:
-                                player_number = ""
-                                player_name = player_name_column
-
-                            for term in unwanted_terms:
-                                player_name = player_name.replace(term, "").strip()
-                                player_name = player_name.replace("  ", " ").strip()
-
-                            # Add the player number and name to the dictionary
-                            row_data["Player Number"] = player_number
-                            row_data["Name"] = player_name
-
-                            # For each other column, map it to the corresponding header
-                            for header, column in zip(headers[1:], columns[1:]):
-                                column_text = column.get_text(strip=True)
-                                row_data[header] = column_text
-
-                            # Add the row's dictionary to all_data
-                            all_data.append(row_data)
-
+                all_data.extend(parse_roster(url, page.html))
             except Exception as e:
                 logger.error(f"Error processing {url}: {e}")
 
-        # Clean up the driver
-        driver.quit()
-
         # Now process all the data after collecting it
         processed_data = []
         for item in all_data:
@@ -152,7 +175,6 @@ def fetch_lovb_players():
                 if item["Player Number"] != ""
                 else "Staff",
                 "profile_url": player_url,
-                "team": team_name,
                 "team_id": team_id,
                 "conference": "LOVB",
                 "level": "Pro Women",
@@ -195,7 +217,26 @@ def fetch_lovb_players():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch LOVB rosters")
+    parser.add_argument(
+        "--check-parity",
+        action="store_true",
+        help="Compare rosters parsed over HTTP with rosters rendered in Chrome",
+    )
+    parser.add_argument("--no-browser", action="store_true", help="Never launch Chrome")
+    parser.add_argument(
+        "--reparse",
+        action="store_true",
+        help="Parse cached pages of any age instead of fetching them again",
+    )
+    args = parser.parse_args()
+    if args.reparse:
+        configure_page_cache(None)
+
+    if args.check_parity:
+        sys.exit(0 if check_parity(roster_urls(), ROSTER_READY, parse_roster) else 1)
+
     # Test the function
-    players = fetch_lovb_players()
+    players = fetch_lovb_players(use_browser=not args.no_browser)
     print(f"Found {len(players)} LOVB players")
     print(players[0])
@@ -0,0 +1,336 @@
+"""
+Fetch NCAA volleyball rosters from stats.ncaa.org for the teams stored in
+the database. fetch_ncaam_players and fetch_ncaaw_players are the
+sport-specific entry points.
+"""
+
+from bs4 import BeautifulSoup
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from vbdb_fetch.crawler import DEFAULT_WORKERS, Crawler
+from vbdb_fetch.dates import ncaa_academic_year
+from vbdb_fetch.rosters import (
+    combine_rosters,
+    normalize_rosters,
+    roster_headers,
+    teams_by_id,
+)
+
+# stats.ncaa.org sport code and display name of each NCAA league
+SPORTS = {"ncaam": ("MVB", "NCAA Men's"), "ncaaw": ("WVB", "NCAA Women's")}
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def fetch_ncaa_players(db, league, max_workers=DEFAULT_WORKERS, refresh=False):
+    """
+    Fetch NCAA volleyball team rosters for the teams stored in the database
+
+    Args:
+        db (Database): The build's database; teams are read from the
+            league's teams table and resolved seasons are cached in
+            team_seasons
+        league (str): ncaam or ncaaw
+        max_workers (int): Teams fetched concurrently
+        refresh (bool): Re-resolve every team's season instead of using the
+            team_seasons cache
+
+    Returns:
+        DataFrame: Players with standardized columns
+    """
+    sport, label = SPORTS[league]
+    logger.info(f"Fetching {label} volleyball rosters...")
+
+    # Team rows keyed by team_id, streamed from the database
+    teams = teams_by_id(db.iter_teams(league))
+    team_ids = list(teams)
+
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
+    # Several teams are in flight at once; the crawler's per-host token
+    # bucket keeps the request rate to stats.ncaa.org polite
+    crawler = Crawler(headers=headers, max_workers=max_workers)
+
+    # Fetch season_id function; the history page lists the latest season first
+    def fetch_season_id(team_id):
+        url = f"https://stats.ncaa.org/teams/history/{sport}/{team_id}"
+        try:
+            res = crawler.get(url)
+            soup = BeautifulSoup(res.content, "html.parser")
+            link = soup.find("table").find("a")
+            season_id = link["href"]
+            team = soup.find("option", attrs={"value": team_id}).text
+            logger.info(f"Found Season {season_id} ({link.text.strip()}) from {team}")
+            # Cached under the year asked for, not the season's own year, so a
+            # team whose latest season is older is not looked up again until
+            # the next academic year
+            return (sport, team_id, academic_year, season_id)
+        except Exception as e:
+            logger.warning(f"Could not find season for team_id {team_id}: {e}")
+            return None
+
+    def fetch_team_roster(team_id):
+        """Fetch one team's roster table; returns (headings, rows, team) or None."""
+        # Get team data
+        team = teams[team_id]
+        team_name = team.get("name", f"Team ID: {team_id}")
+        team_short = team.get("name_short")
+
+        try:
+            # Get season_id for this team
+            season_id = season_ids.get(team_id)
+            if not season_id:
+                return None
+
+            # Build the roster URL
+            roster_url = "https://stats.ncaa.org" + season_id + "/roster"
+            logger.info(f"Fetching roster from {roster_url}")
+
+            response = crawler.get(roster_url)
+
+            if response.status_code != 200:
+                logger.warning(
+                    f"HTTP {response.status_code} error for team {team_name} (ID: {team_id})"
+                )
+                return None
+
+            soup = BeautifulSoup(response.content, "html.parser")
+
+            # Check if we need to select a specific team first
+            # If we're on a page with team selection options
+            team_selection = soup.find("select", {"name": "id"})
+            if team_selection:
+                logger.info(
+                    f"Team selection page detected, looking for team ID {team_id}"
+                )
+
+                # Find the option with our team ID
+                found_team = False
+                for option in team_selection.find_all("option"):
+                    option_team_id = option.get("value")
+                    if option_team_id == str(team_id):
+                        found_team = True
+                        team_roster_url = (
+                            f"https://stats.ncaa.org{season_id}/roster/{option_team_id}"
+                        )
+                        logger.info(
+                            f"Found team, fetching specific roster from {team_roster_url}"
+                        )
+
+                        # Get the roster page for this specific team
+                        response = crawler.get(team_roster_url)
+                        if response.status_code != 200:
+                            logger.warning(
+                                f"HTTP {response.status_code} for team roster {team_name}"
+                            )
+                            continue
+
+                        soup = BeautifulSoup(response.content, "html.parser")
+                        break
+
+                if not found_team:
+                    logger.warning(f"Team ID {team_id} not found in selection list")
+                    return None
+
+            # Find and parse roster table - try different possible table IDs
+            table = None
+            for table_id_prefix in ["roster_", "rosters_form_players"]:
+                table = soup.find(
+                    "table", {"id": lambda x: x and x.startswith(table_id_prefix)}
+                )
+                if table:
+                    break
+
+            if not table:
+                # Try a more generic approach if no table with expected ID is found
+                table = soup.find("table", {"class": "dataTable"})
+                if not table:
+                    # Look for any table that might contain a roster
+                    all_tables = soup.find_all("table")
+                    for t in all_tables:
+                        # Check if table likely contains player names
+                        if (
+                            t.find("td")
+                            and t.find("td").text
+                            and len(t.find_all("tr")) > 1
+                        ):
+                            table = t
+                            break
+
+            if not table:
+                logger.warning(
+                    f"No roster table found for team {team_name} (ID: {team_id})"
+                )
+                return None
+
+            # Make sure table has a thead
+            thead = table.find("thead")
+            if not thead:
+                # Some NCAA pages use th elements in tr instead of thead
+                header_row = table.find("tr", {"class": "heading"})
+                if header_row:
+                    thead = header_row
+                else:
+                    # Try to find the first row that might be headers
+                    first_row = table.find("tr")
+                    if first_row and first_row.find("th"):
+                        thead = first_row
+                    else:
+                        logger.warning(
+                            f"No table header found for team {team_name} (ID: {team_id})"
+                        )
+                        return None
+
+            # Extract headers
+            headers_row = []
+            for th in thead.find_all(["th", "td"]):
+                headers_row.append(th.text.strip())
+
+            # If no headers found, try to create generic ones
+            if not headers_row:
+                sample_row = table.find("tr", {"class": None})  # Non-header row
+                if sample_row:
+                    num_cells = len(sample_row.find_all(["td", "th"]))
+                    headers_row = [f"Column{i}" for i in range(num_cells)]
+
+            # Map this table's headings to roster fields once for all its rows
+            headers_row = roster_headers(headers_row)
+            headers_row.append("Player URL")  # Add a header for the player URL
+
+            # Make sure table has a tbody or equivalent
+            tbody = table.find("tbody")
+            if not tbody:
+                # If no tbody, use all rows except the first (header) row
+                tbody_rows = table.find_all("tr")[1:]
+            else:
+                tbody_rows = tbody.find_all("tr")
+
+            if not tbody_rows:
+                logger.warning(
+                    f"No player rows found for team {team_name} (ID: {team_id})"
+                )
+                return None
+
+            # Find the year
+            year = team.get("year", "")
+            if not year:
+                year_select = soup.find("select", attrs={"name": "year_id"})
+                if year_select and year_select.find("option", selected=True):
+                    year = year_select.find("option", selected=True).text.strip()
+                elif year_select and year_select.find("option"):
+                    year = year_select.find("option").text.strip()
+
+            # Extract player data
+            players = []
+            for tr in tbody_rows:
+                cells = tr.find_all(["td", "th"])
+                row_data = []
+                player_url = None
+
+                for cell in cells:
+                    # Check if the cell contains a link
+                    link = cell.find("a")
+                    if link and "href" in link.attrs:
+                        row_data.append(link.text.strip())
+                        player_url = link["href"]
+                    else:
+                        row_data.append(cell.text.strip())
+
+                # Only process rows that have data
+                if len(row_data) > 0:
+                    # Append the player URL as a separate field
+                    row_data.append(player_url)
+                    # Pad with empty strings if needed to match headers
+                    while len(row_data) < len(headers_row):
+                        row_data.append("")
+                    # Trim extra cells if needed
+                    row_data = row_data[: len(headers_row)]
+                    players.append(row_data)
+
+            # Create DataFrame for the current team - ONLY if we have players
+            if not players:
+                logger.warning(
+                    f"No players found for team {team_name} (ID: {team_id}) - skipping"
+                )
+                return None
+
+            logger.info(
+                f"Found {len(players)} players for team {team_name} (ID: {team_id})"
+            )
+            # Rows stay plain lists; combine_rosters builds the DataFrames
+            return (
+                headers_row,
+                players,
+                (team_id, year, team_name, team_short, season_id),
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing team {team_name} (ID: {team_id}): {e}")
+            return None
+
+    # A team's season changes once a year, so history pages are only fetched
+    # for teams the team_seasons cache has no entry for this academic year
+    academic_year = ncaa_academic_year()
+    season_ids = {} if refresh else db.team_seasons(sport, academic_year)
+    missing = [team_id for team_id in team_ids if team_id not in season_ids]
+    logger.info(
+        f"Team seasons: {len(team_ids) - len(missing)} cached, "
+        f"{len(missing)} to resolve"
+    )
+
+    with crawler:
+        # Resolve the missing seasons in one concurrent pass and cache them
+        resolved = [row for row in crawler.map(fetch_season_id, missing) if row]
+        if resolved:
+            db.add_team_seasons(resolved)
+        season_ids.update((team_id, season_id) for _, team_id, _, season_id in resolved)
+
+        rosters = crawler.map(fetch_team_roster, team_ids)
+    crawler.log_summary(f"{label} roster crawl")
+
+    roster_list = [roster for roster in rosters if roster is not None]
+    teams_processed = len(team_ids)
+    teams_with_players = len(roster_list)
+    teams_without_players = teams_processed - teams_with_players
+    total_players = sum(len(rows) for _, rows, _ in roster_list)
+
+    # Log summary statistics
+    logger.info(
+        f"{label} roster stats: {teams_processed} teams processed, "
+        f"{teams_with_players} teams with players, "
+        f"{teams_without_players} teams without players, "
+        f"{total_players} total players found"
+    )
+
+    # Combine all roster data
+    if not roster_list:
+        logger.warning(f"No roster data found for {label} volleyball")
+        return []
+
+    try:
+        roster_df = combine_rosters(roster_list)
+    except Exception as e:
+        logger.error(f"Error combining roster data: {e}")
+
+        # Try to identify problematic tables
+        for i, (headings, rows, team) in enumerate(roster_list):
+            logger.info(f"Table {i} for team {team[0]}: {len(rows)} rows, {headings}")
+
+        return []
+
+    players = normalize_rosters(roster_df)
+
+    logger.info(f"Fetched {len(players)} {label} volleyball players")
+    return players
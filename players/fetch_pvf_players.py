@@ -90,7 +90,6 @@ def fetch_pvf_players():
                         "height": height,
                         "player_id": player_id,
                         "hometown": hometown,
-                        "team": team.get("name", ""),
                         "conference": "PVF",
                         "level": "Pro Women",
                         "team_id": team_id,
@@ -99,6 +98,7 @@ def fetch_pvf_players():
                         "college": college,
                         "pro_experience": pro_experience,
                         "data_source": "PVF",
+                        "season_id": str(team.get("current_season_id") or ""),
                     }
 
                     players.append(player_entry)
@@ -1,10 +1,19 @@
 """Module for fetching LOVB match schedule and results."""
 
-import requests
+import argparse
 from bs4 import BeautifulSoup
 import logging
 import re
-from seleniumbase import Driver
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from vbdb_fetch.crawler import DEFAULT_WORKERS, Crawler
+from vbdb_fetch.dates import lovb_season
+from vbdb_fetch.page_cache import configure_page_cache
+from vbdb_fetch.pages import HEADERS, check_parity, fetch_pages
 
 # Set up logging
 logging.basicConfig(
@@ -12,6 +21,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SCHEDULE_URL = "https://www.lovb.com/schedule"
+
+# Week containers; present once the schedule has rendered
+SCHEDULE_READY = "div.mb-lg.grid.w-full.gap-lg"
+
 
 def fix_salt_lake_url(url):
     """Fix Salt Lake URL by adding proper hyphen"""
@@ -31,237 +45,304 @@ def fix_salt_lake_url(url):
     return url
 
 
-def fetch_lovb_schedule():
+def parse_schedule(url, html, season=None):
     """
-    Fetch LOVB schedules from their website
+    Parse the matches of a rendered LOVB schedule page
+
+    Args:
+        url: Schedule page URL
+        html: Page HTML
+        season: Season the page lists; its dates carry no year (default:
+            the season published on the current date)
 
     Returns:
-        List of dictionaries with schedule data
+        List of match dictionaries; match_id, team_stats and scoreboard are
+        left empty for resolve_match_details
     """
-    logger.info("Fetching LOVB schedules...")
+    season = season or lovb_season()
+    soup = BeautifulSoup(html, "html.parser")
 
-    url = "https://www.lovb.com/schedule"
-    driver = Driver(browser="chrome", headless=True)
+    # Find all week containers
+    week_containers = soup.find_all(
+        "div", attrs={"class": "mb-lg grid w-full gap-lg"}
+    )
 
-    try:
-        driver.get(url)
-        logger.info(f"Fetching {url}")
-
-        # Wait for the page to load completely
-        driver.sleep(2)  # Add a small delay to ensure content loads
+    all_matches = []
 
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, "html.parser")
-
-        # Find all week containers
-        week_containers = soup.find_all(
-            "div", attrs={"class": "mb-lg grid w-full gap-lg"}
+    for week_idx, week in enumerate(week_containers):
+        # Find all matches within this week
+        matches = week.find_all(
+            "div", attrs={"class": "[&>header]:first-of-type:rounded-t-md"}
         )
 
-        all_matches = []
-
-        for week_idx, week in enumerate(week_containers):
-            # Find all matches within this week
+        # If no matches found with that specific class, try another approach
+        if not matches:
             matches = week.find_all(
-                "div", attrs={"class": "[&>header]:first-of-type:rounded-t-md"}
+                "div",
+                attrs={
+                    "class": lambda x: x and "flex-1" in x and "[&>header]" in x
+                },
             )
 
-            # If no matches found with that specific class, try another approach
-            if not matches:
-                matches = week.find_all(
+        for match_idx, match in enumerate(matches):
+            try:
+                # Get date for this match
+                date_div = match.find(
                     "div",
-                    attrs={
-                        "class": lambda x: x and "flex-1" in x and "[&>header]" in x
-                    },
+                    attrs={"class": "flex items-center gap-sm text-text-secondary"},
                 )
+                date = date_div.text.strip() if date_div else "Date not found"
 
-            for match_idx, match in enumerate(matches):
-                try:
-                    # Get date for this match
-                    date_div = match.find(
-                        "div",
-                        attrs={"class": "flex items-center gap-sm text-text-secondary"},
-                    )
-                    date = date_div.text.strip() if date_div else "Date not found"
+                # Get match details link
+                match_details_link_elem = match.find(
+                    "a",
+                    attrs={"class": "link-hover flex items-center gap-sm text-xs"},
+                )
+                match_details_link = (
+                    match_details_link_elem["href"]
+                    if match_details_link_elem
+                    and match_details_link_elem.has_attr("href")
+                    else ""
+                )
 
-                    # Get match details link
-                    match_details_link_elem = match.find(
-                        "a",
-                        attrs={"class": "link-hover flex items-center gap-sm text-xs"},
-                    )
-                    match_details_link = (
-                        match_details_link_elem["href"]
-                        if match_details_link_elem
-                        and match_details_link_elem.has_attr("href")
-                        else ""
-                    )
+                # Fix Salt Lake URL if needed
+                match_details_link = fix_salt_lake_url(match_details_link)
 
-                    # Fix Salt Lake URL if needed
-                    match_details_link = fix_salt_lake_url(match_details_link)
+                # Find the section with teams and scores
+                section = match.find("section")
+                if not section:
+                    logger.warning("No section found, skipping match")
+                    continue
 
-                    # Find the section with teams and scores
-                    section = match.find("section")
-                    if not section:
-                        logger.warning("No section found, skipping match")
-                        continue
+                # Get teams
+                team_links = section.find_all(
+                    "a", class_="group link-hover flex items-center gap-sm"
+                )
 
-                    # Get teams
-                    team_links = section.find_all(
-                        "a", class_="group link-hover flex items-center gap-sm"
+                teams = []
+                for team_link in team_links:
+                    team_text_div = team_link.find(
+                        "div", class_="text-pretty text-sm"
                     )
+                    if team_text_div:
+                        team_text = team_text_div.text.strip()
+                        teams.append(team_text)
 
-                    teams = []
-                    for team_link in team_links:
-                        team_text_div = team_link.find(
-                            "div", class_="text-pretty text-sm"
-                        )
-                        if team_text_div:
-                            team_text = team_text_div.text.strip()
-                            teams.append(team_text)
+                if len(teams) < 2:
+                    logger.warning("Not enough teams found, skipping match")
+                    continue
+
+                team_1 = teams[0]
+                team_2 = teams[1]
 
-                    if len(teams) < 2:
-                        logger.warning("Not enough teams found, skipping match")
+                # Determine if this is a completed match or upcoming match
+                is_completed = False
+
+                # Get set scores
+                set_scores_divs = section.find_all(
+                    "div", class_="flex items-center gap-sm"
+                )
+
+                team_1_set_wins = "0"
+                team_2_set_wins = "0"
+                team_1_set_scores = []
+                team_2_set_scores = []
+
+                score_divs_processed = 0
+
+                for score_div in set_scores_divs:
+                    # Check if this div contains score information
+                    score_elements = score_div.find_all(
+                        "div", class_=lambda x: x and "size-4" in x
+                    )
+                    if not score_elements:
                         continue
 
-                    team_1 = teams[0]
-                    team_2 = teams[1]
+                    # We found scores, so this is a completed match
+                    is_completed = True
 
-                    # Determine if this is a completed match or upcoming match
-                    is_completed = False
+                    # Get sets won
+                    sets_won_div = score_div.find(
+                        "div", class_="text-pretty text-sm"
+                    )
+                    sets_won = sets_won_div.text.strip() if sets_won_div else "0"
+
+                    # Get individual set scores
+                    set_scores = [elem.text.strip() for elem in score_elements]
+
+                    if score_divs_processed == 0:  # First team
+                        team_1_set_wins = sets_won
+                        team_1_set_scores = set_scores
+                        score_divs_processed += 1
+                    elif score_divs_processed == 1:  # Second team
+                        team_2_set_wins = sets_won
+                        team_2_set_scores = set_scores
+                        score_divs_processed += 1
+                        break  # We have both teams' scores, no need to continue
+
+                # Format the score string
+                score_string = ""
+                if is_completed:
+                    score_parts = []
+                    for j in range(
+                        min(len(team_1_set_scores), len(team_2_set_scores))
+                    ):
+                        score_parts.append(
+                            f"{team_1_set_scores[j]}-{team_2_set_scores[j]}"
+                        )
 
-                    # Get set scores
-                    set_scores_divs = section.find_all(
-                        "div", class_="flex items-center gap-sm"
+                    score_string = f"{team_1_set_wins}-{team_2_set_wins} [{', '.join(score_parts)}]"
+
+                # Extract home and away teams
+                # In LOVB, the second team listed is typically the home team
+                home_team = team_2
+                away_team = team_1
+
+                def generate_team_id(team_name):
+                    return "-".join(team_name.lower().split())
+
+                home_team_id = generate_team_id(home_team)
+                away_team_id = generate_team_id(away_team)
+
+                # Create match object
+                match_data = {
+                    "match_id": "",
+                    "date": date,
+                    "home_team_name": home_team,
+                    "away_team_name": away_team,
+                    "score": score_string,
+                    "team_stats": "",
+                    "scoreboard": "",
+                    "match_url": "https://lovb.com" + match_details_link
+                    if match_details_link
+                    else "",
+                    "home_team_id": home_team_id + "-volleyball",
+                    "away_team_id": away_team_id + "-volleyball",
+                    "season": season,
+                }
+
+                all_matches.append(match_data)
+                logger.info(
+                    f"Match added: {match_data['away_team_name']} at {match_data['home_team_name']}"
+                    + (
+                        f", Score: {match_data['score']}"
+                        if is_completed
+                        else " (Upcoming)"
                     )
+                )
 
-                    team_1_set_wins = "0"
-                    team_2_set_wins = "0"
-                    team_1_set_scores = []
-                    team_2_set_scores = []
+            except Exception as e:
+                logger.error(f"Error processing match: {e}")
 
-                    score_divs_processed = 0
+    return all_matches
 
-                    for score_div in set_scores_divs:
-                        # Check if this div contains score information
-                        score_elements = score_div.find_all(
-                            "div", class_=lambda x: x and "size-4" in x
-                        )
-                        if not score_elements:
-                            continue
 
-                        # We found scores, so this is a completed match
-                        is_completed = True
+def resolve_match_details(crawler, match_url):
+    """
+    Find the stats iframe of a match details page
 
-                        # Get sets won
-                        sets_won_div = score_div.find(
-                            "div", class_="text-pretty text-sm"
-                        )
-                        sets_won = sets_won_div.text.strip() if sets_won_div else "0"
-
-                        # Get individual set scores
-                        set_scores = [elem.text.strip() for elem in score_elements]
-
-                        if score_divs_processed == 0:  # First team
-                            team_1_set_wins = sets_won
-                            team_1_set_scores = set_scores
-                            score_divs_processed += 1
-                        elif score_divs_processed == 1:  # Second team
-                            team_2_set_wins = sets_won
-                            team_2_set_scores = set_scores
-                            score_divs_processed += 1
-                            break  # We have both teams' scores, no need to continue
-
-                    # Format the score string
-                    score_string = ""
-                    if is_completed:
-                        score_parts = []
-                        for j in range(
-                            min(len(team_1_set_scores), len(team_2_set_scores))
-                        ):
-                            score_parts.append(
-                                f"{team_1_set_scores[j]}-{team_2_set_scores[j]}"
-                            )
-
-                        score_string = f"{team_1_set_wins}-{team_2_set_wins} [{', '.join(score_parts)}]"
-
-                    # Initialize iframe URLs
-                    match_id = ""
-                    team_stats_url = ""
-                    scoreboard_url = ""
-
-                    # Only fetch match details for completed matches with links
-                    if match_details_link:
-                        try:
-                            # Ensure the URL is properly formatted with Salt-Lake
-                            match_url = "https://lovb.com" + fix_salt_lake_url(
-                                match_details_link
-                            )
-
-                            res = requests.get(match_url)
-                            match_soup = BeautifulSoup(res.content, "html.parser")
-
-                            # Try to find the iframe
-                            iframe = match_soup.find(
-                                "iframe",
-                                attrs={
-                                    "class": "mt-2xl h-[23.3125rem] w-full sm:h-[24.3125rem] xl:h-[44.1875rem]"
-                                },
-                            )
-
-                            if iframe and iframe.has_attr("src"):
-                                iframe_src = iframe["src"]
-                                base_url = iframe_src.split("?side")[0]
-                                team_stats_url = base_url.replace(
-                                    "play-by-play", "team-stats"
-                                )
-                                scoreboard_url = base_url.replace(
-                                    "play-by-play", "scoreboard"
-                                )
-                                match_id = scoreboard_url.split("/")[-1]
-                        except Exception as e:
-                            logger.error(
-                                f"Error fetching match details for {match_details_link}: {e}"
-                            )
-
-                    # Extract home and away teams
-                    # In LOVB, the second team listed is typically the home team
-                    home_team = team_2
-                    away_team = team_1
-
-                    def generate_team_id(team_name):
-                        return "-".join(team_name.lower().split())
-
-                    home_team_id = generate_team_id(home_team)
-                    away_team_id = generate_team_id(away_team)
-
-                    # Create match object
-                    match_data = {
-                        "match_id": match_id,
-                        "date": date,
-                        "home_team_name": home_team,
-                        "away_team_name": away_team,
-                        "score": score_string,
-                        "team_stats": team_stats_url,
-                        "scoreboard": scoreboard_url,
-                        "match_url": "https://lovb.com" + match_details_link
-                        if match_details_link
-                        else "",
-                        "home_team_id": home_team_id + "-volleyball",
-                        "away_team_id": away_team_id + "-volleyball",
-                    }
-
-                    all_matches.append(match_data)
-                    logger.info(
-                        f"Match added: {match_data['away_team_name']} at {match_data['home_team_name']}"
-                        + (
-                            f", Score: {match_data['score']}"
-                            if is_completed
-                            else " (Upcoming)"
-                        )
-                    )
+    Returns:
+        (match_id, team_stats, scoreboard), or None if there is no iframe
+    """
+    res = crawler.get(match_url)
+    res.raise_for_status()
+    match_soup = BeautifulSoup(res.content, "html.parser")
+
+    # Try to find the iframe
+    iframe = match_soup.find(
+        "iframe",
+        attrs={
+            "class": "mt-2xl h-[23.3125rem] w-full sm:h-[24.3125rem] xl:h-[44.1875rem]"
+        },
+    )
+
+    if iframe and iframe.has_attr("src"):
+        iframe_src = iframe["src"]
+        base_url = iframe_src.split("?side")[0]
+        team_stats_url = base_url.replace("play-by-play", "team-stats")
+        scoreboard_url = base_url.replace("play-by-play", "scoreboard")
+        return scoreboard_url.split("/")[-1], team_stats_url, scoreboard_url
+    return None
+
+
+def add_match_details(matches, db=None, max_workers=DEFAULT_WORKERS):
+    """
+    Fill match_id, team_stats and scoreboard from each match's details page
+
+    Pages are fetched concurrently, once per URL. With a database, completed
+    matches are read from its match_details cache and stored there once
+    resolved, so they are never fetched again.
+
+    Returns:
+        Number of details pages fetched
+    """
+    cached = db.match_details("lovb") if db is not None else {}
+    pending = sorted(
+        {m["match_url"] for m in matches if m["match_url"]} - cached.keys()
+    )
+
+    resolved = {}
+    if pending:
+        logger.info(
+            f"Resolving {len(pending)} LOVB match details ({len(cached)} cached)"
+        )
+        with Crawler(HEADERS, max_workers=max_workers) as crawler:
 
+            def resolve(match_url):
+                try:
+                    return resolve_match_details(crawler, match_url)
                 except Exception as e:
-                    logger.error(f"Error processing match: {e}")
+                    logger.error(f"Error fetching match details for {match_url}: {e}")
+                    return None
+
+            resolved = dict(zip(pending, crawler.map(resolve, pending)))
+            crawler.log_summary("LOVB match details")
+
+    completed = {}
+    for match_data in matches:
+        match_url = match_data["match_url"]
+        details = cached.get(match_url) or resolved.get(match_url)
+        if not details:
+            continue
+        (
+            match_data["match_id"],
+            match_data["team_stats"],
+            match_data["scoreboard"],
+        ) = details
+        # Upcoming matches may gain an iframe later, so only results are kept
+        if match_url in resolved and match_data["score"] and details[0]:
+            completed[match_url] = ("lovb", match_url) + tuple(details)
+
+    if db is not None and completed:
+        db.add_match_details(list(completed.values()))
+    return len(pending)
+
+
+def fetch_lovb_schedule(db=None, use_browser=True, max_workers=DEFAULT_WORKERS):
+    """
+    Fetch LOVB schedules from their website
+
+    Args:
+        db: Optional Database whose match_details cache is read and updated
+        use_browser: Render the schedule in Chrome when the HTTP response
+            lacks it
+        max_workers: Concurrent match details requests
+
+    Returns:
+        List of dictionaries with schedule data
+    """
+    logger.info("Fetching LOVB schedules...")
+
+    try:
+        logger.info(f"Fetching {SCHEDULE_URL}")
+        (page,) = fetch_pages([SCHEDULE_URL], SCHEDULE_READY, use_browser=use_browser)
+        if page is None:
+            logger.error(f"Could not fetch {SCHEDULE_URL}")
+            return []
+        all_matches = parse_schedule(SCHEDULE_URL, page.html)
+
+        # Only fetch match details for matches with links
+        add_match_details(all_matches, db, max_workers)
 
         logger.info(f"Processed {len(all_matches)} LOVB matches")
         return all_matches
@@ -269,11 +350,29 @@ def fetch_lovb_schedule():
     except Exception as e:
         logger.error(f"Error in fetch_lovb_schedule: {e}")
         return []
-    finally:
-        driver.quit()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch the LOVB schedule")
+    parser.add_argument(
+        "--check-parity",
+        action="store_true",
+        help="Compare the schedule parsed over HTTP with the one rendered in Chrome",
+    )
+    parser.add_argument("--no-browser", action="store_true", help="Never launch Chrome")
+    parser.add_argument(
+        "--reparse",
+        action="store_true",
+        help="Parse cached pages of any age instead of fetching them again",
+    )
+    args = parser.parse_args()
+    if args.reparse:
+        configure_page_cache(None)
+
+    if args.check_parity:
+        ok = check_parity([SCHEDULE_URL], SCHEDULE_READY, parse_schedule)
+        sys.exit(0 if ok else 1)
+
     # For testing
-    results = fetch_lovb_schedule()
+    results = fetch_lovb_schedule(use_browser=not args.no_browser)
     print(f"Found {len(results)} matches")
@@ -0,0 +1,307 @@
+"""
+Fetch NCAA individual stats pages concurrently and parse each player's line
+into player_match_stats rows.
+"""
+
+import logging
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+# Add parent directory to Python path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from vbdb_fetch.scores import HOME_FIRST
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Define headers for requests
+headers = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Column headings on stats.ncaa.org, lowercased, to player_match_stats columns;
+# headings not listed (position, matches started, ...) are ignored
+STAT_COLUMNS = {
+    "#": "jersey",
+    "name": "name",
+    "player": "name",
+    "s": "sets_played",
+    "sp": "sets_played",
+    "kills": "kills",
+    "k": "kills",
+    "errors": "errors",
+    "e": "errors",
+    "total attacks": "total_attacks",
+    "ta": "total_attacks",
+    "hit pct": "hit_pct",
+    "pct": "hit_pct",
+    "assists": "assists",
+    "ast": "assists",
+    "aces": "aces",
+    "sa": "aces",
+    "serr": "service_errors",
+    "se": "service_errors",
+    "digs": "digs",
+    "rerr": "reception_errors",
+    "re": "reception_errors",
+    "block solos": "block_solos",
+    "bs": "block_solos",
+    "block assists": "block_assists",
+    "ba": "block_assists",
+    "berr": "block_errors",
+    "be": "block_errors",
+    "pts": "points",
+    "bhe": "ball_handling_errors",
+}
+TEXT_COLUMNS = {"jersey", "name"}
+FLOAT_COLUMNS = {"hit_pct", "points"}
+
+# Summary rows listed under the players
+SKIP_NAMES = {"team", "totals", "opponent totals"}
+
+_PLAYER_LINK = re.compile(r"/players/(\d+)")
+
+
+def make_session(max_workers=8):
+    """
+    Create a requests session whose connection pool fits max_workers threads,
+    so concurrent fetches reuse connections to stats.ncaa.org.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_number(text, column):
+    """Parse a stat cell; blank cells are None and markers like '*' or '/' vanish."""
+    cleaned = text.strip().strip("*/").replace(",", "")
+    if not cleaned or cleaned == "-":
+        return None
+    try:
+        value = float(cleaned)
+    except ValueError:
+        return None
+    return value if column in FLOAT_COLUMNS else int(value)
+
+
+def _header_columns(table):
+    """Map each column of a stats table to its player_match_stats column, or None."""
+    header = table.find("thead") or table
+    row = header.find("tr")
+    if row is None:
+        return []
+    return [
+        STAT_COLUMNS.get(" ".join(cell.get_text(" ", strip=True).lower().split()))
+        for cell in row.find_all(["th", "td"])
+    ]
+
+
+def parse_stats_table(table, columns, league, match_id, team_id):
+    """
+    Parse one team's player table.
+
+    Args:
+        table: BeautifulSoup table element
+        columns: player_match_stats column per table column, from the header
+        league: ncaam or ncaaw
+        match_id: Match the page belongs to
+        team_id: Team the table lists
+
+    Returns:
+        List of player_match_stats rows as dicts
+    """
+    body = table.find("tbody") or table
+    rows = []
+    for tr in body.find_all("tr"):
+        cells = tr.find_all("td")
+        if len(cells) != len(columns):
+            continue
+
+        row = {"league": league, "match_id": match_id, "team_id": team_id}
+        for cell, column in zip(cells, columns):
+            if column in TEXT_COLUMNS:
+                row[column] = cell.get_text(" ", strip=True).strip("*/ ")
+            elif column:
+                row[column] = parse_number(cell.get_text(), column)
+
+        name = row.get("name") or ""
+        if not name or name.lower() in SKIP_NAMES:
+            continue
+
+        # Fall back to a name slug for players without a profile link
+        link = tr.find("a", href=_PLAYER_LINK)
+        if link:
+            row["player_id"] = _PLAYER_LINK.search(link["href"]).group(1)
+        else:
+            row["player_id"] = "-".join(name.lower().replace(",", "").split())
+        rows.append(row)
+    return rows
+
+
+def parse_individual_stats(html, league, match_id, home_team_id, away_team_id):
+    """
+    Parse an NCAA individual stats page into player_match_stats rows.
+
+    The page lists one player table per team, in the same order as the box
+    score: home first for NCAAW, away first for NCAAM.
+
+    Returns:
+        List of player_match_stats rows as dicts; empty unless the page has
+        exactly the two team tables, since lines cannot be assigned to teams
+        otherwise
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    if HOME_FIRST[league]:
+        team_ids = [home_team_id, away_team_id]
+    else:
+        team_ids = [away_team_id, home_team_id]
+
+    rows = []
+    tables = []
+    for table in soup.find_all("table"):
+        columns = _header_columns(table)
+        if "name" in columns and "kills" in columns:
+            tables.append((table, columns))
+
+    if len(tables) != 2:
+        logger.warning(f"Expected 2 player tables for {league} match {match_id}, "
+                       f"found {len(tables)}; skipping it")
+        return rows
+    for (table, columns), team_id in zip(tables, team_ids):
+        rows.extend(parse_stats_table(table, columns, league, match_id, team_id))
+    return rows
+
+
+def fetch_individual_stats(matches, league, max_workers=8):
+    """
+    Fetch and parse individual stats pages concurrently over a shared session.
+
+    Args:
+        matches: Iterable of dicts with match_id, individual_stats (the page
+            URL), home_team_id and away_team_id
+        league: ncaam or ncaaw
+        max_workers: Concurrent requests
+
+    Returns:
+        (rows, empty): player_match_stats rows as dicts, and the match_ids
+        whose page was fetched but yielded no lines
+    """
+    matches = list(matches)
+    if not matches:
+        return [], []
+
+    session = make_session(max_workers)
+
+    def fetch(match):
+        try:
+            response = session.get(match["individual_stats"], timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(
+                f"Error fetching individual stats {match['individual_stats']}: {e}"
+            )
+            return None
+        return parse_individual_stats(
+            response.content,
+            league,
+            match["match_id"],
+            match["home_team_id"],
+            match["away_team_id"],
+        )
+
+    start_time = time.time()
+    rows = []
+    empty = []
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for match, match_rows in zip(matches, executor.map(fetch, matches)):
+            # Failed fetches return None and are retried on the next build
+            if match_rows is None:
+                continue
+            if not match_rows:
+                empty.append(match["match_id"])
+            rows.extend(match_rows)
+
+    elapsed = time.time() - start_time
+    logger.info(
+        f"Parsed {len(rows)} {league} player lines from {len(matches)} matches "
+        f"in {elapsed:.2f}s ({len(matches) / max(elapsed, 1e-9):.1f} pages/sec)"
+    )
+    return rows, empty
+
+
+def pending_matches(db, league):
+    """
+    Matches with an individual stats URL and no player lines stored yet,
+    leaving out completed matches whose page was already found empty.
+    """
+    cursor = db.execute(
+        f"SELECT r.match_id, r.individual_stats, r.home_team_id, r.away_team_id, "
+        f"r.status FROM {league}_results AS r "
+        f"WHERE r.individual_stats IS NOT NULL AND r.individual_stats != '' "
+        f"AND NOT EXISTS (SELECT 1 FROM player_match_stats AS s "
+        f"WHERE s.league = ? AND s.match_id = r.match_id) "
+        f"AND NOT EXISTS (SELECT 1 FROM empty_match_pages AS e "
+        f"WHERE e.league = ? AND e.page = 'individual_stats' "
+        f"AND e.match_id = r.match_id)",
+        (league, league),
+    )
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def fetch_new_individual_stats(db, league, max_workers=8):
+    """
+    Fetch individual stats for every stored match without player lines and
+    bulk-load them into player_match_stats.
+
+    Returns:
+        Number of player lines stored
+    """
+    matches = pending_matches(db, league)
+    logger.info(f"Fetching individual stats for {len(matches)} new {league} matches")
+    rows, empty = fetch_individual_stats(matches, league, max_workers)
+
+    # Pages of matches still to be played fill in later and are retried
+    completed = {m["match_id"] for m in matches if m["status"] == "completed"}
+    fetched_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    misses = [
+        (league, "individual_stats", match_id, fetched_at)
+        for match_id in empty
+        if match_id in completed
+    ]
+    if misses:
+        db.add_empty_match_pages(misses)
+        logger.info(f"Recorded {len(misses)} {league} matches without player lines")
+
+    if not rows:
+        return 0
+    return db.add_player_match_stats(rows)
+
+
+def main():
+    """Load individual stats for new matches of both NCAA leagues."""
+    from vbdb_fetch import init_db
+
+    db = init_db("./vbdb.db")
+    for league in ("ncaam", "ncaaw"):
+        count = fetch_new_individual_stats(db, league)
+        logger.info(f"Stored {count} {league} player lines")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Fetch NCAA play-by-play pages concurrently and store each match's rallies
+as a compact play_by_play row.
+"""
+
+import logging
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Add parent directory to Python path for imports
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from schedule.fetch_ncaa_individual_stats import make_session
+from vbdb_fetch.aliases import normalize_name
+from vbdb_fetch.pbp import (
+    AWAY,
+    EVENT_CODES,
+    EVENT_FIELDS,
+    HOME,
+    UNKNOWN,
+    classify_event,
+    pbp_row,
+)
+from vbdb_fetch.scores import HOME_FIRST
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+_SCORE = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+
+# Where a play description names its player: "Kill by Doe, Jane (Roe, Ann)",
+# "Doe, Jane serves", "Service ace (Doe, Jane)"
+_PLAYER_PATTERNS = [
+    re.compile(r"\bby ([^()]+?)\s*(?:\(|$)"),
+    re.compile(r"^([^()]+?) serves\b"),
+    re.compile(r"\(([^()]+)\)"),
+]
+
+
+def name_key(name):
+    """Order-free key of a player name, so "Doe, Jane" matches "Jane Doe"."""
+    return " ".join(sorted(normalize_name(name).split()))
+
+
+def player_name(text):
+    """Name of the player a play description credits, or None."""
+    for pattern in _PLAYER_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def parse_pbp(html, league, roster=None):
+    """
+    Parse an NCAA play-by-play page into event columns.
+
+    Each set is a table whose rows hold the first team's play, the running
+    score and the second team's play; the first team is home for NCAAW and
+    away for NCAAM. The serving side is taken from "serves" plays and passes
+    to whichever side wins a rally.
+
+    Args:
+        html: Page content
+        league: ncaam or ncaaw
+        roster: Optional {name_key: player_id} of the match's players, from
+            player_match_stats; other named players get a name slug
+
+    Returns:
+        (events, players): columns for vbdb_fetch.pbp.encode_events, and the
+        player_ids the player column indexes into
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    roster = roster or {}
+    # Table side (first, second) to home/away
+    sides = (HOME, AWAY) if HOME_FIRST[league] else (AWAY, HOME)
+
+    events = {field: [] for field, _ in EVENT_FIELDS}
+    players = []
+    player_index = {}
+    set_no = 0
+
+    for table in soup.find_all("table"):
+        rows = [tr.find_all("td") for tr in table.find_all("tr")]
+        rows = [cells for cells in rows if len(cells) == 3]
+        if not any(_SCORE.match(cells[1].get_text()) for cells in rows):
+            continue
+
+        set_no += 1
+        score = [0, 0]  # home, away
+        serving = UNKNOWN
+        for cells in rows:
+            first, middle, second = (cell.get_text(" ", strip=True) for cell in cells)
+            text = first or second
+            if not text:
+                continue
+            side = sides[0] if first else sides[1]
+            code = classify_event(text)
+            if code == EVENT_CODES["serve"]:
+                serving = side
+
+            player = -1
+            name = player_name(text)
+            if name:
+                player_id = roster.get(name_key(name)) or "-".join(
+                    normalize_name(name).split()
+                )
+                if player_id not in player_index:
+                    player_index[player_id] = len(players)
+                    players.append(player_id)
+                player = player_index[player_id]
+
+            events["set_no"].append(set_no)
+            events["serving"].append(serving)
+            events["event"].append(code)
+            events["player"].append(player)
+
+            parsed = _SCORE.match(middle)
+            if parsed:
+                first_score, second_score = int(parsed.group(1)), int(parsed.group(2))
+                updated = [0, 0]
+                updated[sides[0]], updated[sides[1]] = first_score, second_score
+                # The side that won the rally serves the next one
+                if updated[HOME] > score[HOME]:
+                    serving = HOME
+                elif updated[AWAY] > score[AWAY]:
+                    serving = AWAY
+                score = updated
+            events["home_score"].append(score[HOME])
+            events["away_score"].append(score[AWAY])
+
+    return events, players
+
+
+def load_rosters(db, league):
+    """{match_id: {name_key: player_id}} from the stored player match lines."""
+    rosters = {}
+    cursor = db.execute(
+        "SELECT match_id, name, player_id FROM player_match_stats WHERE league = ?",
+        (league,),
+    )
+    for match_id, name, player_id in cursor.fetchall():
+        rosters.setdefault(match_id, {})[name_key(name)] = player_id
+    return rosters
+
+
+def pending_matches(db, league):
+    """
+    Matches with a play-by-play URL and no stored play-by-play yet, leaving
+    out completed matches whose page was already found empty.
+    """
+    cursor = db.execute(
+        f"SELECT r.match_id, r.pbp, r.status FROM {league}_results AS r "
+        f"WHERE r.pbp IS NOT NULL AND r.pbp != '' "
+        f"AND NOT EXISTS (SELECT 1 FROM play_by_play AS p "
+        f"WHERE p.league = ? AND p.match_id = r.match_id) "
+        f"AND NOT EXISTS (SELECT 1 FROM empty_match_pages AS e "
+        f"WHERE e.league = ? AND e.page = 'pbp' AND e.match_id = r.match_id)",
+        (league, league),
+    )
+    return [tuple(row) for row in cursor.fetchall()]
+
+
+def fetch_new_pbp(db, league, max_workers=8):
+    """
+    Fetch play-by-play for every stored match without it, concurrently over
+    a shared session, and store one packed row per match.
+
+    Returns:
+        Number of matches stored
+    """
+    matches = pending_matches(db, league)
+    if not matches:
+        return 0
+    logger.info(f"Fetching play-by-play for {len(matches)} new {league} matches")
+    rosters = load_rosters(db, league)
+    session = make_session(max_workers)
+
+    def fetch(match):
+        """The packed row of a match, () for a page without plays, None on error."""
+        match_id, url, _ = match
+        try:
+            response = session.get(url, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Error fetching play-by-play {url}: {e}")
+            return None
+        events, players = parse_pbp(response.content, league, rosters.get(match_id))
+        if not events["event"]:
+            logger.warning(f"No plays found for {league} match {match_id}")
+            return ()
+        return pbp_row(league, match_id, events, players)
+
+    start_time = time.time()
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetched = list(executor.map(fetch, matches))
+    rows = [row for row in fetched if row]
+
+    # Pages of matches still to be played fill in later and are retried
+    fetched_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    misses = [
+        (league, "pbp", match_id, fetched_at)
+        for (match_id, _, status), row in zip(matches, fetched)
+        if row == () and status == "completed"
+    ]
+    if misses:
+        db.add_empty_match_pages(misses)
+        logger.info(f"Recorded {len(misses)} {league} matches without plays")
+
+    count = db.add_play_by_play(rows) if rows else 0
+    events = sum(row[2] for row in rows)
+    size = sum(len(row[4]) for row in rows)
+    logger.info(
+        f"Stored {events} {league} plays from {count} matches in "
+        f"{time.time() - start_time:.2f}s ({size / max(events, 1):.2f} bytes/play)"
+    )
+    return count
+
+
+def main():
+    """Load play-by-play for new matches of both NCAA leagues."""
+    from vbdb_fetch import init_db
+
+    db = init_db("./vbdb.db")
+    for league in ("ncaam", "ncaaw"):
+        fetch_new_pbp(db, league)
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 """VBDB SQLite database package for volleyball teams data."""
 
+from .concurrency import AsyncDatabase, ConcurrentDatabase
 from .db import Database
-from .schema import create_schema_file, get_schema_sql
+from .migrations import SCHEMA_VERSION, migrate
+from .schema import TABLE_COLUMNS, create_schema_file, get_schema_sql
 
 __version__ = "0.1.0"
 
@@ -24,33 +26,41 @@ def get_default_db_path() -> Path:
 
 
 # Easy function to initialize the database
-def init_db(db_path=None, in_memory=False):
+def init_db(db_path=None, in_memory=False, concurrent=False):
     """
     Initialize the database with the volleyball teams schema.
 
     Args:
         db_path: Path to the database file (None for default location)
         in_memory: If True, creates an in-memory database
+        concurrent: If True, returns a ConcurrentDatabase that can be shared
+            between threads
 
     Returns:
         Database instance
     """
+    db_class = ConcurrentDatabase if concurrent else Database
     if in_memory:
-        db = Database(None)
+        db = db_class(None)
     else:
         if db_path is None:
             db_path = get_default_db_path()
-        db = Database(db_path)
+        db = db_class(db_path)
 
     db.connect()
-    db.create_tables(schema_sql=get_schema_sql())
+    db.migrate()
     return db
 
 
 __all__ = [
+    "AsyncDatabase",
+    "ConcurrentDatabase",
     "Database",
+    "SCHEMA_VERSION",
+    "TABLE_COLUMNS",
     "create_schema_file",
     "get_schema_sql",
     "init_db",
+    "migrate",
     "get_default_db_path",
 ]
@@ -0,0 +1,228 @@
+"""Resolve the team names and ad hoc ids scrapers produce to canonical team ids."""
+
+import csv
+import logging
+import re
+import sqlite3
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+LEAGUES = ("lovb", "pvf", "ncaam", "ncaaw")
+
+# Team list shipped with the repository; orgId is the NCAA team_id
+NCAA_SCHOOLS_CSV = (
+    Path(__file__).parent.parent.parent / "data" / "ncaa_schools_imgs.csv"
+)
+
+# Where an alias came from, strongest first. Team rows are authoritative and
+# replace weaker aliases; the others only fill gaps.
+TEAM_SOURCES = ("team_id", "name", "name_short")
+SOURCES = TEAM_SOURCES + ("schools_csv", "observed")
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """
+    Reduce a team name, short name or slug to its lookup key.
+
+    "Saint Mary's (CA)", "saint-marys-ca" and "SAINT MARY'S CA" all map to
+    "saint marys ca": accents are folded, "&" reads as "and", apostrophes
+    vanish and any other run of punctuation or spaces becomes one space.
+    """
+    if not isinstance(name, str):
+        return ""
+    text = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    text = text.lower().replace("&", " and ").replace("'", "")
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def team_alias_rows(league: str, rows: Iterable[Sequence], columns: Sequence[str]):
+    """Alias rows (league, alias, team_id, source) for team table rows."""
+    positions = [(columns.index(source), source) for source in TEAM_SOURCES]
+    team_idx = columns.index("team_id")
+    for row in rows:
+        for idx, source in positions:
+            alias = normalize_name(row[idx])
+            if alias and row[team_idx]:
+                yield (league, alias, row[team_idx], source)
+
+
+class TeamResolver:
+    """
+    In-memory map from (league, normalized name) to team_id.
+
+    Names that cannot be resolved are logged the first time they are seen,
+    so a build reports each unknown team once rather than once per match.
+    """
+
+    def __init__(
+        self,
+        aliases: Dict[Tuple[str, str], str],
+        team_ids: Dict[str, Set[str]],
+    ):
+        self.aliases = aliases
+        self.team_ids = team_ids
+        self.unresolved: Set[Tuple[str, str]] = set()
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection) -> "TeamResolver":
+        """Load the team_aliases table and each league's team ids."""
+        aliases = {
+            (league, alias): team_id
+            for league, alias, team_id in conn.execute(
+                "SELECT league, alias, team_id FROM team_aliases"
+            )
+        }
+        team_ids = {
+            league: {
+                row[0] for row in conn.execute(f"SELECT team_id FROM {league}_teams")
+            }
+            for league in LEAGUES
+        }
+        return cls(aliases, team_ids)
+
+    def add(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        """Take in alias rows written to team_aliases, registering their teams."""
+        for league, alias, team_id, source in rows:
+            if source in TEAM_SOURCES:
+                self.aliases[(league, alias)] = team_id
+                self.team_ids[league].add(team_id)
+            else:
+                self.aliases.setdefault((league, alias), team_id)
+
+    def resolve(
+        self, league: str, name: Optional[str], team_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Canonical team_id for a scraped team.
+
+        Args:
+            league: League key (lovb, pvf, ncaam, ncaaw)
+            name: Team name as shown on the source page
+            team_id: Id the scraper derived, if any
+
+        Returns:
+            team_id when it names a known team, else the team the id or name
+            is an alias of, else team_id unchanged (None if empty)
+        """
+        if team_id and team_id in self.team_ids[league]:
+            return team_id
+
+        for text in (team_id, name):
+            resolved = self.aliases.get((league, normalize_name(text)))
+            if resolved:
+                return resolved
+
+        if name or team_id:
+            key = (league, name or team_id)
+            if key not in self.unresolved:
+                self.unresolved.add(key)
+                logger.warning(f"Unresolved {league} team: {key[1]!r}")
+        return team_id or None
+
+    def resolve_rows(
+        self, league: str, rows: List[tuple], columns: Sequence[str]
+    ) -> Tuple[List[tuple], List[Tuple[str, str, str, str]]]:
+        """
+        Replace the home and away team ids of results rows with canonical ids.
+
+        Returns:
+            (rows, observed): the rows with resolved ids, and alias rows for
+            names seen next to a known team that are not yet aliases
+        """
+        sides = [
+            (columns.index(f"{side}_team_id"), columns.index(f"{side}_team_name"))
+            for side in ("home", "away")
+        ]
+        resolved = []
+        observed = {}
+        for row in rows:
+            row = list(row)
+            for id_idx, name_idx in sides:
+                team_id = self.resolve(league, row[name_idx], row[id_idx])
+                row[id_idx] = team_id
+                alias = normalize_name(row[name_idx])
+                if (
+                    alias
+                    and team_id in self.team_ids[league]
+                    and (league, alias) not in self.aliases
+                ):
+                    observed[(league, alias)] = team_id
+            resolved.append(tuple(row))
+        return resolved, [
+            (league, alias, team_id, "observed")
+            for (league, alias), team_id in observed.items()
+        ]
+
+
+def _schools(schools_csv: Union[str, Path]) -> List[Tuple[str, str]]:
+    """(alias, orgId) pairs from the NCAA schools file: names and logo slugs."""
+    pairs = []
+    with open(schools_csv, newline="") as f:
+        for row in csv.DictReader(f):
+            slug = (row.get("img") or "").rsplit("/", 1)[-1].rsplit(".", 1)[0]
+            for text in (row.get("nameOfficial"), slug):
+                if normalize_name(text):
+                    pairs.append((normalize_name(text), row["orgId"]))
+    return pairs
+
+
+def build_aliases(
+    conn: sqlite3.Connection, schools_csv: Optional[Union[str, Path]] = None
+) -> int:
+    """
+    Rebuild team_aliases from the team tables, the NCAA schools file and
+    the team names observed in results next to a known team_id.
+
+    An alias claimed by two different teams from the same source is
+    ambiguous and left out, unless a stronger source settles it.
+
+    Returns:
+        Number of aliases stored
+    """
+    # (league, alias) -> {source: set of team_ids}
+    claims: Dict[Tuple[str, str], Dict[str, Set[str]]] = {}
+
+    def claim(league: str, alias: str, team_id: str, source: str) -> None:
+        if alias and team_id:
+            claims.setdefault((league, alias), {}).setdefault(source, set()).add(
+                team_id
+            )
+
+    for league in LEAGUES:
+        columns = ("team_id",) + TEAM_SOURCES[1:]
+        rows = conn.execute(f"SELECT {', '.join(columns)} FROM {league}_teams")
+        for row in team_alias_rows(league, rows, columns):
+            claim(*row)
+
+        for side in ("home", "away"):
+            observed = conn.execute(
+                f"SELECT DISTINCT r.{side}_team_name, r.{side}_team_id "
+                f"FROM {league}_results AS r JOIN {league}_teams AS t "
+                f"ON t.team_id = r.{side}_team_id"
+            )
+            for name, team_id in observed:
+                claim(league, normalize_name(name), team_id, "observed")
+
+    schools_csv = schools_csv or NCAA_SCHOOLS_CSV
+    if Path(schools_csv).exists():
+        for alias, team_id in _schools(schools_csv):
+            for league in ("ncaam", "ncaaw"):
+                claim(league, alias, team_id, "schools_csv")
+
+    rows = []
+    for (league, alias), by_source in claims.items():
+        for source in SOURCES:
+            team_ids = by_source.get(source)
+            if team_ids:
+                if len(team_ids) == 1:
+                    rows.append((league, alias, next(iter(team_ids)), source))
+                break
+
+    conn.execute("DELETE FROM team_aliases")
+    conn.executemany("INSERT INTO team_aliases VALUES (?, ?, ?, ?)", rows)
+    return len(rows)
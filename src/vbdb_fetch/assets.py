@@ -0,0 +1,80 @@
+"""
+Content-addressed storage of images that teams embed inline.
+
+A team's img is normally a URL, but LOVB logos are multi-kilobyte inline
+SVG documents. Those are stored once in the assets table under the SHA-256
+of their bytes, and the team row's img holds that id instead, so teams
+sharing a logo share one row and the teams tables stay narrow.
+"""
+
+import hashlib
+import sqlite3
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .schema import TABLE_COLUMNS, TABLE_KEYS
+
+SVG = "image/svg+xml"
+
+# Leagues whose teams table has an img column that may reference an asset
+TEAM_LEAGUES = ("lovb", "pvf", "ncaam", "ncaaw")
+
+# One assets row: asset_id, content_type, data
+AssetRow = Tuple[str, str, bytes]
+
+
+def asset_id(data: bytes) -> str:
+    """Id of an asset: the SHA-256 hex digest of its bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def inline_asset(img: Any) -> Optional[AssetRow]:
+    """The assets row of an inline SVG img value, or None for anything else."""
+    if not isinstance(img, str) or not img.lstrip().startswith("<svg"):
+        return None
+    data = img.strip().encode("utf-8")
+    return asset_id(data), SVG, data
+
+
+def split_inline_images(
+    rows: Iterable[Sequence[Any]], img_idx: int
+) -> Tuple[List[tuple], List[AssetRow]]:
+    """
+    Replace inline images in team rows with asset ids.
+
+    Returns:
+        (rows, assets): the rows with each inline img swapped for its id, and
+        one assets row per distinct image
+    """
+    out = []
+    assets = {}
+    for row in rows:
+        asset = inline_asset(row[img_idx])
+        if asset is not None:
+            assets.setdefault(asset[0], asset)
+            row = tuple(row[:img_idx]) + (asset[0],) + tuple(row[img_idx + 1 :])
+        out.append(tuple(row))
+    return out, list(assets.values())
+
+
+def assets_query() -> str:
+    """INSERT for assets rows; a known id already holds the same bytes."""
+    columns = ", ".join(TABLE_COLUMNS["assets"])
+    placeholders = ", ".join("?" for _ in TABLE_COLUMNS["assets"])
+    key = ", ".join(TABLE_KEYS["assets"])
+    return (
+        f"INSERT INTO assets ({columns}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({key}) DO NOTHING"
+    )
+
+
+def prune_assets(conn: sqlite3.Connection) -> int:
+    """Delete assets no team row refers to any more; returns how many."""
+    referenced = " UNION ".join(
+        f"SELECT img FROM {league}_teams" for league in TEAM_LEAGUES
+    )
+    cursor = conn.execute(
+        f"DELETE FROM assets WHERE asset_id NOT IN "
+        f"(SELECT img FROM ({referenced}) WHERE img IS NOT NULL)"
+    )
+    return cursor.rowcount
+
@@ -0,0 +1,237 @@
+"""
+Pool of headless Chrome drivers shared by the browser-driven fetchers.
+
+Drivers start on first use and are reused across fetchers for the rest of
+the build, so Chrome's startup is paid once per driver rather than once per
+fetcher. Pages are read as soon as a readiness selector appears instead of
+after a fixed sleep, and images, fonts and analytics are never downloaded.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, NamedTuple, Optional
+
+from .crawler import percentile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DRIVERS = 2
+PAGE_TIMEOUT = 20.0
+
+# Requests Chrome drops before they are sent; the fetchers only read the DOM
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*segment.io*", "*segment.com*", "*hotjar.com*",
+    "*clarity.ms*", "*sentry.io*",
+]
+
+
+class RenderedPage(NamedTuple):
+    """DOM of a page after rendering, and how long the render took."""
+
+    url: str
+    html: str
+    seconds: float
+    # False if the readiness selector never appeared; the DOM may be partial
+    ready: bool = True
+
+
+def new_driver(headless: bool = True) -> Any:
+    """Start a Chrome driver that blocks BLOCKED_URLS."""
+    # Imported here so the package loads without the browser stack installed
+    from seleniumbase import Driver
+
+    driver = Driver(browser="chrome", headless=headless, block_images=True)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except Exception as e:
+        logger.warning(f"Could not block requests in Chrome: {e}")
+    return driver
+
+
+def wait_for(driver: Any, selector: str, timeout: float) -> bool:
+    """Wait until a CSS selector matches; False if it timed out."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(driver, timeout).until(
+            expected_conditions.presence_of_element_located(
+                (By.CSS_SELECTOR, selector)
+            )
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+class BrowserPool:
+    """
+    Fixed number of Chrome drivers handed out one page at a time.
+
+    render() borrows an idle driver (starting one if fewer than size are
+    running), loads the page, waits for the readiness selector and returns
+    the DOM. render_many() keeps every driver busy at once.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_DRIVERS,
+        headless: bool = True,
+        page_timeout: float = PAGE_TIMEOUT,
+    ):
+        self.size = size
+        self.headless = headless
+        self.page_timeout = page_timeout
+
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._drivers: List[Any] = []
+        self._lock = threading.Lock()
+        self._timings: List[float] = []
+
+    def _acquire(self) -> Any:
+        """An idle driver, starting a new one while below size."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            start = len(self._drivers) < self.size
+            if start:
+                # Reserve the slot before the slow startup
+                self._drivers.append(None)
+        if not start:
+            return self._idle.get()
+
+        began = time.perf_counter()
+        try:
+            driver = new_driver(self.headless)
+        except Exception:
+            with self._lock:
+                self._drivers.remove(None)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+        logger.info(f"Started Chrome in {time.perf_counter() - began:.1f}s")
+        return driver
+
+    def render(
+        self, url: str, wait_for_selector: Optional[str] = None
+    ) -> RenderedPage:
+        """
+        Load a page and return its rendered DOM.
+
+        Args:
+            url: Page to load
+            wait_for_selector: CSS selector whose presence means the content
+                is rendered; without one the page is read once loaded
+
+        Returns:
+            RenderedPage; if the selector timed out its DOM is still returned,
+            with ready False
+        """
+        driver = self._acquire()
+        start = time.perf_counter()
+        try:
+            driver.get(url)
+            ready = not wait_for_selector or wait_for(
+                driver, wait_for_selector, self.page_timeout
+            )
+            if not ready:
+                logger.warning(f"Timed out waiting for {wait_for_selector} on {url}")
+            html = driver.page_source
+        finally:
+            self._idle.put(driver)
+
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self._timings.append(seconds)
+        logger.info(f"Rendered {url} in {seconds:.2f}s")
+        return RenderedPage(url, html, seconds, ready)
+
+    def render_many(
+        self, urls: Iterable[str], wait_for_selector: Optional[str] = None
+    ) -> List[Optional[RenderedPage]]:
+        """Render pages on all drivers at once; None for pages that failed."""
+
+        def render_one(url: str) -> Optional[RenderedPage]:
+            try:
+                return self.render(url, wait_for_selector)
+            except Exception as e:
+                logger.error(f"Error rendering {url}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(render_one, urls))
+
+    def log_summary(self) -> None:
+        """Log the page count and load-time percentiles so far."""
+        with self._lock:
+            timings = sorted(self._timings)
+        if timings:
+            logger.info(
+                f"Browser pool: {len(timings)} pages, "
+                f"load p50 {percentile(timings, 0.5):.2f}s, "
+                f"p90 {percentile(timings, 0.9):.2f}s, max {timings[-1]:.2f}s"
+            )
+
+    def close(self) -> None:
+        """Quit every driver."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning(f"Error quitting Chrome: {e}")
+        self._idle = queue.Queue()
+
+    def __enter__(self) -> "BrowserPool":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+_shared: Optional[BrowserPool] = None
+_shared_lock = threading.Lock()
+_shared_size = DEFAULT_DRIVERS
+
+
+def configure_browsers(size: int) -> None:
+    """Set how many drivers the shared pool runs; call before its first use."""
+    global _shared_size
+    _shared_size = size
+
+
+def shared_browser_pool() -> BrowserPool:
+    """The process-wide pool, created on first use and closed at exit."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = BrowserPool(_shared_size)
+            atexit.register(close_shared_browser_pool)
+        return _shared
+
+
+def close_shared_browser_pool() -> None:
+    """Log the shared pool's timings and quit its drivers, if it was used."""
+    global _shared
+    with _shared_lock:
+        pool, _shared = _shared, None
+    if pool is not None:
+        pool.log_summary()
+        pool.close()
@@ -0,0 +1,368 @@
+"""Thread-safe and asyncio access to the volleyball database."""
+
+import asyncio
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .db import Database
+from .migrations import migrate
+
+# Sentinel that tells the writer thread to finish
+_STOP = object()
+
+# Statements that may run on a reader connection
+_READ_STATEMENTS = ("SELECT", "WITH", "EXPLAIN")
+
+
+def _is_read(query: str) -> bool:
+    """Whether a statement only reads: a query, or a PRAGMA that sets nothing."""
+    verb = query.lstrip().split(None, 1)[0].upper()
+    return verb in _READ_STATEMENTS or (verb == "PRAGMA" and "=" not in query)
+
+_memory_ids = itertools.count()
+
+
+class _WriteOp:
+    """A unit of work queued for the writer thread."""
+
+    __slots__ = ("work", "exclusive", "future")
+
+    def __init__(self, work: Callable[[sqlite3.Connection], Any], exclusive: bool):
+        self.work = work
+        self.exclusive = exclusive
+        self.future = Future()
+
+
+class ConcurrentDatabase(Database):
+    """
+    Database handler that can be shared between threads.
+
+    Reads run on a connection owned by the calling thread. All writes are
+    queued to one writer thread, which groups the work of many producers
+    into a single transaction, so parallel fetchers never contend for the
+    SQLite write lock.
+    """
+
+    def __init__(
+        self, db_path: Optional[Union[str, Path]] = None, batch_size: int = 64
+    ):
+        """Initialize the handler; connections are opened by connect()."""
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._start_error: Optional[BaseException] = None
+        super().__init__(db_path)
+        self.batch_size = batch_size
+
+        # A named shared-cache database lets every connection see the same
+        # in-memory data
+        if db_path is None:
+            name = f"vbdb-{os.getpid()}-{next(_memory_ids)}"
+            self._uri = f"file:{name}?mode=memory&cache=shared"
+        else:
+            self._uri = None
+
+    # Connections are per thread, so expose the calling thread's reader
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        if self._writer is None:
+            return None
+        return self._reader()
+
+    @conn.setter
+    def conn(self, value) -> None:
+        pass
+
+    @property
+    def cursor(self) -> Optional[sqlite3.Cursor]:
+        return getattr(self._local, "cursor", None)
+
+    @cursor.setter
+    def cursor(self, value) -> None:
+        self._local.cursor = value
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new connection to the database."""
+        if self._uri is not None:
+            conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        else:
+            if isinstance(self.db_path, str):
+                db_dir = os.path.dirname(self.db_path)
+            else:
+                db_dir = self.db_path.parent
+
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir, exist_ok=True)
+
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get the calling thread's read connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            if self._uri is not None:
+                # Shared-cache readers would otherwise block on the writer's table locks
+                conn.execute("PRAGMA read_uncommitted = ON")
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def connect(self) -> None:
+        """Start the writer thread."""
+        if self._writer is not None:
+            return
+
+        self._writer = threading.Thread(
+            target=self._run_writer, name="vbdb-writer", daemon=True
+        )
+        self._writer.start()
+        self._started.wait()
+        if self._start_error is not None:
+            self._writer.join()
+            self._writer = None
+            error, self._start_error = self._start_error, None
+            raise error
+
+    def close(self) -> None:
+        """Flush pending writes, stop the writer thread and close all connections."""
+        if self._writer is None:
+            return
+
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._writer = None
+
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        self._local = threading.local()
+
+    def submit(
+        self, work: Callable[[sqlite3.Connection], Any], exclusive: bool = False
+    ) -> Future:
+        """
+        Queue a write callback for the writer thread.
+
+        Args:
+            work: Callable receiving the writer connection
+            exclusive: Run outside any grouped transaction (for work that
+                manages its own transactions, e.g. executescript)
+
+        Returns:
+            Future resolved with work's result once it is committed
+        """
+        if self._writer is None:
+            self.connect()
+
+        op = _WriteOp(work, exclusive)
+        self._queue.put(op)
+        return op.future
+
+    def _write(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a write callback on the writer thread and wait for its commit."""
+        return self.submit(work).result()
+
+    def flush(self) -> None:
+        """Block until every write queued so far has been committed."""
+        self.submit(lambda conn: None).result()
+
+    def execute(
+        self, query: str, params: Union[tuple, dict] = ()
+    ) -> Optional[sqlite3.Cursor]:
+        """
+        Execute an SQL query.
+
+        Reads, including PRAGMAs that set nothing, run on the calling
+        thread's connection. Any other statement is sent to the writer thread
+        and None is returned.
+        """
+        if self._writer is None:
+            self.connect()
+
+        if _is_read(query):
+            self.cursor = self._reader().execute(query, params)
+            return self.cursor
+
+        self._write(lambda conn: conn.execute(query, params))
+        return None
+
+    def executemany(self, query: str, params_list: List[Union[tuple, dict]]) -> None:
+        """Execute a write statement with multiple parameter sets on the writer thread."""
+        self._write(lambda conn: conn.executemany(query, params_list))
+
+    def commit(self) -> None:
+        """Writes are committed by the writer thread; use flush() to wait for them."""
+
+    def rollback(self) -> None:
+        """Writes roll back on the writer thread when their work raises."""
+
+    def fetchall(self) -> List[Dict[str, Any]]:
+        """Fetch the results of the calling thread's last read."""
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def _run_exclusive(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run work that manages its own transactions on the writer thread."""
+        return self.submit(work, exclusive=True).result()
+
+    def _run_writer(self) -> None:
+        """Writer thread: apply queued work in grouped transactions."""
+        conn = self._open()
+        try:
+            # A fresh file only takes auto_vacuum before its header is
+            # written, which switching to WAL does, so migrate first
+            migrate(conn)
+        except Exception as e:
+            conn.close()
+            self._start_error = e
+            self._started.set()
+            return
+
+        if self._uri is None:
+            # WAL lets the per-thread readers proceed while a batch commits
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        self._started.set()
+
+        pending = None
+        while True:
+            op = pending if pending is not None else self._queue.get()
+            pending = None
+            if op is _STOP:
+                break
+
+            if op.exclusive:
+                self._apply_exclusive(conn, op)
+                continue
+
+            # Group everything already waiting into one transaction
+            batch = [op]
+            while len(batch) < self.batch_size:
+                try:
+                    op = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if op is _STOP or op.exclusive:
+                    pending = op
+                    break
+                batch.append(op)
+
+            self._apply_batch(conn, batch)
+
+        conn.close()
+
+    def _apply_batch(self, conn: sqlite3.Connection, batch: List[_WriteOp]) -> None:
+        """Commit a batch in one transaction, isolating failures per producer."""
+        results = []
+        try:
+            conn.execute("BEGIN")
+            for op in batch:
+                results.append(op.work(conn))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            if len(batch) == 1:
+                batch[0].future.set_exception(e)
+                return
+            # Retry one at a time so a bad write only fails its own producer
+            for op in batch:
+                self._apply_batch(conn, [op])
+            return
+
+        for op, result in zip(batch, results):
+            op.future.set_result(result)
+
+    def _apply_exclusive(self, conn: sqlite3.Connection, op: _WriteOp) -> None:
+        """Run work that manages its own transactions."""
+        try:
+            result = op.work(conn)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            op.future.set_exception(e)
+            return
+
+        op.future.set_result(result)
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class AsyncDatabase:
+    """
+    asyncio facade over a ConcurrentDatabase.
+
+    Reads run in worker threads and writes await the shared writer queue,
+    so coroutines never block the event loop on SQLite.
+    """
+
+    def __init__(self, db: ConcurrentDatabase):
+        """Wrap a ConcurrentDatabase."""
+        self.db = db
+
+    async def fetch(
+        self, query: str, params: Union[tuple, dict] = ()
+    ) -> List[Dict[str, Any]]:
+        """Run a read query and return its rows as dictionaries."""
+
+        def read():
+            self.db.execute(query, params)
+            return self.db.fetchall()
+
+        return await asyncio.to_thread(read)
+
+    async def write(
+        self, work: Callable[[sqlite3.Connection], Any], exclusive: bool = False
+    ) -> Any:
+        """Queue a write callback and wait for its commit."""
+        return await asyncio.wrap_future(self.db.submit(work, exclusive))
+
+    async def flush(self) -> None:
+        """Wait until every write queued so far has been committed."""
+        await self.write(lambda conn: None)
+
+    async def close(self) -> None:
+        """Flush and close the underlying database."""
+        await asyncio.to_thread(self.db.close)
+
+    def __getattr__(self, name: str) -> Callable:
+        """Expose the Database add_* writers as coroutines."""
+        method = getattr(self.db, name)
+        if not name.startswith("add_"):
+            return method
+
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return call
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.db.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,165 @@
+"""Concurrent HTTP crawling with per-host rate limits and latency reporting."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Sustained requests per second to any one host, and how many may go out
+# back to back before the rate applies
+DEFAULT_RATE = 4.0
+DEFAULT_BURST = 4
+DEFAULT_WORKERS = 8
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: tokens refill at rate per second up to burst,
+    and each request takes one, waiting for it if the bucket is empty.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns the wait."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return waited
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Crawler:
+    """
+    requests session shared by a thread pool, rate limited per host.
+
+    Every get() waits on its host's token bucket, so politeness holds no
+    matter how many workers are in flight, and records the response latency
+    (excluding the wait) for summary().
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_workers: int = DEFAULT_WORKERS,
+        timeout: float = 30.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._latencies: List[float] = []
+        self._errors = 0
+        self._waited = 0.0
+        self._started = time.perf_counter()
+
+    def _bucket(self, url: str) -> TokenBucket:
+        """The token bucket of a URL's host, created on first use."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET a URL once its host's bucket allows; raises like requests does."""
+        waited = self._bucket(url).acquire()
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = self.session.get(url, **kwargs)
+            ok = response.status_code < 400
+            return response
+        finally:
+            latency = time.perf_counter() - start
+            with self._lock:
+                self._latencies.append(latency)
+                self._waited += waited
+                if not ok:
+                    self._errors += 1
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Run func over items on max_workers threads, returning results in order."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+
+    def summary(self) -> Dict[str, float]:
+        """Request count, errors, throughput and latency percentiles so far."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            errors, waited = self._errors, self._waited
+        elapsed = time.perf_counter() - self._started
+        return {
+            "requests": len(latencies),
+            "errors": errors,
+            "elapsed": elapsed,
+            "requests_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+            "p50": percentile(latencies, 0.50),
+            "p90": percentile(latencies, 0.90),
+            "p99": percentile(latencies, 0.99),
+            "rate_limited": waited,
+        }
+
+    def log_summary(self, label: str) -> None:
+        """Log summary() for a finished crawl."""
+        stats = self.summary()
+        logger.info(
+            f"{label}: {stats['requests']} requests ({stats['errors']} failed) in "
+            f"{stats['elapsed']:.1f}s, {stats['requests_per_sec']:.1f} req/s; "
+            f"latency p50 {stats['p50'] * 1e3:.0f} ms, "
+            f"p90 {stats['p90'] * 1e3:.0f} ms, p99 {stats['p99'] * 1e3:.0f} ms; "
+            f"{stats['rate_limited']:.1f}s waiting on rate limits"
+        )
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "Crawler":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
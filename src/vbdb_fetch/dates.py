@@ -0,0 +1,136 @@
+"""Normalize each league's match date text to sortable ISO-8601 start times."""
+
+import re
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+# Times on NCAA and LOVB pages carry no zone; both are listed in US Eastern
+LOCAL_TZ = ZoneInfo("America/New_York")
+
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "jan feb mar apr may jun jul aug sep oct nov dec".split(), start=1
+    )
+}
+_MONTH_DAY = re.compile(r"\b([A-Za-z]{3})[a-z]*\.?\s+(\d{1,2})\b")
+_CLOCK = re.compile(r"\b(\d{1,2}):(\d{2})\s*([AaPp][Mm])?")
+
+
+def _text(value) -> str:
+    """Stripped string value; None and NaN become ''."""
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _to_utc(day: date, clock: Optional[re.Match], tz) -> str:
+    """
+    Format a day, and a clock time in tz if present, as ISO-8601 UTC.
+
+    A day without a time is its local midnight, so every start time has the
+    same form and sorts before the timed matches of that day.
+    """
+    hour = minute = 0
+    if clock is not None:
+        hour, minute = int(clock.group(1)), int(clock.group(2))
+        meridiem = clock.group(3)
+        if meridiem:
+            hour = hour % 12 + (12 if meridiem.upper() == "PM" else 0)
+    local = datetime(day.year, day.month, day.day, hour, minute, tzinfo=tz)
+    return local.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@lru_cache(maxsize=4096)
+def parse_ncaa_start(day: Optional[str], clock: Optional[str]) -> Optional[str]:
+    """Parse NCAA box score "MM/DD/YYYY" dates with an optional "HH:MM" time."""
+    try:
+        parsed = datetime.strptime(_text(day), "%m/%d/%Y").date()
+    except ValueError:
+        return None
+    return _to_utc(parsed, _CLOCK.search(_text(clock)), LOCAL_TZ)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_start(value: Optional[str]) -> Optional[str]:
+    """Parse an ISO-8601 timestamp such as PVF's "2025-01-09T00:00:00.000000Z"."""
+    try:
+        parsed = datetime.fromisoformat(_text(value))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@lru_cache(maxsize=4096)
+def parse_display_start(value: Optional[str], season: Optional[str]) -> Optional[str]:
+    """
+    Parse schedule display text such as "Sat, Jan 11" or "Sat, Jan 11 7:00 PM".
+
+    The text has no year, so it is taken from the LOVB season the row was
+    scraped for: the season is played in the spring of its year, and
+    preseason dates from July on fall in the year before.
+    """
+    text = _text(value)
+    month_day = _MONTH_DAY.search(text)
+    month = _MONTHS.get(month_day.group(1).lower()) if month_day else None
+    if month is None or not _text(season).isdigit():
+        return None
+
+    year = int(season) - (1 if month >= 7 else 0)
+    try:
+        day = date(year, month, int(month_day.group(2)))
+    except ValueError:
+        # Feb 29 outside a leap year
+        return None
+    return _to_utc(day, _CLOCK.search(text[month_day.end():]), LOCAL_TZ)
+
+
+def derive_start_times(
+    league: str, rows: List[tuple], columns: Sequence[str]
+) -> List[Optional[str]]:
+    """
+    Compute the normalized start_time for results rows.
+
+    Args:
+        league: League key (lovb, pvf, ncaam, ncaaw)
+        rows: Results rows as tuples in columns order
+        columns: Column names of the rows
+
+    Returns:
+        ISO-8601 UTC timestamp per row, None where the date could not be
+        parsed
+    """
+    date_idx = columns.index("date")
+    if league in ("ncaam", "ncaaw"):
+        time_idx = columns.index("time")
+        return [parse_ncaa_start(row[date_idx], row[time_idx]) for row in rows]
+    if league == "pvf":
+        return [parse_iso_start(row[date_idx]) for row in rows]
+
+    season_idx = columns.index("season")
+    return [parse_display_start(row[date_idx], row[season_idx]) for row in rows]
+
+
+def lovb_season(today: Optional[date] = None) -> str:
+    """
+    LOVB season a schedule scraped today lists, e.g. "2026".
+
+    Seasons run from January into the spring; from July on the published
+    schedule is the next one.
+    """
+    today = today or datetime.now(LOCAL_TZ).date()
+    return str(today.year + 1 if today.month >= 7 else today.year)
+
+
+def ncaa_academic_year(today: Optional[date] = None) -> str:
+    """
+    Academic year stats.ncaa.org files a season under, e.g. "2025-26".
+
+    Both the fall women's and the spring men's season belong to the year
+    that starts in July.
+    """
+    today = today or datetime.now(LOCAL_TZ).date()
+    start = today.year if today.month >= 7 else today.year - 1
+    return f"{start}-{(start + 1) % 100:02d}"
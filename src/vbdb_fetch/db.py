@@ -2,8 +2,214 @@
 
 import os
 import sqlite3
+from itertools import chain
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .aliases import TeamResolver, build_aliases, team_alias_rows
+from .assets import assets_query, split_inline_images
+from .indexes import advise
+from .maintenance import run_maintenance
+from .migrations import migrate
+from .pbp import PlayByPlay, read_pbp
+from .ratings import rating_seasons, update_ratings
+from .rosters import name_slug
+from .search import search_names
+from .schema import (
+    MATCH_KEYS,
+    RESULT_DERIVED_COLUMNS,
+    SEASON_COLUMNS,
+    TABLE_COLUMNS,
+    TABLE_KEYS,
+)
+from .dates import derive_start_times
+from .scores import derive_scores
+from .standings import refresh_standings, touched_keys
+
+# Writer input: a pandas DataFrame, an iterable of dicts keyed by column name,
+# or an iterable of tuples already in the table's column order.
+Rows = Union[Iterable[Dict[str, Any]], Iterable[Sequence[Any]], "pandas.DataFrame"]
+
+
+def insert_query(
+    table: str, columns: Sequence[str], key: Optional[Sequence[str]] = None
+) -> str:
+    """
+    Build a positional insert statement for a table.
+
+    Tables with a natural key get an upsert that updates the existing row in
+    place; the rest use INSERT OR REPLACE.
+    """
+    placeholders = ", ".join("?" * len(columns))
+    if not key:
+        return (
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({placeholders})"
+        )
+
+    updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col not in key)
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({', '.join(key)}) DO UPDATE SET {updates}"
+    )
+
+
+def fill_keys(
+    rows: List[tuple], columns: Sequence[str], key: Sequence[str]
+) -> List[tuple]:
+    """
+    Replace missing key values so NULLs cannot slip past UNIQUE.
+
+    A missing or empty player_id falls back to the player's name slug, as
+    normalize_rosters does, so players without a profile link on one roster
+    keep a row each; other missing key parts become ''.
+    """
+    key_idx = [columns.index(col) for col in key]
+    player_idx = name_idx = None
+    if "player_id" in key and "name" in columns:
+        player_idx, name_idx = columns.index("player_id"), columns.index("name")
+
+    filled = []
+    for row in rows:
+        if any(row[i] is None or row[i] != row[i] for i in key_idx) or (
+            player_idx is not None and row[player_idx] == ""
+        ):
+            row = list(row)
+            for i in key_idx:
+                if row[i] is None or row[i] != row[i]:
+                    row[i] = ""
+            if player_idx is not None and row[player_idx] == "":
+                row[player_idx] = name_slug(row[name_idx])
+            row = tuple(row)
+        filled.append(row)
+    return filled
+
+
+def iter_rows(
+    data: Rows,
+    table_columns: Sequence[str],
+    columns: Optional[Sequence[str]] = None,
+    required: Sequence[str] = (),
+) -> Iterator[tuple]:
+    """
+    Return rows as tuples in table column order.
+
+    Args:
+        data: DataFrame, iterable of dicts, or iterable of column-ordered tuples
+        table_columns: Column order the rows are bound in
+        columns: Optional column names describing tuple input; validated
+            once against table_columns
+        required: Columns dict input must name, such as the table's key
+
+    Returns:
+        Iterator of tuples ready for positional binding
+
+    Raises:
+        ValueError: If the first dict names a column the table lacks or
+            omits a required one, or tuples have the wrong width
+    """
+    table_columns = tuple(table_columns)
+
+    # DataFrame: select the table's columns once and iterate plain tuples
+    if hasattr(data, "itertuples") and hasattr(data, "columns"):
+        missing = [col for col in table_columns if col not in data.columns]
+        if missing:
+            raise ValueError(f"DataFrame is missing columns: {missing}")
+        # Column-wise tolist() yields native Python scalars; SQLite stores NaN as NULL
+        return zip(*(data[col].tolist() for col in table_columns))
+
+    if columns is not None and tuple(columns) != table_columns:
+        raise ValueError(
+            f"Column order {tuple(columns)} does not match table spec {table_columns}"
+        )
+
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        return iter(())
+
+    # Dicts: look each column up by name (legacy record input). Checking the
+    # first row's keys catches a misspelled column, which would otherwise
+    # load as NULL, without a set comparison per row.
+    if isinstance(first, Mapping):
+        unknown = [key for key in first if key not in table_columns]
+        if unknown:
+            raise ValueError(f"Rows name columns the table lacks: {unknown}")
+        missing = [col for col in required if col not in first]
+        if missing:
+            raise ValueError(f"Rows are missing required columns: {missing}")
+        return (
+            tuple(row.get(col) for col in table_columns)
+            for row in chain((first,), rows)
+        )
+
+    # Tuples: validate the width once, then bind as-is
+    if len(first) != len(table_columns):
+        raise ValueError(
+            f"Expected {len(table_columns)} values per row, got {len(first)}"
+        )
+    return chain((tuple(first),), rows)
+
+
+def match_rows(league: str, rows: List[tuple], columns: Sequence[str]) -> List[tuple]:
+    """
+    Project a league's results rows onto the unified matches columns.
+
+    Args:
+        league: League key (lovb, pvf, ncaam, ncaaw)
+        rows: Results rows including the derived columns
+        columns: Column names of the rows
+
+    Returns:
+        Rows in TABLE_COLUMNS["matches"] order
+    """
+    position = {col: i for i, col in enumerate(columns)}
+    position["match_id"] = position[MATCH_KEYS[league]]
+    position["season"] = position[SEASON_COLUMNS[league]]
+    # Columns a league does not record (LOVB has no status or location) stay NULL
+    picks = [position.get(col) for col in TABLE_COLUMNS["matches"][1:]]
+    match_columns = TABLE_COLUMNS["matches"]
+    status_idx = match_columns.index("status")
+    winner_idx = match_columns.index("winner_team_id")
+
+    matches = []
+    for row in rows:
+        match = [league] + [None if i is None else row[i] for i in picks]
+        if "status" not in position and match[winner_idx] is not None:
+            match[status_idx] = "completed"
+        matches.append(tuple(match))
+    return matches
+
+
+def team_match_rows(matches: List[tuple]) -> List[tuple]:
+    """Split matches rows into one team_matches row per side with a known team."""
+    columns = TABLE_COLUMNS["matches"]
+    league_idx, match_idx, start_idx, home_idx, away_idx = (
+        columns.index(col)
+        for col in ("league", "match_id", "start_time", "home_team_id", "away_team_id")
+    )
+
+    rows = []
+    for match in matches:
+        home, away = match[home_idx], match[away_idx]
+        start = match[start_idx] or ""
+        if home:
+            rows.append((home, start, match[league_idx], match[match_idx], 1, away))
+        if away:
+            rows.append((away, start, match[league_idx], match[match_idx], 0, home))
+    return rows
 
 
 class Database:
@@ -14,6 +220,7 @@ class Database:
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self._resolver: Optional[TeamResolver] = None
 
     def connect(self) -> None:
         """Establish connection to the database."""
@@ -72,323 +279,473 @@ class Database:
         if self.conn:
             self.conn.rollback()
 
+    def _run_exclusive(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run work that manages its own transactions, e.g. executescript."""
+        if not self.conn:
+            self.connect()
+
+        return work(self.conn)
+
     def create_tables(
         self,
         schema_sql: Optional[str] = None,
         schema_file: Optional[Union[str, Path]] = None,
     ) -> None:
         """Create database tables from schema SQL or schema file."""
-        if not self.conn:
-            self.connect()
-
         if schema_file:
             with open(schema_file, "r") as f:
                 schema_sql = f.read()
 
         if schema_sql:
-            # Split on semicolons to execute multiple statements
-            statements = schema_sql.split(";")
-            for statement in statements:
-                if statement.strip():
-                    self.execute(statement)
-
-            self.commit()
+            self._run_exclusive(lambda conn: conn.executescript(schema_sql))
 
-    # LOVB Teams
-    def add_lovb_teams(self, teams_data: List[Dict[str, Any]]) -> int:
-        """Add multiple LOVB teams to the database."""
-        if not self.conn:
-            self.connect()
+    def migrate(self) -> int:
+        """Bring the schema up to date, returning the number of migrations applied."""
+        return self._run_exclusive(migrate)
 
-        query = """
-        INSERT OR REPLACE INTO lovb_teams 
-        (team_id, name, name_short, img, url, division, conference, conference_short, level)
-        VALUES (:team_id, :name, :name_short, :img, :url, :division, :conference, :conference_short, :level)
+    def maintain(self, **options) -> Dict[str, Any]:
         """
+        Run the post-build maintenance pass; see maintenance.run_maintenance.
 
-        self.executemany(query, teams_data)
-        self.commit()
-        return len(teams_data)
-
-    # PVF Teams
-    def add_pvf_teams(self, teams_data: List[Dict[str, Any]]) -> int:
-        """Add multiple PVF teams to the database."""
-        if not self.conn:
-            self.connect()
-
-        query = """
-        INSERT OR REPLACE INTO pvf_teams 
-        (team_id, name, name_short, img, url, division, conference, conference_short, level, 
-         current_roster_id, current_season_id)
-        VALUES (:team_id, :name, :name_short, :img, :url, :division, :conference, :conference_short, :level,
-                :current_roster_id, :current_season_id)
+        Team aliases are rebuilt first, so names observed in results and the
+        schools file settle against every team loaded since the last pass.
         """
-
-        self.executemany(query, teams_data)
-        self.commit()
-        return len(teams_data)
-
-    # NCAAM Teams
-    def add_ncaam_teams(self, teams_data: List[Dict[str, Any]]) -> int:
-        """Add multiple NCAAM teams to the database."""
+        aliases = self.rebuild_team_aliases()
+        summary = self._run_exclusive(lambda conn: run_maintenance(conn, **options))
+        summary["aliases"] = aliases
+        return summary
+
+    def advise_indexes(
+        self, queries: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Replay a query workload through the index advisor; see indexes.advise."""
+        return self._run_exclusive(lambda conn: advise(conn, queries))
+
+    def search(
+        self,
+        text: str,
+        leagues: Optional[Sequence[str]] = None,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Ranked player and team hits across leagues; see search.search_names."""
         if not self.conn:
             self.connect()
 
-        query = """
-        INSERT OR REPLACE INTO ncaam_teams 
-        (team_id, name, name_short, img, url, division, conference, conference_short, level)
-        VALUES (:team_id, :name, :name_short, :img, :url, :division, :conference, :conference_short, :level)
+        return search_names(self.conn, text, leagues, kinds, limit)
+
+    def update_ratings(
+        self,
+        league: str,
+        season: Optional[str] = None,
+        rebuild: bool = False,
+    ) -> int:
         """
+        Extend team_ratings snapshots to the latest completed match.
 
-        self.executemany(query, teams_data)
-        self.commit()
-        return len(teams_data)
+        Args:
+            league: League key (lovb, pvf, ncaam, ncaaw)
+            season: Season to rate (None for every season of the league)
+            rebuild: Replay each season from its first match day
 
-    # NCAAW Teams
-    def add_ncaaw_teams(self, teams_data: List[Dict[str, Any]]) -> int:
-        """Add multiple NCAAW teams to the database."""
-        if not self.conn:
-            self.connect()
+        Returns:
+            Number of rating dates written
+        """
 
-        query = """
-        INSERT OR REPLACE INTO ncaaw_teams 
-        (team_id, name, name_short, img, url, division, conference, conference_short, level)
-        VALUES (:team_id, :name, :name_short, :img, :url, :division, :conference, :conference_short, :level)
+        def work(conn: sqlite3.Connection) -> int:
+            seasons = rating_seasons(conn, league) if season is None else [season]
+            return sum(update_ratings(conn, league, each, rebuild) for each in seasons)
+
+        return self._write(work)
+
+    def team_resolver(self) -> TeamResolver:
+        """The name-to-team_id resolver, loaded from team_aliases on first use."""
+        if self._resolver is None:
+            if not self.conn:
+                self.connect()
+            self._resolver = TeamResolver.load(self.conn)
+        return self._resolver
+
+    def rebuild_team_aliases(
+        self, schools_csv: Optional[Union[str, Path]] = None
+    ) -> int:
+        """Rebuild team_aliases; see aliases.build_aliases."""
+        count = self._write(lambda conn: build_aliases(conn, schools_csv))
+        self._resolver = None
+        return count
+
+    def _write(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
         """
+        Run a write callback against the connection and commit it.
 
-        self.executemany(query, teams_data)
-        self.commit()
-        return len(teams_data)
+        Args:
+            work: Callable receiving the connection; all statements it runs
+                are committed together, or rolled back if it raises
 
-    # LOVB Players
-    def add_lovb_players(self, players_data: List[Dict[str, Any]]) -> int:
-        """Add multiple players to the lovb_players table."""
+        Returns:
+            Whatever work returns
+        """
         if not self.conn:
             self.connect()
 
-        # Get all existing team_ids
-        self.execute("SELECT team_id FROM lovb_teams")
-        valid_team_ids = {row["team_id"] for row in self.fetchall()}
+        try:
+            result = work(self.conn)
+        except Exception:
+            self.rollback()
+            raise
 
-        # Process players and validate team_ids
-        processed_players = []
+        self.commit()
+        return result
 
-        for player in players_data:
-            player_copy = player.copy()
+    def _insert(
+        self,
+        table: str,
+        data: Rows,
+        columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Bulk insert rows into a table, binding values positionally."""
+        table_columns = TABLE_COLUMNS[table]
+        key = TABLE_KEYS.get(table)
+        rows = list(iter_rows(data, table_columns, columns, key or ()))
+        if key:
+            rows = fill_keys(rows, table_columns, key)
+        query = insert_query(table, table_columns, key)
+
+        self._write(lambda conn: conn.executemany(query, rows))
+        return len(rows)
+
+    def _insert_teams(
+        self,
+        league: str,
+        teams_data: Rows,
+        columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Upsert teams and register their ids and names as team aliases.
 
-            # Check team_id validity
-            if player_copy["team_id"] not in valid_team_ids:
+        Inline images are stored once in assets and the rows keep their ids.
+        """
+        table = f"{league}_teams"
+        table_columns = TABLE_COLUMNS[table]
+        key = TABLE_KEYS[table]
+        rows = list(iter_rows(teams_data, table_columns, columns, key))
+        rows, asset_rows = split_inline_images(rows, table_columns.index("img"))
+        rows = fill_keys(rows, table_columns, key)
+        query = insert_query(table, table_columns, key)
+        alias_rows = list(team_alias_rows(league, rows, table_columns))
+        alias_query = insert_query(
+            "team_aliases", TABLE_COLUMNS["team_aliases"], TABLE_KEYS["team_aliases"]
+        )
+
+        def work(conn: sqlite3.Connection) -> int:
+            conn.executemany(assets_query(), asset_rows)
+            conn.executemany(query, rows)
+            conn.executemany(alias_query, alias_rows)
+            if self._resolver is not None:
+                self._resolver.add(alias_rows)
+            return len(rows)
+
+        return self._write(work)
+
+    def _insert_players(
+        self,
+        table: str,
+        teams_table: str,
+        players_data: Rows,
+        columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Bulk insert players whose team_id exists in the league's teams table."""
+        table_columns = TABLE_COLUMNS[table]
+        team_idx = table_columns.index("team_id")
+        name_idx = table_columns.index("name")
+        key = TABLE_KEYS.get(table)
+        rows = list(iter_rows(players_data, table_columns, columns, key or ()))
+        if key:
+            rows = fill_keys(rows, table_columns, key)
+        query = insert_query(table, table_columns, key)
+
+        def work(conn: sqlite3.Connection) -> int:
+            # Get all existing team_ids
+            valid_team_ids = {
+                row[0] for row in conn.execute(f"SELECT team_id FROM {teams_table}")
+            }
+
+            # Process players and validate team_ids
+            processed_players = []
+
+            for player in rows:
+                # Check team_id validity
+                if player[team_idx] not in valid_team_ids:
+                    print(
+                        f"Skipping player {player[name_idx] or 'Unknown'} - invalid team_id: {player[team_idx]}"
+                    )
+                    continue
+
+                processed_players.append(player)
+
+            if not processed_players:
                 print(
-                    f"Skipping player {player_copy.get('name', 'Unknown')} - invalid team_id: {player_copy['team_id']}"
+                    f"Warning: All {len(rows)} players skipped due to invalid team_ids"
                 )
-                continue
-
-            processed_players.append(player_copy)
+                return 0
 
-        if not processed_players:
-            print(
-                f"Warning: All {len(players_data)} players skipped due to invalid team_ids"
-            )
-            return 0
-
-        query = """
-        INSERT OR REPLACE INTO lovb_players 
-        (player_id, name, jersey, profile_url, team_id, conference, level, division, 
-        data_source, position, height, hometown)
-        VALUES (:player_id, :name, :jersey, :profile_url, :team_id, :conference, :level, 
-                :division, :data_source, :position, :height, :hometown)
-        """
-
-        self.executemany(query, processed_players)
-        self.commit()
-        return len(processed_players)
+            conn.executemany(query, processed_players)
+            return len(processed_players)
 
-    # PVF Players
-    def add_pvf_players(self, players_data: List[Dict[str, Any]]) -> int:
-        """Add multiple players to the pvf_players table."""
-        if not self.conn:
-            self.connect()
+        return self._write(work)
 
-        # Get all existing team_ids
-        self.execute("SELECT team_id FROM pvf_teams")
-        valid_team_ids = {row["team_id"] for row in self.fetchall()}
-
-        # Process players and validate team_ids
-        processed_players = []
-
-        for player in players_data:
-            player_copy = player.copy()
-
-            # Check team_id validity
-            if player_copy["team_id"] not in valid_team_ids:
-                print(
-                    f"Skipping player {player_copy.get('name', 'Unknown')} - invalid team_id: {player_copy['team_id']}"
-                )
-                continue
+    def _insert_results(
+        self,
+        league: str,
+        results_data: Rows,
+        columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Bulk insert results with their parsed set scores and start times.
 
-            processed_players.append(player_copy)
+        Team ids that are not a known team are resolved from the team names
+        through team_aliases; names newly seen next to a known team are added.
 
-        if not processed_players:
-            print(
-                f"Warning: All {len(players_data)} players skipped due to invalid team_ids"
-            )
-            return 0
-
-        query = """
-        INSERT OR REPLACE INTO pvf_players 
-        (player_id, name, jersey, profile_url, team_id, conference, level, division, 
-        data_source, position, height, hometown, college, pro_experience)
-        VALUES (:player_id, :name, :jersey, :profile_url, :team_id, :conference, :level, 
-                :division, :data_source, :position, :height, :hometown, :college, :pro_experience)
+        The unified matches row, match_sets rows and team_matches rows for
+        each result are written in the same transaction, and standings are
+        recomputed for the team-seasons those matches touch.
         """
+        table = f"{league}_results"
+        table_columns = TABLE_COLUMNS[table]
+        rows = list(
+            iter_rows(results_data, table_columns, columns, (MATCH_KEYS[league],))
+        )
+        resolver = self.team_resolver()
+        rows, observed = resolver.resolve_rows(league, rows, table_columns)
+
+        derived, set_rows = derive_scores(league, rows, table_columns)
+        starts = derive_start_times(league, rows, table_columns)
+        rows = [
+            row + extra + (start,) for row, extra, start in zip(rows, derived, starts)
+        ]
+        query = insert_query(table, table_columns + RESULT_DERIVED_COLUMNS)
+
+        key_idx = table_columns.index(MATCH_KEYS[league])
+        match_keys = [(league, row[key_idx]) for row in rows]
+        sets_query = insert_query("match_sets", TABLE_COLUMNS["match_sets"])
+
+        matches = match_rows(league, rows, table_columns + RESULT_DERIVED_COLUMNS)
+        matches_query = insert_query(
+            "matches", TABLE_COLUMNS["matches"], TABLE_KEYS["matches"]
+        )
+        team_rows = team_match_rows(matches)
+        team_query = insert_query("team_matches", TABLE_COLUMNS["team_matches"])
+
+        match_ids = [match_id for _, match_id in match_keys]
+
+        def work(conn: sqlite3.Connection) -> int:
+            # Team-seasons the matches counted towards before this load
+            touched = touched_keys(conn, league, match_ids)
+
+            conn.executemany(query, rows)
+            conn.executemany(matches_query, matches)
+            # A reloaded match may have fewer sets, or a new time or teams
+            conn.executemany(
+                "DELETE FROM match_sets WHERE league = ? AND match_id = ?", match_keys
+            )
+            conn.executemany(sets_query, set_rows)
+            conn.executemany(
+                "DELETE FROM team_matches WHERE league = ? AND match_id = ?",
+                match_keys,
+            )
+            conn.executemany(team_query, team_rows)
+            conn.executemany(
+                "INSERT OR IGNORE INTO team_aliases VALUES (?, ?, ?, ?)", observed
+            )
+            resolver.add(observed)
 
-        self.executemany(query, processed_players)
-        self.commit()
-        return len(processed_players)
+            touched |= touched_keys(conn, league, match_ids)
+            refresh_standings(conn, touched)
+            return len(rows)
 
-    # NCAAM Players
-    def add_ncaam_players(self, players_data: List[Dict[str, Any]]) -> int:
-        """Add multiple players to the ncaam_players table."""
-        if not self.conn:
-            self.connect()
+        return self._write(work)
 
-        # Get all existing team_ids
-        self.execute("SELECT team_id FROM ncaam_teams")
-        valid_team_ids = {row["team_id"] for row in self.fetchall()}
+    # LOVB Teams
+    def add_lovb_teams(
+        self, teams_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple LOVB teams to the database."""
+        return self._insert_teams("lovb", teams_data, columns)
 
-        # Process players and validate team_ids
-        processed_players = []
+    # PVF Teams
+    def add_pvf_teams(
+        self, teams_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple PVF teams to the database."""
+        return self._insert_teams("pvf", teams_data, columns)
 
-        for player in players_data:
-            player_copy = player.copy()
+    # NCAAM Teams
+    def add_ncaam_teams(
+        self, teams_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple NCAAM teams to the database."""
+        return self._insert_teams("ncaam", teams_data, columns)
 
-            # Check team_id validity
-            if player_copy["team_id"] not in valid_team_ids:
-                print(
-                    f"Skipping player {player_copy.get('name', 'Unknown')} - invalid team_id: {player_copy['team_id']}"
-                )
-                continue
+    # NCAAW Teams
+    def add_ncaaw_teams(
+        self, teams_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple NCAAW teams to the database."""
+        return self._insert_teams("ncaaw", teams_data, columns)
 
-            processed_players.append(player_copy)
+    # LOVB Players
+    def add_lovb_players(
+        self, players_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple players to the lovb_players table."""
+        return self._insert_players("lovb_players", "lovb_teams", players_data, columns)
 
-        if not processed_players:
-            print(
-                f"Warning: All {len(players_data)} players skipped due to invalid team_ids"
-            )
-            return 0
-
-        query = """
-        INSERT OR REPLACE INTO ncaam_players 
-        (player_id, name, jersey, profile_url, team_id, 
-        data_source, position, height, hometown, high_school, team, class_year,
-        team_short, year, season_id)
-        VALUES (:player_id, :name, :jersey, :profile_url, :team_id, :data_source, :position, :height, :hometown, 
-                :high_school, :team, :class_year, :team_short, :year, :season_id)
-        """
+    # PVF Players
+    def add_pvf_players(
+        self, players_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple players to the pvf_players table."""
+        return self._insert_players("pvf_players", "pvf_teams", players_data, columns)
 
-        self.executemany(query, processed_players)
-        self.commit()
-        return len(processed_players)
+    # NCAAM Players
+    def add_ncaam_players(
+        self, players_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple players to the ncaam_players table."""
+        return self._insert_players(
+            "ncaam_players", "ncaam_teams", players_data, columns
+        )
 
     # NCAAW Players
-    def add_ncaaw_players(self, players_data: List[Dict[str, Any]]) -> int:
+    def add_ncaaw_players(
+        self, players_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
         """Add multiple players to the ncaaw_players table."""
-        if not self.conn:
-            self.connect()
-
-        # Get all existing team_ids
-        self.execute("SELECT team_id FROM ncaaw_teams")
-        valid_team_ids = {row["team_id"] for row in self.fetchall()}
-
-        # Process players and validate team_ids
-        processed_players = []
-
-        for player in players_data:
-            player_copy = player.copy()
-
-            # Check team_id validity
-            if player_copy["team_id"] not in valid_team_ids:
-                print(
-                    f"Skipping player {player_copy.get('name', 'Unknown')} - invalid team_id: {player_copy['team_id']}"
-                )
-                continue
-
-            processed_players.append(player_copy)
-
-        if not processed_players:
-            print(
-                f"Warning: All {len(players_data)} players skipped due to invalid team_ids"
-            )
-            return 0
-
-        query = """
-        INSERT OR REPLACE INTO ncaaw_players 
-        (player_id, name, jersey, profile_url, team_id,
-        data_source, position, height, hometown, high_school, team, class_year,
-        team_short, year, season_id)
-        VALUES (:player_id, :name, :jersey, :profile_url, :team_id, :data_source, :position, :height, :hometown, 
-                :high_school, :team, :class_year, :team_short, :year, :season_id)
-        """
-
-        self.executemany(query, processed_players)
-        self.commit()
-        return len(processed_players)
+        return self._insert_players(
+            "ncaaw_players", "ncaaw_teams", players_data, columns
+        )
 
     # LOVB Results
-    def add_lovb_results(self, results_data: List[Dict[str, Any]]) -> int:
+    def add_lovb_results(
+        self, results_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
         """Add multiple LOVB match results to the database."""
-        if not self.conn:
-            self.connect()
-
-        query = """
-        INSERT OR REPLACE INTO lovb_results 
-        (match_id, date, home_team_name, away_team_name, score, team_stats, scoreboard, match_url, home_team_id, away_team_id)
-        VALUES (:match_id, :date, :home_team_name, :away_team_name, :score, :team_stats, :scoreboard, :match_url, :home_team_id, :away_team_id)
-        """
-
-        self.executemany(query, results_data)
-        self.commit()
-        return len(results_data)
+        return self._insert_results("lovb", results_data, columns)
 
     # PVF Results
-    def add_pvf_results(self, results_data: List[Dict[str, Any]]) -> int:
+    def add_pvf_results(
+        self, results_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
         """Add multiple PVF match results to the database."""
-        if not self.conn:
-            self.connect()
-
-        query = """
-        INSERT OR REPLACE INTO pvf_results 
-        (pvf_match_id, season_id, date, location, home_team_id, home_team_name,
-        home_team_score, away_team_id, away_team_name, away_team_score, 
-        score, team_stats, scoreboard, video, volley_station_match_id, status, title)
-        VALUES (:pvf_match_id, :season_id, :date, :location, :home_team_id, :home_team_name,
-                :home_team_score, :away_team_id, :away_team_name, :away_team_score, 
-                :score, :team_stats, :scoreboard, :video, :volley_station_match_id, :status, :title)
-        """
-
-        self.executemany(query, results_data)
-        self.commit()
-        return len(results_data)
+        return self._insert_results("pvf", results_data, columns)
 
     # NCAAM Results
-    def add_ncaam_results(self, results_data: List[Dict[str, Any]]) -> int:
+    def add_ncaam_results(
+        self, results_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
         """Add multiple NCAAM match results to the database."""
+        return self._insert_results("ncaam", results_data, columns)
+
+    # NCAAW Results
+    def add_ncaaw_results(
+        self, results_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add multiple NCAAW match results to the database."""
+        return self._insert_results("ncaaw", results_data, columns)
+
+    # Player match statistics
+    def add_player_match_stats(
+        self, stats_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add per-player match statistic lines, replacing reloaded ones."""
+        return self._insert("player_match_stats", stats_data, columns)
+
+    # Play-by-play
+    def add_play_by_play(
+        self, pbp_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add packed play-by-play rows (see pbp.pbp_row), replacing reloaded ones."""
+        return self._insert("play_by_play", pbp_data, columns)
+
+    def read_play_by_play(
+        self, league: str, match_ids: Optional[Sequence[str]] = None
+    ) -> PlayByPlay:
+        """Stored play-by-play as NumPy arrays; see pbp.read_pbp."""
         if not self.conn:
             self.connect()
 
-        query = """
-        INSERT OR REPLACE INTO ncaam_results 
-        (match_id, date, time, location, home_team_id, home_team_name,
-        away_team_id, away_team_name, score, attendance, box_score,
-        officials, pbp, individual_stats, division, division_roman, year, status)
-        VALUES (:match_id, :date, :time, :location, :home_team_id, :home_team_name,
-                :away_team_id, :away_team_name, :score, :attendance, :box_score,
-                :officials, :pbp, :individual_stats, :division, :division_roman, :year, :status)
+        return read_pbp(self.conn, league, match_ids)
+
+    def iter_teams(
+        self,
+        league: str,
+        columns: Sequence[str] = ("team_id", "name", "name_short"),
+        batch_size: int = 500,
+    ) -> Iterator[sqlite3.Row]:
         """
+        Stream a league's teams from {league}_teams.
 
-        self.executemany(query, results_data)
-        self.commit()
-        return len(results_data)
+        Rows are fetched in batches on a cursor of their own, so the shared
+        cursor stays free for other queries while the iterator is consumed.
+        """
+        table = f"{league}_teams"
+        unknown = [col for col in columns if col not in TABLE_COLUMNS[table]]
+        if unknown:
+            raise ValueError(f"Unknown {table} columns: {unknown}")
+        if not self.conn:
+            self.connect()
+
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(columns)} FROM {table} ORDER BY team_id"
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    # NCAA team season cache
+    def add_team_seasons(
+        self, seasons_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add resolved stats.ncaa.org team seasons, replacing reloaded ones."""
+        return self._insert("team_seasons", seasons_data, columns)
+
+    def team_seasons(self, sport: str, year: str) -> Dict[str, str]:
+        """Cached season_id by team_id for a sport (MVB, WVB) and academic year."""
+        cursor = self.execute(
+            "SELECT team_id, season_id FROM team_seasons WHERE sport = ? AND year = ?",
+            (sport, year),
+        )
+        return {team_id: season_id for team_id, season_id in cursor.fetchall()}
+
+    def asset(self, asset_id: str) -> Optional[Tuple[str, bytes]]:
+        """(content_type, data) of a stored asset, such as a team's img id."""
+        row = self.execute(
+            "SELECT content_type, data FROM assets WHERE asset_id = ?", (asset_id,)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def add_match_details(
+        self, details_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Add resolved match details iframes, replacing reloaded ones."""
+        return self._insert("match_details", details_data, columns)
+
+    def match_details(self, league: str) -> Dict[str, Tuple[str, str, str]]:
+        """Cached (match_id, team_stats, scoreboard) by match_url for a league."""
+        cursor = self.execute(
+            "SELECT match_url, match_id, team_stats, scoreboard FROM match_details "
+            "WHERE league = ?",
+            (league,),
+        )
+        return {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+
+    def add_empty_match_pages(
+        self, pages_data: Rows, columns: Optional[Sequence[str]] = None
+    ) -> int:
+        """Record match pages that were fetched but held no data."""
+        return self._insert("empty_match_pages", pages_data, columns)
 
     def fetchall(self):
         """Helper method to fetch results from the cursor."""
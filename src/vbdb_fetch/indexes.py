@@ -0,0 +1,403 @@
+"""Workload-driven index advisor built on EXPLAIN QUERY PLAN."""
+
+import logging
+import re
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .migrations import split_statements, table_columns
+
+logger = logging.getLogger(__name__)
+
+# Plan details that visit every row, e.g. "SCAN ncaam_results" or
+# "SCAN ncaam_results USING INDEX idx_ncaam_start" (a full walk in index order)
+_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX \w+)?$")
+_USES_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+_PARAMETER = re.compile(r"\?\d*|[:@$]\w+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_WHERE = re.compile(
+    r"\bWHERE\b(.*?)(?:\bORDER\s+BY\b|\bGROUP\s+BY\b|\bLIMIT\b|$)", re.I | re.S
+)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b(.*?)(?:\bLIMIT\b|$)", re.I | re.S)
+_COMPARED = re.compile(r"(\w+)\s*(=|==|<|>|<=|>=|\bBETWEEN\b|\bIN\b)", re.I)
+
+
+def _league_queries(league: str, match_key: str = "match_id") -> Dict[str, str]:
+    """Lookups the API runs against one league's tables."""
+    queries = {
+        f"{league}_team": f"SELECT * FROM {league}_teams WHERE team_id = :team_id",
+        f"{league}_conference_teams": (
+            f"SELECT * FROM {league}_teams WHERE conference = :conference ORDER BY name"
+        ),
+        f"{league}_roster": f"SELECT * FROM {league}_players WHERE team_id = :team_id",
+        f"{league}_player": (
+            f"SELECT * FROM {league}_players WHERE player_id = :player_id"
+        ),
+        f"{league}_match": (
+            f"SELECT * FROM {league}_results WHERE {match_key} = :match_id"
+        ),
+        # team_matches holds each team's matches in start_time order
+        f"{league}_team_results": (
+            f"SELECT r.* FROM team_matches AS tm "
+            f"JOIN {league}_results AS r ON r.{match_key} = tm.match_id "
+            f"WHERE tm.team_id = :team_id AND tm.league = '{league}' "
+            f"ORDER BY tm.start_time"
+        ),
+        f"{league}_results_between": (
+            f"SELECT * FROM {league}_results "
+            f"WHERE start_time BETWEEN :start AND :end ORDER BY start_time"
+        ),
+    }
+    if league != "lovb":
+        queries[f"{league}_recent_results"] = (
+            f"SELECT * FROM {league}_results WHERE status = :status "
+            f"ORDER BY start_time DESC LIMIT :limit"
+        )
+    return queries
+
+
+# Named queries the API serves; the default workload for the advisor
+API_QUERIES = {
+    **_league_queries("lovb"),
+    **_league_queries("pvf", match_key="pvf_match_id"),
+    **_league_queries("ncaam"),
+    **_league_queries("ncaaw"),
+    "matches_between": (
+        "SELECT * FROM matches WHERE start_time BETWEEN :start AND :end "
+        "ORDER BY start_time"
+    ),
+    "league_matches_between": (
+        "SELECT * FROM matches WHERE league = :league "
+        "AND start_time BETWEEN :start AND :end ORDER BY start_time"
+    ),
+    "team_schedule": (
+        "SELECT * FROM team_matches WHERE team_id = :team_id "
+        "AND start_time BETWEEN :start AND :end ORDER BY start_time"
+    ),
+    "head_to_head": (
+        "SELECT * FROM team_matches WHERE team_id = :team_id "
+        "AND opponent_id = :opponent_id ORDER BY start_time"
+    ),
+    "conference_standings": (
+        "SELECT * FROM standings WHERE league = :league AND season = :season "
+        "AND conference = :conference ORDER BY wins DESC"
+    ),
+    "season_ratings": (
+        "SELECT * FROM team_ratings WHERE league = :league AND season = :season "
+        "AND rating_date = (SELECT MAX(rating_date) FROM team_ratings "
+        "WHERE league = :league AND season = :season) ORDER BY elo DESC"
+    ),
+    "team_rating_history": (
+        "SELECT * FROM team_ratings WHERE team_id = :team_id AND league = :league "
+        "AND season = :season ORDER BY rating_date"
+    ),
+    "team_calendar": (
+        "SELECT m.* FROM team_matches AS tm "
+        "JOIN matches AS m ON m.league = tm.league AND m.match_id = tm.match_id "
+        "WHERE tm.team_id = :team_id ORDER BY tm.start_time"
+    ),
+}
+
+
+class IndexInfo(NamedTuple):
+    """An index and the columns it covers, in order."""
+
+    name: str
+    table: str
+    columns: Tuple[str, ...]
+    unique: bool
+    # 'c' for CREATE INDEX, 'u' for UNIQUE constraints, 'pk' for primary keys
+    origin: str
+    partial: bool
+
+
+def list_indexes(conn: sqlite3.Connection) -> List[IndexInfo]:
+    """List every index on user tables."""
+    indexes = []
+    tables = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+    for table in tables:
+        for _, name, unique, origin, partial in conn.execute(
+            f"PRAGMA index_list('{table}')"
+        ):
+            columns = tuple(
+                row[2] for row in conn.execute(f"PRAGMA index_info('{name}')")
+            )
+            indexes.append(
+                IndexInfo(name, table, columns, bool(unique), origin, bool(partial))
+            )
+    return indexes
+
+
+def redundant_indexes(indexes: List[IndexInfo]) -> Dict[str, str]:
+    """
+    Find created indexes whose columns lead another index on the same table.
+
+    A non-unique index on (a) adds nothing once (a, b) or UNIQUE (a) is
+    indexed, but still costs a B-tree update on every write.
+
+    Returns:
+        Mapping of redundant index name to the index that covers it
+    """
+    redundant = {}
+    for index in indexes:
+        if index.origin != "c" or index.partial:
+            continue
+
+        for other in indexes:
+            if (
+                other.name == index.name
+                or other.table != index.table
+                or other.partial
+                or other.name in redundant
+                or other.columns[: len(index.columns)] != index.columns
+            ):
+                continue
+            # A unique index only duplicates another unique index on the same columns
+            if index.unique and (not other.unique or other.columns != index.columns):
+                continue
+            redundant[index.name] = other.name
+            break
+
+    return redundant
+
+
+def load_query_log(path: Union[str, Path]) -> Dict[str, str]:
+    """
+    Load a recorded query log.
+
+    The log holds semicolon-terminated statements, as written by
+    record_queries(); only reads are kept and each is named by its line.
+    """
+    with open(path, "r") as f:
+        script = f.read()
+
+    queries = {}
+    for number, statement in enumerate(split_statements(script), start=1):
+        if statement.split(None, 1)[0].upper() in ("SELECT", "WITH"):
+            queries[f"log_{number}"] = statement
+    return queries
+
+
+@contextmanager
+def record_queries(conn: sqlite3.Connection, path: Union[str, Path]) -> Iterator[None]:
+    """Append every read run on a connection to a query log while active."""
+    with open(path, "a") as log:
+
+        def trace(statement: str) -> None:
+            if statement.lstrip().split(None, 1)[0].upper() in ("SELECT", "WITH"):
+                log.write(statement.rstrip("; \n") + ";\n")
+
+        conn.set_trace_callback(trace)
+        try:
+            yield
+        finally:
+            conn.set_trace_callback(None)
+
+
+def explain(conn: sqlite3.Connection, sql: str) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN details of a statement, binding NULL parameters."""
+    names = _PARAMETER.findall(_STRING.sub("''", sql))
+    if any(name[0] in ":@$" for name in names):
+        params: Union[dict, list] = {name[1:]: None for name in names}
+    else:
+        params = [None] * len(names)
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def plan_problems(details: List[str]) -> List[str]:
+    """Pick out full table scans and temporary sorts from a query plan."""
+    return [
+        detail
+        for detail in details
+        if _FULL_SCAN.match(detail) or detail.startswith("USE TEMP B-TREE")
+    ]
+
+
+def plan_cost(details: List[str]) -> int:
+    """Score a plan's problems; a full scan outweighs any number of sorts."""
+    return sum(
+        100 if _FULL_SCAN.match(detail) else 1 for detail in plan_problems(details)
+    )
+
+
+def _tables_in(sql: str) -> List[str]:
+    """Tables named after FROM or JOIN in a query."""
+    return re.findall(r"\b(?:FROM|JOIN)\s+(\w+)", sql, re.I)
+
+
+def _candidate_columns(
+    conn: sqlite3.Connection, sql: str, table: str
+) -> List[Tuple[str, ...]]:
+    """Guess index column lists for a query from its WHERE and ORDER BY clauses."""
+    known = set(table_columns(conn, table))
+    text = _STRING.sub("''", sql)
+
+    where = _WHERE.search(text)
+    filtered = []
+    ranged = []
+    for column, operator in _COMPARED.findall(where.group(1) if where else ""):
+        if column not in known or column in filtered + ranged:
+            continue
+        if operator.upper() in ("=", "==", "IN"):
+            filtered.append(column)
+        else:
+            ranged.append(column)
+
+    order = _ORDER_BY.search(text)
+    ordered = [
+        term.split()[0]
+        for term in (order.group(1).split(",") if order else [])
+        if term.split() and term.split()[0] in known
+    ]
+
+    candidates = [(column,) for column in filtered + ranged]
+    for column in filtered:
+        # Equality first, then the range or sort column, serves both
+        for tail in ranged + ordered:
+            if tail != column:
+                candidates.append((column, tail))
+    for column in ranged + ordered:
+        candidates.append((column,))
+    return list(dict.fromkeys(candidates))
+
+
+def suggest_indexes(
+    conn: sqlite3.Connection, queries: Dict[str, str]
+) -> Dict[Tuple[str, Tuple[str, ...]], List[str]]:
+    """
+    Try candidate indexes for queries with plan problems.
+
+    Each candidate is created inside a savepoint, the query is re-planned
+    and the savepoint rolled back, so nothing is written.
+
+    Returns:
+        Mapping of (table, columns) to the names of the queries it fixes
+    """
+    suggestions: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+    for name, sql in queries.items():
+        details = explain(conn, sql)
+        problems = plan_problems(details)
+        if not problems:
+            continue
+        cost = plan_cost(details)
+        tables = [m.group(1) for m in map(_FULL_SCAN.match, problems) if m]
+
+        best = None
+        for table in tables or _tables_in(sql):
+            for columns in _candidate_columns(conn, sql, table):
+                conn.execute("SAVEPOINT index_advisor")
+                try:
+                    conn.execute(
+                        f"CREATE INDEX index_advisor_candidate ON {table}"
+                        f"({', '.join(columns)})"
+                    )
+                    remaining = plan_cost(explain(conn, sql))
+                finally:
+                    conn.execute("ROLLBACK TO index_advisor")
+                    conn.execute("RELEASE index_advisor")
+
+                if remaining < cost and (best is None or remaining < best[0]):
+                    best = (remaining, table, columns)
+
+        if best is not None:
+            suggestions.setdefault(best[1:], []).append(name)
+
+    return suggestions
+
+
+def advise(
+    conn: sqlite3.Connection, queries: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Replay a workload through EXPLAIN QUERY PLAN and recommend an index set.
+
+    Args:
+        conn: Connection with no open transaction
+        queries: Named queries to analyze (defaults to API_QUERIES)
+
+    Returns:
+        Summary with each query's plan, its problems, the redundant and
+        unused indexes, suggested new indexes and the recommended set of
+        CREATE INDEX statements
+    """
+    queries = API_QUERIES if queries is None else queries
+    indexes = list_indexes(conn)
+    redundant = redundant_indexes(indexes)
+
+    plans = {}
+    used = set()
+    for name, sql in queries.items():
+        try:
+            details = explain(conn, sql)
+        except sqlite3.Error as e:
+            logger.warning(f"Skipping query {name}: {e}")
+            continue
+        plans[name] = details
+        for detail in details:
+            used.update(_USES_INDEX.findall(detail))
+
+    problems = {
+        name: plan_problems(details)
+        for name, details in plans.items()
+        if plan_problems(details)
+    }
+    suggested = suggest_indexes(conn, {name: queries[name] for name in problems})
+
+    created = [index for index in indexes if index.origin == "c"]
+    unused = [
+        index.name
+        for index in created
+        if index.name not in used and index.name not in redundant and not index.unique
+    ]
+
+    definitions = {
+        row[0]: row[1]
+        for row in conn.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND sql IS NOT NULL"
+        )
+    }
+    recommended = [
+        definitions[index.name] for index in created if index.name not in redundant
+    ]
+    for table, columns in suggested:
+        name = f"idx_{table}_{'_'.join(columns)}"
+        recommended.append(f"CREATE INDEX {name} ON {table}({', '.join(columns)})")
+
+    return {
+        "plans": plans,
+        "problems": problems,
+        "redundant": redundant,
+        "unused": unused,
+        "suggested": suggested,
+        "recommended": recommended,
+    }
+
+
+def print_advice(advice: Dict[str, Any]) -> None:
+    """Print a summary produced by advise()."""
+    print(f"\nAnalyzed {len(advice['plans'])} queries")
+
+    print(f"\nQueries with full scans or temporary sorts ({len(advice['problems'])}):")
+    for name, problems in advice["problems"].items():
+        print(f"  {name}: {'; '.join(problems)}")
+
+    print(f"\nRedundant indexes ({len(advice['redundant'])}):")
+    for name, covered_by in advice["redundant"].items():
+        print(f"  {name} (covered by {covered_by})")
+
+    print(f"\nIndexes unused by this workload ({len(advice['unused'])}):")
+    for name in advice["unused"]:
+        print(f"  {name}")
+
+    print(f"\nSuggested indexes ({len(advice['suggested'])}):")
+    for (table, columns), names in advice["suggested"].items():
+        print(f"  {table}({', '.join(columns)}) for {', '.join(names)}")
@@ -0,0 +1,203 @@
+"""Post-build maintenance: dedupe, planner statistics, vacuum and integrity checks."""
+
+import logging
+import sqlite3
+from typing import Any, Dict, List
+
+from .assets import prune_assets
+from .schema import SEARCH_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# PRAGMA auto_vacuum value for incremental mode
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def storage_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """
+    Collect file and per-object storage statistics.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Dictionary with page_size, page_count, freelist_count and a list of
+        (name, type, pages, bytes) for every table and index
+    """
+    stats = {
+        "page_size": conn.execute("PRAGMA page_size").fetchone()[0],
+        "page_count": conn.execute("PRAGMA page_count").fetchone()[0],
+        "freelist_count": conn.execute("PRAGMA freelist_count").fetchone()[0],
+        "objects": [],
+    }
+
+    try:
+        rows = conn.execute(
+            """
+            SELECT s.name, COALESCE(m.type, 'table'), COUNT(*), SUM(s.pgsize)
+            FROM dbstat AS s
+            LEFT JOIN sqlite_master AS m ON m.name = s.name
+            GROUP BY s.name
+            ORDER BY SUM(s.pgsize) DESC
+            """
+        ).fetchall()
+        stats["objects"] = [tuple(row) for row in rows]
+    except sqlite3.OperationalError:
+        # SQLite built without the dbstat virtual table
+        logger.debug("dbstat unavailable; reporting file totals only")
+
+    return stats
+
+
+def print_storage_stats(label: str, stats: Dict[str, Any]) -> None:
+    """Print storage statistics collected by storage_stats()."""
+    total = stats["page_size"] * stats["page_count"]
+    print(f"\n{label}:")
+    print(
+        f"  {stats['page_count']} pages ({total / 1024:.0f} KB), "
+        f"{stats['freelist_count']} free pages"
+    )
+    for name, obj_type, pages, size in stats["objects"]:
+        print(f"  {obj_type:<6} {name:<40} {pages:>8} pages {size / 1024:>10.1f} KB")
+
+
+def dedupe_tables(conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Remove duplicate rows from tables that have no UNIQUE key.
+
+    Rows are duplicates when every column except the INTEGER PRIMARY KEY
+    matches; the most recently inserted copy is kept.
+
+    Returns:
+        Number of rows removed per table
+    """
+    removed = {}
+    tables = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM pragma_table_list WHERE schema = 'main' AND type = 'table' "
+            "AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+
+    for table in tables:
+        has_unique_key = any(
+            row[2] for row in conn.execute(f"PRAGMA index_list('{table}')")
+        )
+        if has_unique_key:
+            continue
+
+        # Columns that make up a row's content (pk > 0 marks the rowid alias)
+        columns = [
+            row[1] for row in conn.execute(f"PRAGMA table_info('{table}')") if not row[5]
+        ]
+        if not columns:
+            continue
+
+        cursor = conn.execute(
+            f"""
+            DELETE FROM {table} WHERE rowid NOT IN (
+                SELECT MAX(rowid) FROM {table} GROUP BY {', '.join(columns)}
+            )
+            """
+        )
+        if cursor.rowcount:
+            removed[table] = cursor.rowcount
+
+    return removed
+
+
+def vacuum(conn: sqlite3.Connection, full: bool = False) -> str:
+    """
+    Reclaim free pages.
+
+    Databases not yet in incremental auto-vacuum mode are converted with a
+    one-time full VACUUM; afterwards only the free pages are released.
+
+    Returns:
+        Description of the vacuum that ran
+    """
+    mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if full or mode != AUTO_VACUUM_INCREMENTAL:
+        conn.execute(f"PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}")
+        conn.execute("VACUUM")
+        return "full"
+
+    conn.execute("PRAGMA incremental_vacuum")
+    return "incremental"
+
+
+def integrity_check(conn: sqlite3.Connection, full: bool = False) -> List[str]:
+    """Run a quick (or full) integrity check and return its messages."""
+    pragma = "integrity_check" if full else "quick_check"
+    return [row[0] for row in conn.execute(f"PRAGMA {pragma}")]
+
+
+def run_maintenance(
+    conn: sqlite3.Connection,
+    dedupe: bool = True,
+    vacuum_db: bool = True,
+    full_vacuum: bool = False,
+    full_integrity: bool = False,
+    verbose: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run the post-build maintenance pass.
+
+    Args:
+        conn: Database connection with no open transaction
+        dedupe: Remove duplicate rows from tables without a UNIQUE key
+        vacuum_db: Reclaim free pages
+        full_vacuum: Rebuild the whole file instead of an incremental vacuum
+        full_integrity: Run integrity_check instead of quick_check
+        verbose: Print storage statistics before and after
+
+    Returns:
+        Summary with rows removed, vacuum mode, integrity messages and the
+        before/after storage statistics
+    """
+    before = storage_stats(conn)
+    if verbose:
+        print_storage_stats("Before maintenance", before)
+
+    removed = {}
+    if dedupe:
+        removed = dedupe_tables(conn)
+        conn.commit()
+        for table, count in removed.items():
+            logger.info(f"Removed {count} duplicate rows from {table}")
+
+        # Logos replaced since the last build leave their old asset behind
+        pruned = prune_assets(conn)
+        conn.commit()
+        if pruned:
+            removed["assets"] = pruned
+            logger.info(f"Removed {pruned} unreferenced assets")
+
+    # Refresh sqlite_stat1 for the query planner
+    conn.execute("ANALYZE")
+    conn.execute("PRAGMA optimize")
+
+    # Merge the segments trigger-maintained search indexes accumulate
+    for table in SEARCH_COLUMNS:
+        conn.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('optimize')")
+    conn.commit()
+
+    vacuum_mode = vacuum(conn, full_vacuum) if vacuum_db else None
+
+    integrity = integrity_check(conn, full_integrity)
+    if integrity != ["ok"]:
+        logger.error(f"Integrity check reported problems: {integrity}")
+
+    after = storage_stats(conn)
+    if verbose:
+        print_storage_stats("After maintenance", after)
+        print(f"\nIntegrity: {', '.join(integrity)}")
+
+    return {
+        "removed": removed,
+        "vacuum": vacuum_mode,
+        "integrity": integrity,
+        "before": before,
+        "after": after,
+    }
@@ -0,0 +1,978 @@
+"""Versioned schema migrations keyed on SQLite's PRAGMA user_version."""
+
+import logging
+import sqlite3
+from typing import Callable, Iterator, List, NamedTuple, Tuple, Union
+
+from .aliases import build_aliases
+from .assets import split_inline_images
+from .dates import derive_start_times
+from .scores import derive_scores
+from .schema import get_schema_sql
+from .standings import rebuild_standings
+
+logger = logging.getLogger(__name__)
+
+# A step is an SQL script or a callable that receives the connection
+Step = Union[str, Callable[[sqlite3.Connection], None]]
+
+
+class Migration(NamedTuple):
+    """A schema change applied in one transaction."""
+
+    version: int
+    description: str
+    steps: Tuple[Step, ...] = ()
+
+
+def split_statements(script: str) -> Iterator[str]:
+    """
+    Split an SQL script into complete statements.
+
+    Unlike splitting on every semicolon, this keeps trigger bodies and
+    string literals containing semicolons intact.
+    """
+    statement = ""
+    for part in script.split(";"):
+        statement += part + ";"
+        if sqlite3.complete_statement(statement):
+            if statement.strip(" \t\r\n;"):
+                yield statement.strip()
+            statement = ""
+
+
+def table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check whether a table exists."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    """Get the column names of a table."""
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def add_column(conn: sqlite3.Connection, table: str, column: str, decl: str) -> None:
+    """Add a column in place unless it already exists."""
+    if column not in table_columns(conn, table):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def rebuild_table(
+    conn: sqlite3.Connection, table: str, schema_sql: str, select_sql: str
+) -> None:
+    """
+    Recreate a table from its current schema and copy rows across.
+
+    Args:
+        conn: Connection inside the migration transaction
+        table: Table to rebuild
+        schema_sql: CREATE TABLE/INDEX script for the new shape
+        select_sql: "(col, ...) SELECT ... FROM {old} ..." copying rows
+            from the renamed table, referenced as {old}
+    """
+    # Index names are global, so drop them before recreating them on the new table
+    indexes = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+        "AND sql IS NOT NULL",
+        (table,),
+    ).fetchall()
+    for (index,) in indexes:
+        conn.execute(f"DROP INDEX {index}")
+
+    conn.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    for statement in split_statements(schema_sql):
+        conn.execute(statement)
+    conn.execute(f"INSERT INTO {table} {select_sql.format(old=f'{table}_old')}")
+    conn.execute(f"DROP TABLE {table}_old")
+
+
+# ========================
+# Migration Steps
+# ========================
+#
+# Each step carries the DDL and column lists of the schema it migrates to,
+# frozen when the migration was added. The live definitions in schema.py
+# describe the newest version only; a migration that read them would build
+# later columns and indexes early, and change what an applied migration
+# does whenever the schema moves on.
+#
+# Only the DDL is frozen. Steps that fill new columns or tables from old
+# rows call the live helpers: derive_scores, derive_start_times,
+# rebuild_standings, build_aliases and split_inline_images. A change to
+# what one of those returns for existing rows also changes every pending
+# migration that calls it, so such a change needs a migration of its own
+# that rewrites the affected rows, as migration 18 does for start times.
+
+
+# ncaaw_results as of migration 2
+_NCAAW_RESULTS_V2 = """
+CREATE TABLE IF NOT EXISTS ncaaw_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id TEXT UNIQUE NOT NULL,
+    date TEXT,
+    time TEXT,
+    location TEXT,
+    home_team_id TEXT,
+    home_team_name TEXT,
+    away_team_id TEXT,
+    away_team_name TEXT,
+    score TEXT,
+    attendance TEXT,
+    box_score TEXT,
+    officials TEXT,
+    pbp TEXT,
+    individual_stats TEXT,
+    division TEXT,
+    division_roman TEXT,
+    year TEXT,
+    status TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_ncaaw_teams ON ncaaw_results(home_team_id, away_team_id);
+CREATE INDEX IF NOT EXISTS idx_ncaaw_date ON ncaaw_results(date);
+CREATE INDEX IF NOT EXISTS idx_ncaaw_status ON ncaaw_results(status);
+"""
+
+_NCAAW_RESULTS_COLUMNS_V2 = (
+    "match_id, date, time, location, home_team_id, home_team_name, away_team_id, "
+    "away_team_name, score, attendance, box_score, officials, pbp, "
+    "individual_stats, division, division_roman, year, status"
+)
+
+
+def _rebuild_ncaaw_results(conn: sqlite3.Connection) -> None:
+    """Move ncaaw_results written by insert_ncaaw_results.py onto the keyed schema."""
+    legacy = table_exists(conn, "ncaaw_results") and "id" not in table_columns(
+        conn, "ncaaw_results"
+    )
+    if legacy:
+        conn.execute("ALTER TABLE ncaaw_results RENAME TO ncaaw_results_legacy")
+
+    for statement in split_statements(_NCAAW_RESULTS_V2):
+        conn.execute(statement)
+
+    if legacy:
+        columns = _NCAAW_RESULTS_COLUMNS_V2
+        # Keep the last copy of each match; rows without a match_id cannot be keyed
+        conn.execute(
+            f"""
+            INSERT INTO ncaaw_results ({columns})
+            SELECT {columns} FROM ncaaw_results_legacy
+            WHERE rowid IN (
+                SELECT MAX(rowid) FROM ncaaw_results_legacy
+                WHERE match_id IS NOT NULL AND match_id != ''
+                GROUP BY match_id
+            )
+            """
+        )
+        conn.execute("DROP TABLE ncaaw_results_legacy")
+
+
+# Player tables as of migration 3
+_NCAA_PLAYERS_V3 = """
+CREATE TABLE IF NOT EXISTS {table}(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player_id TEXT,
+    name TEXT,
+    jersey TEXT,
+    profile_url TEXT,
+    team_id TEXT,
+    data_source TEXT,
+    position TEXT,
+    height TEXT,
+    hometown TEXT,
+    high_school TEXT,
+    team TEXT,
+    class_year TEXT,
+    team_short TEXT,
+    year TEXT,
+    season_id TEXT,
+    UNIQUE (player_id, team_id, season_id),
+    FOREIGN KEY (team_id) REFERENCES {league}_teams(team_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_{league}_player_id ON {table}(player_id);
+CREATE INDEX IF NOT EXISTS idx_{league}_player_team_id ON {table}(team_id);
+"""
+
+_PVF_PLAYERS_V3 = """
+CREATE TABLE IF NOT EXISTS pvf_players(
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player_id TEXT,
+    name TEXT,
+    jersey TEXT,
+    profile_url TEXT,
+    team_id TEXT,
+    conference TEXT,
+    level TEXT,
+    division TEXT,
+    data_source TEXT,
+    position TEXT,
+    height TEXT,
+    hometown TEXT,
+    college TEXT,
+    pro_experience TEXT,
+    season_id TEXT,
+    UNIQUE (player_id, team_id, season_id),
+    FOREIGN KEY (team_id) REFERENCES pvf_teams(team_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_pvf_player_id ON pvf_players(player_id);
+CREATE INDEX IF NOT EXISTS idx_pvf_player_team_id ON pvf_players(team_id);
+CREATE INDEX IF NOT EXISTS idx_pvf_player_conference ON pvf_players(conference);
+CREATE INDEX IF NOT EXISTS idx_pvf_player_level ON pvf_players(level);
+CREATE INDEX IF NOT EXISTS idx_pvf_player_division ON pvf_players(division);
+"""
+
+# Non-key columns of each player table as of migration 3
+_NCAA_PLAYER_VALUES_V3 = (
+    "name, jersey, profile_url, data_source, position, height, hometown, "
+    "high_school, team, class_year, team_short, year"
+)
+_PVF_PLAYER_VALUES_V3 = (
+    "name, jersey, profile_url, conference, level, division, data_source, "
+    "position, height, hometown, college, pro_experience"
+)
+
+
+def _key_player_tables(conn: sqlite3.Connection) -> None:
+    """Collapse duplicate roster rows and key players on (player, team, season)."""
+    for table, schema_sql, columns in (
+        (
+            "ncaam_players",
+            _NCAA_PLAYERS_V3.format(table="ncaam_players", league="ncaam"),
+            _NCAA_PLAYER_VALUES_V3,
+        ),
+        (
+            "ncaaw_players",
+            _NCAA_PLAYERS_V3.format(table="ncaaw_players", league="ncaaw"),
+            _NCAA_PLAYER_VALUES_V3,
+        ),
+        ("pvf_players", _PVF_PLAYERS_V3, _PVF_PLAYER_VALUES_V3),
+    ):
+        if table == "pvf_players":
+            # PVF rosters had no season; take it from the team's current season
+            season = (
+                "COALESCE((SELECT current_season_id FROM pvf_teams AS t "
+                "WHERE t.team_id = {old}.team_id), '')"
+            )
+        else:
+            season = "COALESCE(season_id, '')"
+
+        # Players without an id fall back to their name slug, as
+        # normalize_rosters does, so id-less teammates keep a row each
+        player = (
+            "COALESCE(NULLIF(player_id, ''), "
+            "replace(lower(trim(COALESCE(name, ''))), ' ', '-'))"
+        )
+        keys = f"{player}, COALESCE(team_id, ''), {season}"
+        # Keep the most recently loaded copy of each player-season
+        rebuild_table(
+            conn,
+            table,
+            schema_sql,
+            f"""
+            (id, player_id, team_id, season_id, {columns})
+            SELECT id, {player}, team_id, {season}, {columns}
+            FROM {{old}}
+            WHERE id IN (SELECT MAX(id) FROM {{old}} GROUP BY {keys})
+            """,
+        )
+
+
+# Indexes duplicating a UNIQUE key, or superseded by a composite index,
+# as reported by the index advisor over API_QUERIES
+_PRUNE_INDEXES = """
+DROP INDEX IF EXISTS idx_lovb_team_id;
+DROP INDEX IF EXISTS idx_pvf_team_id;
+DROP INDEX IF EXISTS idx_ncaam_team_id;
+DROP INDEX IF EXISTS idx_ncaaw_team_id;
+DROP INDEX IF EXISTS idx_lovb_player_id;
+DROP INDEX IF EXISTS idx_pvf_player_id;
+DROP INDEX IF EXISTS idx_ncaam_player_id;
+DROP INDEX IF EXISTS idx_ncaaw_player_id;
+DROP INDEX IF EXISTS idx_lovb_match_id;
+DROP INDEX IF EXISTS idx_pvf_match_id;
+DROP INDEX IF EXISTS idx_ncaam_match_id;
+
+DROP INDEX IF EXISTS idx_lovb_conference;
+DROP INDEX IF EXISTS idx_pvf_conference;
+DROP INDEX IF EXISTS idx_ncaam_conference;
+DROP INDEX IF EXISTS idx_ncaaw_conference;
+CREATE INDEX idx_lovb_conference ON lovb_teams(conference, name);
+CREATE INDEX idx_pvf_conference ON pvf_teams(conference, name);
+CREATE INDEX idx_ncaam_conference ON ncaam_teams(conference, name);
+CREATE INDEX idx_ncaaw_conference ON ncaaw_teams(conference, name);
+
+DROP INDEX IF EXISTS idx_pvf_status;
+DROP INDEX IF EXISTS idx_ncaam_status;
+DROP INDEX IF EXISTS idx_ncaaw_status;
+CREATE INDEX idx_pvf_status ON pvf_results(status, date);
+CREATE INDEX idx_ncaam_status ON ncaam_results(status, date);
+CREATE INDEX idx_ncaaw_status ON ncaaw_results(status, date);
+
+CREATE INDEX IF NOT EXISTS idx_pvf_away_team ON pvf_results(away_team_id);
+CREATE INDEX IF NOT EXISTS idx_ncaam_away_team ON ncaam_results(away_team_id);
+CREATE INDEX IF NOT EXISTS idx_ncaaw_away_team ON ncaaw_results(away_team_id);
+
+DROP INDEX IF EXISTS idx_lovb_match_teams;
+CREATE INDEX idx_lovb_match_teams ON lovb_results(home_team_id, away_team_id);
+CREATE INDEX IF NOT EXISTS idx_lovb_match_away_team ON lovb_results(away_team_id);
+CREATE INDEX IF NOT EXISTS idx_lovb_match_date ON lovb_results(date);
+"""
+
+
+# match_sets as of migration 5
+_MATCH_SETS_V5 = """
+CREATE TABLE IF NOT EXISTS match_sets (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    set_no INTEGER NOT NULL,
+    home_pts INTEGER NOT NULL,
+    away_pts INTEGER NOT NULL,
+    PRIMARY KEY (league, match_id, set_no)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_match_sets_set_no ON match_sets(league, set_no);
+"""
+
+# Results columns derive_scores reads, per league
+_SCORE_INPUTS_V5 = {
+    "lovb": ("match_id", "score", "home_team_id", "away_team_id"),
+    "pvf": (
+        "pvf_match_id", "score", "home_team_score", "away_team_score",
+        "home_team_id", "away_team_id",
+    ),
+    "ncaam": ("match_id", "score", "home_team_id", "away_team_id"),
+    "ncaaw": ("match_id", "score", "home_team_id", "away_team_id"),
+}  # fmt: skip
+
+
+def _parse_set_scores(conn: sqlite3.Connection) -> None:
+    """Add the parsed score columns and match_sets, filled from existing scores."""
+    for statement in split_statements(_MATCH_SETS_V5):
+        conn.execute(statement)
+
+    for league, columns in _SCORE_INPUTS_V5.items():
+        table = f"{league}_results"
+        add_column(conn, table, "home_sets", "INTEGER")
+        add_column(conn, table, "away_sets", "INTEGER")
+        add_column(conn, table, "winner_team_id", "TEXT")
+        prefix = "lovb_match" if league == "lovb" else league
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{prefix}_winner "
+            f"ON {table}(winner_team_id)"
+        )
+
+        rows = conn.execute(f"SELECT id, {', '.join(columns)} FROM {table}").fetchall()
+        derived, set_rows = derive_scores(league, [row[1:] for row in rows], columns)
+        conn.executemany(
+            f"UPDATE {table} SET home_sets = ?, away_sets = ?, winner_team_id = ? "
+            f"WHERE id = ?",
+            [values + (row[0],) for row, values in zip(rows, derived)],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO match_sets VALUES (?, ?, ?, ?, ?)", set_rows
+        )
+
+
+# LOVB's first season; results scraped before their season was recorded
+# are placed in it
+_FIRST_LOVB_SEASON = "2025"
+
+# Inputs of derive_start_times per league, as column name -> SELECT expression
+_START_INPUTS_V6 = {
+    "lovb": {"date": "date", "season": f"'{_FIRST_LOVB_SEASON}'"},
+    "pvf": {"date": "date"},
+    "ncaam": {"date": "date", "time": "time"},
+    "ncaaw": {"date": "date", "time": "time"},
+}
+
+
+def _fill_start_times(conn: sqlite3.Connection, league: str, inputs: dict) -> None:
+    """Recompute a results table's start_time from the given input columns."""
+    table = f"{league}_results"
+    rows = conn.execute(
+        f"SELECT id, {', '.join(inputs.values())} FROM {table}"
+    ).fetchall()
+    starts = derive_start_times(league, [row[1:] for row in rows], tuple(inputs))
+    conn.executemany(
+        f"UPDATE {table} SET start_time = ? WHERE id = ?",
+        [(start, row[0]) for row, start in zip(rows, starts)],
+    )
+
+
+def _normalize_start_times(conn: sqlite3.Connection) -> None:
+    """Add start_time to the results tables and index it in place of date."""
+    for league, inputs in _START_INPUTS_V6.items():
+        table = f"{league}_results"
+        add_column(conn, table, "start_time", "TEXT")
+        _fill_start_times(conn, league, inputs)
+
+        if league == "lovb":
+            conn.execute("DROP INDEX IF EXISTS idx_lovb_match_date")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_lovb_match_start "
+                "ON lovb_results(start_time)"
+            )
+            continue
+
+        conn.execute(f"DROP INDEX IF EXISTS idx_{league}_date")
+        conn.execute(f"DROP INDEX IF EXISTS idx_{league}_status")
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{league}_start ON {table}(start_time)"
+        )
+        conn.execute(
+            f"CREATE INDEX idx_{league}_status ON {table}(status, start_time)"
+        )
+
+
+# matches as of migration 7
+_MATCHES_V7 = """
+CREATE TABLE IF NOT EXISTS matches (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    start_time TEXT,
+    home_team_id TEXT,
+    home_team_name TEXT,
+    away_team_id TEXT,
+    away_team_name TEXT,
+    home_sets INTEGER,
+    away_sets INTEGER,
+    winner_team_id TEXT,
+    status TEXT,
+    location TEXT,
+    PRIMARY KEY (league, match_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_matches_start ON matches(start_time);
+CREATE INDEX IF NOT EXISTS idx_matches_league_start ON matches(league, start_time);
+CREATE INDEX IF NOT EXISTS idx_matches_home_start ON matches(home_team_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_matches_away_start ON matches(away_team_id, start_time);
+"""
+
+
+def _unify_matches(conn: sqlite3.Connection) -> None:
+    """Create the cross-league matches table from the existing results."""
+    for statement in split_statements(_MATCHES_V7):
+        conn.execute(statement)
+
+    columns = (
+        "league, match_id, start_time, home_team_id, home_team_name, away_team_id, "
+        "away_team_name, home_sets, away_sets, winner_team_id, status, location"
+    )
+    shared = (
+        "start_time, home_team_id, home_team_name, away_team_id, away_team_name, "
+        "home_sets, away_sets, winner_team_id"
+    )
+    for league in ("pvf", "ncaam", "ncaaw"):
+        key = "pvf_match_id" if league == "pvf" else "match_id"
+        conn.execute(
+            f"INSERT OR REPLACE INTO matches ({columns}) "
+            f"SELECT '{league}', {key}, {shared}, status, location "
+            f"FROM {league}_results"
+        )
+    conn.execute(
+        f"INSERT OR REPLACE INTO matches ({columns}) "
+        f"SELECT 'lovb', match_id, {shared}, "
+        f"CASE WHEN winner_team_id IS NOT NULL THEN 'completed' END, NULL "
+        f"FROM lovb_results"
+    )
+
+
+# team_matches as of migration 8
+_TEAM_MATCHES = """
+CREATE TABLE IF NOT EXISTS team_matches (
+    team_id TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    is_home INTEGER NOT NULL,
+    opponent_id TEXT,
+    PRIMARY KEY (team_id, start_time, league, match_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_team_matches_opponent ON team_matches(team_id, opponent_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_team_matches_match ON team_matches(league, match_id);
+
+INSERT OR REPLACE INTO team_matches
+SELECT home_team_id, COALESCE(start_time, ''), league, match_id, 1, away_team_id
+FROM matches WHERE home_team_id IS NOT NULL AND home_team_id != '';
+
+INSERT OR REPLACE INTO team_matches
+SELECT away_team_id, COALESCE(start_time, ''), league, match_id, 0, home_team_id
+FROM matches WHERE away_team_id IS NOT NULL AND away_team_id != '';
+"""
+
+
+# standings as of migration 9
+_STANDINGS_V9 = """
+CREATE TABLE IF NOT EXISTS standings (
+    league TEXT NOT NULL,
+    season TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    conference TEXT,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    sets_won INTEGER NOT NULL,
+    sets_lost INTEGER NOT NULL,
+    points_for INTEGER NOT NULL,
+    points_against INTEGER NOT NULL,
+    form TEXT,
+    PRIMARY KEY (league, season, team_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_standings_conference ON standings(league, season, conference, wins);
+"""
+
+
+def _build_standings(conn: sqlite3.Connection) -> None:
+    """Record each match's season and build the standings table from scratch."""
+    add_column(conn, "matches", "season", "TEXT")
+    for league, table, key, season in (
+        ("pvf", "pvf_results", "pvf_match_id", "season_id"),
+        ("ncaam", "ncaam_results", "match_id", "year"),
+        ("ncaaw", "ncaaw_results", "match_id", "year"),
+    ):
+        conn.execute(
+            f"UPDATE matches SET season = (SELECT r.{season} FROM {table} AS r "
+            f"WHERE r.{key} = matches.match_id) WHERE league = '{league}'"
+        )
+    conn.execute(
+        "UPDATE matches SET season = substr(start_time, 1, 4) "
+        "WHERE league = 'lovb' AND start_time IS NOT NULL"
+    )
+
+    for statement in split_statements(_STANDINGS_V9):
+        conn.execute(statement)
+    rebuild_standings(conn)
+
+
+# team_ratings as of migration 10
+_TEAM_RATINGS = """
+CREATE TABLE IF NOT EXISTS team_ratings (
+    league TEXT NOT NULL,
+    season TEXT NOT NULL,
+    rating_date TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    matches INTEGER NOT NULL,
+    elo REAL NOT NULL,
+    bradley_terry REAL NOT NULL,
+    margin REAL NOT NULL,
+    PRIMARY KEY (league, season, rating_date, team_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_team_ratings_team ON team_ratings(team_id, league, season, rating_date);
+"""
+
+
+# Text columns indexed for search as of migration 11, name first
+_SEARCH_COLUMNS_V11 = {
+    "lovb_teams": ("name", "name_short", "conference"),
+    "pvf_teams": ("name", "name_short", "conference"),
+    "ncaam_teams": ("name", "name_short", "conference"),
+    "ncaaw_teams": ("name", "name_short", "conference"),
+    "lovb_players": ("name", "hometown"),
+    "pvf_players": ("name", "hometown", "college"),
+    "ncaam_players": ("name", "hometown", "high_school"),
+    "ncaaw_players": ("name", "hometown", "high_school"),
+}
+
+# FTS5 table and sync triggers of one table as of migration 11
+_SEARCH_TABLE_V11 = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+    {columns},
+    content='{table}',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN
+    INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN
+    INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE ON {table} BEGIN
+    INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+    INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});
+END;
+
+INSERT INTO {fts}({fts}) VALUES ('rebuild');
+"""
+
+# Index the rows already stored; the triggers keep the index current afterwards
+_SEARCH_INDEX = "".join(
+    _SEARCH_TABLE_V11.format(
+        fts=f"{table}_fts",
+        table=table,
+        columns=", ".join(columns),
+        new_values=", ".join(f"new.{col}" for col in columns),
+        old_values=", ".join(f"old.{col}" for col in columns),
+    )
+    for table, columns in _SEARCH_COLUMNS_V11.items()
+)
+
+
+# team_aliases as of migration 12
+_TEAM_ALIASES_V12 = """
+CREATE TABLE IF NOT EXISTS team_aliases (
+    league TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (league, alias)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_team_aliases_team ON team_aliases(league, team_id);
+"""
+
+
+def _build_team_aliases(conn: sqlite3.Connection) -> None:
+    """Create team_aliases and fill it from the teams, results and schools file."""
+    for statement in split_statements(_TEAM_ALIASES_V12):
+        conn.execute(statement)
+    build_aliases(conn)
+
+
+# player_match_stats as of migration 13
+_PLAYER_MATCH_STATS = """
+CREATE TABLE IF NOT EXISTS player_match_stats (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    team_id TEXT,
+    name TEXT,
+    jersey TEXT,
+    sets_played INTEGER,
+    kills INTEGER,
+    errors INTEGER,
+    total_attacks INTEGER,
+    hit_pct REAL,
+    assists INTEGER,
+    aces INTEGER,
+    service_errors INTEGER,
+    digs INTEGER,
+    reception_errors INTEGER,
+    block_solos INTEGER,
+    block_assists INTEGER,
+    block_errors INTEGER,
+    points REAL,
+    ball_handling_errors INTEGER,
+    PRIMARY KEY (league, match_id, player_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_player_match_stats_player ON player_match_stats(player_id, match_id);
+CREATE INDEX IF NOT EXISTS idx_player_match_stats_team ON player_match_stats(team_id, match_id);
+"""
+
+# play_by_play as of migration 14
+_PLAY_BY_PLAY = """
+CREATE TABLE IF NOT EXISTS play_by_play (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    n_events INTEGER NOT NULL,
+    players TEXT NOT NULL,
+    events BLOB NOT NULL,
+    PRIMARY KEY (league, match_id)
+);
+"""
+
+# team_seasons as of migration 15
+_TEAM_SEASONS = """
+CREATE TABLE IF NOT EXISTS team_seasons (
+    sport TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    year TEXT NOT NULL,
+    season_id TEXT NOT NULL,
+    PRIMARY KEY (sport, team_id, year)
+) WITHOUT ROWID;
+"""
+
+# match_details as of migration 16
+_MATCH_DETAILS = """
+CREATE TABLE IF NOT EXISTS match_details (
+    league TEXT NOT NULL,
+    match_url TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    team_stats TEXT NOT NULL,
+    scoreboard TEXT NOT NULL,
+    PRIMARY KEY (league, match_url)
+) WITHOUT ROWID;
+"""
+
+
+# assets as of migration 17
+_ASSETS_V17 = """
+CREATE TABLE IF NOT EXISTS assets (
+    asset_id TEXT PRIMARY KEY,
+    content_type TEXT NOT NULL,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _move_team_images(conn: sqlite3.Connection) -> None:
+    """Create assets and move the inline logos stored in team rows into it."""
+    for statement in split_statements(_ASSETS_V17):
+        conn.execute(statement)
+    for league in ("lovb", "pvf", "ncaam", "ncaaw"):
+        table = f"{league}_teams"
+        rows = conn.execute(
+            f"SELECT id, img FROM {table} WHERE ltrim(img) LIKE '<svg%'"
+        ).fetchall()
+        updated, assets = split_inline_images(rows, 1)
+        conn.executemany(
+            "INSERT INTO assets (asset_id, content_type, data) VALUES (?, ?, ?) "
+            "ON CONFLICT (asset_id) DO NOTHING",
+            assets,
+        )
+        conn.executemany(
+            f"UPDATE {table} SET img = ? WHERE id = ?",
+            [(img, id_) for id_, img in updated],
+        )
+
+
+# Inputs of derive_start_times per league once LOVB results record a season
+_START_INPUTS_V18 = dict(_START_INPUTS_V6, lovb={"date": "date", "season": "season"})
+
+# Results table, match key and season column per league as of migration 18
+_RESULTS_V18 = (
+    ("lovb", "lovb_results", "match_id", "season"),
+    ("pvf", "pvf_results", "pvf_match_id", "season_id"),
+    ("ncaam", "ncaam_results", "match_id", "year"),
+    ("ncaaw", "ncaaw_results", "match_id", "year"),
+)
+
+_REFILL_TEAM_MATCHES_V18 = """
+DELETE FROM team_matches;
+
+INSERT OR REPLACE INTO team_matches
+SELECT home_team_id, COALESCE(start_time, ''), league, match_id, 1, away_team_id
+FROM matches WHERE home_team_id IS NOT NULL AND home_team_id != '';
+
+INSERT OR REPLACE INTO team_matches
+SELECT away_team_id, COALESCE(start_time, ''), league, match_id, 0, home_team_id
+FROM matches WHERE away_team_id IS NOT NULL AND away_team_id != '';
+"""
+
+
+def _record_lovb_seasons(conn: sqlite3.Connection) -> None:
+    """
+    Store each LOVB result's season and recompute every start time from it.
+
+    LOVB start times used to take their year from the day the row was
+    migrated or loaded, and days without a time were stored as bare dates.
+    Start times are rederived as UTC timestamps, the copies in matches and
+    team_matches follow, and standings and LOVB ratings, which grouped
+    LOVB matches by the year of their start time, are recomputed.
+    """
+    add_column(conn, "lovb_results", "season", "TEXT")
+    conn.execute(
+        "UPDATE lovb_results SET season = ? WHERE season IS NULL",
+        (_FIRST_LOVB_SEASON,),
+    )
+    for league, inputs in _START_INPUTS_V18.items():
+        _fill_start_times(conn, league, inputs)
+
+    for league, table, key, season in _RESULTS_V18:
+        conn.execute(
+            f"UPDATE matches SET (start_time, season) = (SELECT r.start_time, "
+            f"r.{season} FROM {table} AS r WHERE r.{key} = matches.match_id) "
+            f"WHERE league = ?",
+            (league,),
+        )
+    for statement in split_statements(_REFILL_TEAM_MATCHES_V18):
+        conn.execute(statement)
+    rebuild_standings(conn)
+    # Rated again under their new seasons by the next update_ratings
+    conn.execute("DELETE FROM team_ratings WHERE league = 'lovb'")
+
+
+# Head-to-head lookups seek the team_matches primary key on team_id, already
+# in start_time order, and filter the few rows per team on opponent_id
+_DROP_OPPONENT_INDEX = "DROP INDEX IF EXISTS idx_team_matches_opponent;"
+
+
+# A day's ratings come out of the index already ranked by Elo
+_INDEX_RATINGS_BY_ELO = """
+CREATE INDEX IF NOT EXISTS idx_team_ratings_elo ON team_ratings(league, season, rating_date, elo);
+"""
+
+
+# A team's results and calendar are read through team_matches, in start_time
+# order, so the per-side team indexes only cost writes
+_DROP_TEAM_SIDE_INDEXES = """
+DROP INDEX IF EXISTS idx_lovb_match_teams;
+DROP INDEX IF EXISTS idx_lovb_match_away_team;
+DROP INDEX IF EXISTS idx_pvf_teams;
+DROP INDEX IF EXISTS idx_pvf_away_team;
+DROP INDEX IF EXISTS idx_ncaam_teams;
+DROP INDEX IF EXISTS idx_ncaam_away_team;
+DROP INDEX IF EXISTS idx_ncaaw_teams;
+DROP INDEX IF EXISTS idx_ncaaw_away_team;
+DROP INDEX IF EXISTS idx_matches_home_start;
+DROP INDEX IF EXISTS idx_matches_away_start;
+"""
+
+
+# empty_match_pages as of migration 22
+_EMPTY_MATCH_PAGES = """
+CREATE TABLE IF NOT EXISTS empty_match_pages (
+    league TEXT NOT NULL,
+    page TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (league, page, match_id)
+) WITHOUT ROWID;
+"""
+
+
+# Details pages without a stats iframe were cached as empty ids and never
+# read again; dropping them lets the next build resolve them
+_DROP_EMPTY_MATCH_DETAILS = "DELETE FROM match_details WHERE match_id = '';"
+
+# Wins and set difference per team to date, so an incremental ratings update
+# notices a corrected earlier result. Older snapshots hold 0 and are replayed
+# by the next update
+_RATING_DIGESTS = """
+ALTER TABLE team_ratings ADD COLUMN wins INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE team_ratings ADD COLUMN set_diff INTEGER NOT NULL DEFAULT 0;
+"""
+
+
+# Ordered migrations; append new entries, never edit applied ones.
+MIGRATIONS = [
+    # Databases created before versioning already hold the baseline tables,
+    # since create_tables() ran on every start
+    Migration(1, "Baseline schema"),
+    Migration(2, "Keyed ncaaw_results table", (_rebuild_ncaaw_results,)),
+    Migration(3, "Unique player-season roster rows", (_key_player_tables,)),
+    Migration(4, "Prune redundant indexes and index API lookups", (_PRUNE_INDEXES,)),
+    Migration(5, "Parsed set scores and match winners", (_parse_set_scores,)),
+    Migration(6, "Normalized match start times", (_normalize_start_times,)),
+    Migration(7, "Unified cross-league matches table", (_unify_matches,)),
+    Migration(8, "Team to match adjacency table", (_TEAM_MATCHES,)),
+    Migration(9, "Incremental standings", (_build_standings,)),
+    Migration(10, "Daily team rating snapshots", (_TEAM_RATINGS,)),
+    Migration(11, "Full-text search over players and teams", (_SEARCH_INDEX,)),
+    Migration(12, "Team alias index", (_build_team_aliases,)),
+    Migration(13, "Per-player match statistics", (_PLAYER_MATCH_STATS,)),
+    Migration(14, "Compact play-by-play", (_PLAY_BY_PLAY,)),
+    Migration(15, "NCAA team season cache", (_TEAM_SEASONS,)),
+    Migration(16, "Match details iframe cache", (_MATCH_DETAILS,)),
+    Migration(17, "Team logos as deduplicated assets", (_move_team_images,)),
+    Migration(18, "LOVB seasons and uniform UTC start times", (_record_lovb_seasons,)),
+    Migration(19, "Drop the unused head-to-head index", (_DROP_OPPONENT_INDEX,)),
+    Migration(20, "Index daily ratings by Elo", (_INDEX_RATINGS_BY_ELO,)),
+    Migration(21, "Read team results through team_matches", (_DROP_TEAM_SIDE_INDEXES,)),
+    Migration(22, "Empty NCAA match pages", (_EMPTY_MATCH_PAGES,)),
+    Migration(23, "Drop match details without an iframe", (_DROP_EMPTY_MATCH_DETAILS,)),
+    Migration(24, "Results digest in rating snapshots", (_RATING_DIGESTS,)),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_pragma(conn: sqlite3.Connection, name: str) -> int:
+    """Read an integer PRAGMA."""
+    return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def get_version(conn: sqlite3.Connection) -> int:
+    """Get the schema version stored in the database."""
+    return get_pragma(conn, "user_version")
+
+
+def _apply(conn: sqlite3.Connection, migration: Migration) -> None:
+    """Apply one migration and record its version in the same transaction."""
+    logger.info(f"Applying migration {migration.version}: {migration.description}")
+
+    # Pure SQL migrations run as a single script
+    if all(isinstance(step, str) for step in migration.steps):
+        script = "\n".join(migration.steps)
+        try:
+            conn.executescript(
+                f"BEGIN;\n{script}\nPRAGMA user_version = {migration.version};\nCOMMIT;"
+            )
+        except Exception:
+            conn.rollback()
+            raise
+        return
+
+    conn.execute("BEGIN")
+    try:
+        for step in migration.steps:
+            if callable(step):
+                step(conn)
+            else:
+                for statement in split_statements(step):
+                    conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {migration.version}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Bring a database up to the current schema version.
+
+    A current database costs a single PRAGMA read. A new, empty database
+    gets the full schema in one script. Older databases run each pending
+    migration in order, changing tables in place so no data is refetched.
+
+    Args:
+        conn: Connection to migrate
+
+    Returns:
+        Number of migrations applied
+    """
+    version = get_version(conn)
+    if version == SCHEMA_VERSION:
+        return 0
+
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema version {version} is newer than supported {SCHEMA_VERSION}"
+        )
+
+    has_tables = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    ).fetchone()
+    if version == 0 and not has_tables:
+        logger.info(f"Creating schema version {SCHEMA_VERSION}")
+        # Must be set before the first table exists; lets maintenance
+        # release free pages without a full VACUUM
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        try:
+            conn.executescript(
+                f"BEGIN;\n{get_schema_sql()}\n"
+                f"PRAGMA user_version = {SCHEMA_VERSION};\nCOMMIT;"
+            )
+            # Seed name resolution with the NCAA schools file, as migration
+            # 12 does for older databases
+            build_aliases(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return 1
+
+    pending = [m for m in MIGRATIONS if m.version > version]
+    # Table rebuilds copy rows as they are, including rows loaded before
+    # team ids were validated, so foreign keys are off while migrating
+    foreign_keys = get_pragma(conn, "foreign_keys")
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        for migration in pending:
+            _apply(conn, migration)
+    finally:
+        conn.execute(f"PRAGMA foreign_keys = {foreign_keys}")
+    return len(pending)
@@ -0,0 +1,137 @@
+"""
+On-disk cache of fetched and rendered page HTML, keyed by URL.
+
+Each page is one gzipped JSON file holding the URL, when it was fetched and
+the SHA-256 of its HTML. Pages younger than the TTL are served from disk,
+so a rerun within it parses the stored DOM without starting Chrome; a
+cache with no TTL serves every stored page, for re-parsing after a scraper
+fix. The hash catches truncated or edited files, which are dropped, and
+tells a refetch whether the page actually changed.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600.0
+
+
+class CachedPage(NamedTuple):
+    """A stored page: its HTML, when it was fetched and the HTML's hash."""
+
+    url: str
+    html: str
+    fetched_at: float
+    sha256: str
+
+
+def content_hash(html: str) -> str:
+    """SHA-256 hex digest of a page's HTML."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def get_default_cache_dir() -> Path:
+    """Page cache directory next to the default database directory."""
+    return Path(__file__).parent.parent.parent / "cache" / "pages"
+
+
+class PageCache:
+    """
+    Directory of cached pages, one file per URL.
+
+    Files are replaced atomically, so threads fetching different pages can
+    share one cache.
+
+    Args:
+        directory: Where the page files live (default: cache/pages at the
+            project root)
+        ttl: Seconds a page is served for; None serves pages of any age
+    """
+
+    def __init__(
+        self, directory: Optional[Path] = None, ttl: Optional[float] = DEFAULT_TTL
+    ):
+        self.directory = Path(directory) if directory else get_default_cache_dir()
+        self.ttl = ttl
+
+    def _path(self, url: str) -> Path:
+        """File a URL's page is stored in."""
+        return self.directory / f"{hashlib.sha1(url.encode()).hexdigest()}.json.gz"
+
+    def _read(self, url: str) -> Optional[CachedPage]:
+        """The stored page of a URL, or None if absent or corrupt."""
+        path = self._path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                page = CachedPage(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cached page {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        if page.url != url or content_hash(page.html) != page.sha256:
+            logger.warning(f"Dropping cached page of {url} that fails its hash")
+            path.unlink(missing_ok=True)
+            return None
+        return page
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """The stored page of a URL if it is within the TTL."""
+        page = self._read(url)
+        if page is None or self.ttl is None:
+            return page
+        return page if time.time() - page.fetched_at < self.ttl else None
+
+    def put(self, url: str, html: str) -> bool:
+        """Store a page, replacing the file atomically; True if it changed."""
+        page = CachedPage(url, html, time.time(), content_hash(html))
+        stored = self._read(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with gzip.open(raw, "wt", encoding="utf-8") as f:
+                    json.dump(page._asdict(), f)
+            os.replace(tmp, self._path(url))
+        except Exception:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return stored is None or stored.sha256 != page.sha256
+
+
+_shared: Optional[PageCache] = None
+_shared_ttl: Optional[float] = DEFAULT_TTL
+_shared_lock = threading.Lock()
+
+
+def configure_page_cache(ttl: Optional[float]) -> None:
+    """
+    Set the shared cache's TTL; 0 disables it and None serves any age.
+
+    Call before the first fetch; the cache is rebuilt on the next use.
+    """
+    global _shared, _shared_ttl
+    with _shared_lock:
+        _shared_ttl = ttl
+        _shared = None
+
+
+def shared_page_cache() -> Optional[PageCache]:
+    """The process-wide page cache, or None if it is disabled."""
+    global _shared
+    with _shared_lock:
+        if _shared_ttl is not None and _shared_ttl <= 0:
+            return None
+        if _shared is None:
+            _shared = PageCache(ttl=_shared_ttl)
+        return _shared
@@ -0,0 +1,178 @@
+"""
+Page HTML for the browser-driven fetchers, without a browser when possible.
+
+The LOVB site is a Next.js app that renders its pages on the server from
+the same payload it hydrates in the browser, so a plain GET usually returns
+the markup the parsers need. fetch_pages() tries that first and only hands
+a page to the shared Chrome pool when its readiness selector is missing
+from the HTTP response, i.e. when the content is only built client-side.
+Either way the page is kept in the shared page cache for its TTL.
+"""
+
+import logging
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup
+
+from .browser import shared_browser_pool
+from .crawler import Crawler
+from .page_cache import shared_page_cache
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Where a page's HTML came from
+HTTP = "http"
+BROWSER = "browser"
+CACHE = "cache"
+
+
+class Page(NamedTuple):
+    """HTML of a page and whether it came over HTTP, from Chrome or the cache."""
+
+    url: str
+    html: str
+    source: str
+
+
+def is_rendered(html: str, selector: str) -> bool:
+    """Whether the HTML already holds the element a parser waits for."""
+    return BeautifulSoup(html, "html.parser").select_one(selector) is not None
+
+
+def fetch_static(urls: List[str], crawler: Crawler) -> List[Optional[str]]:
+    """GET pages concurrently; None for pages that failed."""
+
+    def fetch(url: str) -> Optional[str]:
+        try:
+            response = crawler.get(url)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            logger.warning(f"Error fetching {url}: {e}")
+            return None
+
+    return crawler.map(fetch, urls)
+
+
+def fetch_pages(
+    urls: Iterable[str],
+    ready_selector: str,
+    use_browser: bool = True,
+    crawler: Optional[Crawler] = None,
+    use_cache: bool = True,
+) -> List[Optional[Page]]:
+    """
+    HTML of each page with its content present, fetched the cheapest way.
+
+    Pages still fresh in the shared page cache are not fetched at all;
+    pages that are fetched or rendered with their content present are
+    stored in it.
+
+    Args:
+        urls: Pages to fetch
+        ready_selector: CSS selector that is present once the content the
+            caller parses is in the page
+        use_browser: Render pages the HTTP response lacks the content of;
+            if False they are returned as None
+        crawler: Crawler for the HTTP requests; one is made if not given
+        use_cache: Read and update the shared page cache
+
+    Returns:
+        Page per URL, in order; None for pages that could not be fetched
+    """
+    urls = list(urls)
+    cache = shared_page_cache() if use_cache else None
+
+    pages: List[Optional[Page]] = [None] * len(urls)
+    if cache is not None:
+        for i, url in enumerate(urls):
+            cached = cache.get(url)
+            if cached is not None:
+                pages[i] = Page(url, cached.html, CACHE)
+    stale = [i for i, page in enumerate(pages) if page is None]
+    if not stale:
+        logger.info(f"All {len(urls)} pages served from the page cache")
+        return pages
+
+    if crawler is None:
+        with Crawler(HEADERS) as own:
+            static = fetch_static([urls[i] for i in stale], own)
+    else:
+        static = fetch_static([urls[i] for i in stale], crawler)
+
+    missing = []
+    for i, html in zip(stale, static):
+        if html is not None and is_rendered(html, ready_selector):
+            pages[i] = Page(urls[i], html, HTTP)
+        else:
+            missing.append(i)
+    logger.info(
+        f"{len(urls) - len(stale)} of {len(urls)} pages cached, "
+        f"{len(stale) - len(missing)} served over HTTP"
+    )
+
+    if missing and use_browser:
+        logger.info(f"Rendering {len(missing)} pages in Chrome")
+        rendered = shared_browser_pool().render_many(
+            [urls[i] for i in missing], ready_selector
+        )
+        for i, page in zip(missing, rendered):
+            if page is None:
+                continue
+            # A page whose content never appeared is not returned or cached
+            if page.ready and is_rendered(page.html, ready_selector):
+                pages[i] = Page(page.url, page.html, BROWSER)
+            else:
+                logger.warning(f"{urls[i]} rendered without {ready_selector}")
+
+    if cache is not None:
+        # Only pages that passed is_rendered above are set
+        fetched = [pages[i] for i in stale if pages[i] is not None]
+        changed = sum(cache.put(page.url, page.html) for page in fetched)
+        logger.info(f"Cached {len(fetched)} pages, {changed} with new content")
+    return pages
+
+
+def check_parity(
+    urls: Iterable[str],
+    ready_selector: str,
+    parse: Callable[[str, str], Any],
+) -> bool:
+    """
+    Parse each page from HTTP and from Chrome and log any difference.
+
+    Args:
+        urls: Pages to compare
+        ready_selector: Readiness selector passed to both paths
+        parse: Parser called as parse(url, html); its results must compare
+            equal for the HTTP path to be trusted
+
+    Returns:
+        True if every page the HTTP path served parsed the same both ways
+    """
+    urls = list(urls)
+    with Crawler(HEADERS) as crawler:
+        static = fetch_static(urls, crawler)
+    rendered = shared_browser_pool().render_many(urls, ready_selector)
+
+    same = True
+    for url, html, page in zip(urls, static, rendered):
+        if page is None or not page.ready:
+            logger.warning(f"Parity: {url} did not render in Chrome")
+            continue
+        if html is None or not is_rendered(html, ready_selector):
+            logger.info(f"Parity: {url} needs Chrome (no {ready_selector} over HTTP)")
+            continue
+        from_http, from_browser = parse(url, html), parse(url, page.html)
+        if from_http == from_browser:
+            logger.info(f"Parity: {url} matches")
+        else:
+            same = False
+            logger.warning(f"Parity: {url} parses differently over HTTP")
+            logger.debug(f"HTTP: {from_http!r}")
+            logger.debug(f"Chrome: {from_browser!r}")
+    return same
@@ -0,0 +1,190 @@
+"""
+Compact play-by-play storage: each match's rally events as typed columns,
+packed into one compressed blob and read back as NumPy arrays.
+"""
+
+import json
+import re
+import sqlite3
+import zlib
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Event columns and their little-endian storage types, in blob order. Each
+# column is stored contiguously, which compresses far better than rows.
+EVENT_FIELDS = (
+    ("set_no", "<u1"),
+    ("home_score", "<u1"),
+    ("away_score", "<u1"),
+    ("serving", "<i1"),
+    ("event", "<u1"),
+    ("player", "<i2"),
+)
+
+# serving: the side serving the rally; player: -1 when no player is named
+HOME, AWAY, UNKNOWN = 0, 1, -1
+
+EVENT_CODES = {
+    "other": 0,
+    "serve": 1,
+    "kill": 2,
+    "attack_error": 3,
+    "ace": 4,
+    "service_error": 5,
+    "block": 6,
+    "block_error": 7,
+    "reception_error": 8,
+    "ball_handling_error": 9,
+    "set_error": 10,
+    "point": 11,
+    "timeout": 12,
+    "substitution": 13,
+}
+
+# Play descriptions as worded on stats.ncaa.org, most specific first
+_EVENT_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), EVENT_CODES[event])
+    for pattern, event in (
+        (r"attack error", "attack_error"),
+        (r"service ace", "ace"),
+        (r"service error", "service_error"),
+        (r"block error", "block_error"),
+        (r"reception error|serve receive error", "reception_error"),
+        (r"ball handling error", "ball_handling_error"),
+        (r"bad set|set error", "set_error"),
+        (r"\bkill\b", "kill"),
+        (r"\bblock\b", "block"),
+        (r"\bserves?\b", "serve"),
+        (r"timeout", "timeout"),
+        (r"\bsub(stitution)?\b", "substitution"),
+        (r"point", "point"),
+    )
+]
+
+# Zlib level: the blobs are written once and read many times
+COMPRESSION_LEVEL = 9
+
+
+def classify_event(text: str) -> int:
+    """EVENT_CODES value of a play description."""
+    for pattern, code in _EVENT_PATTERNS:
+        if pattern.search(text):
+            return code
+    return EVENT_CODES["other"]
+
+
+def encode_events(events: Mapping[str, Sequence[int]]) -> Tuple[int, bytes]:
+    """
+    Pack a match's event columns into a compressed blob.
+
+    Args:
+        events: Sequence per EVENT_FIELDS name, all the same length
+
+    Returns:
+        (n_events, blob)
+    """
+    n_events = len(events[EVENT_FIELDS[0][0]])
+    parts = []
+    for field, dtype in EVENT_FIELDS:
+        column = np.asarray(events[field], dtype=dtype)
+        if len(column) != n_events:
+            raise ValueError(f"{field} has {len(column)} events, expected {n_events}")
+        parts.append(column.tobytes())
+    return n_events, zlib.compress(b"".join(parts), COMPRESSION_LEVEL)
+
+
+def decode_events(blob: bytes, n_events: int) -> Dict[str, np.ndarray]:
+    """Unpack a blob written by encode_events into read-only column arrays."""
+    raw = zlib.decompress(blob)
+    columns = {}
+    offset = 0
+    for field, dtype in EVENT_FIELDS:
+        columns[field] = np.frombuffer(raw, dtype=dtype, count=n_events, offset=offset)
+        offset += n_events * np.dtype(dtype).itemsize
+    return columns
+
+
+def pbp_row(
+    league: str,
+    match_id: str,
+    events: Mapping[str, Sequence[int]],
+    players: Sequence[str],
+) -> tuple:
+    """A play_by_play row; events' player column indexes into players."""
+    n_events, blob = encode_events(events)
+    return (league, match_id, n_events, json.dumps(list(players)), blob)
+
+
+class PlayByPlay(NamedTuple):
+    """Events of many matches, concatenated in match order."""
+
+    match_ids: np.ndarray  # match_id per match
+    offsets: np.ndarray  # first event of each match, plus the total at the end
+    players: np.ndarray  # player_id per player index
+    set_no: np.ndarray
+    home_score: np.ndarray
+    away_score: np.ndarray
+    serving: np.ndarray  # HOME, AWAY or UNKNOWN
+    event: np.ndarray  # EVENT_CODES value
+    player: np.ndarray  # index into players, -1 when none
+
+    def match_index(self) -> np.ndarray:
+        """Index into match_ids of every event."""
+        return np.repeat(np.arange(len(self.match_ids)), np.diff(self.offsets))
+
+
+def read_pbp(
+    conn: sqlite3.Connection,
+    league: str,
+    match_ids: Optional[Sequence[str]] = None,
+) -> PlayByPlay:
+    """
+    Load stored play-by-play straight into NumPy arrays.
+
+    Blobs are decompressed and their columns concatenated; no Python object
+    is created per event. Player indexes are remapped onto one players array
+    shared by all the matches.
+
+    Args:
+        conn: Database connection
+        league: ncaam or ncaaw
+        match_ids: Matches to load (default: every stored match of the league)
+
+    Returns:
+        PlayByPlay for the matches found, ordered by match_id
+    """
+    query = (
+        "SELECT match_id, n_events, players, events FROM play_by_play "
+        "WHERE league = ?"
+    )
+    params: List = [league]
+    if match_ids is not None:
+        query += f" AND match_id IN ({', '.join('?' * len(match_ids))})"
+        params.extend(match_ids)
+    rows = conn.execute(query + " ORDER BY match_id", params).fetchall()
+
+    ids, counts, players = [], [], []
+    columns: Dict[str, List[np.ndarray]] = {field: [] for field, _ in EVENT_FIELDS}
+    for match_id, n_events, match_players, blob in rows:
+        decoded = decode_events(blob, n_events)
+        player = decoded["player"].astype(np.int32)
+        # Shift local player indexes past the players of earlier matches
+        columns["player"].append(np.where(player >= 0, player + len(players), -1))
+        for field, _ in EVENT_FIELDS[:-1]:
+            columns[field].append(decoded[field])
+        players.extend(json.loads(match_players))
+        ids.append(match_id)
+        counts.append(n_events)
+
+    arrays = {
+        field: np.concatenate(columns[field]) if rows else np.empty(0, dtype)
+        for field, dtype in EVENT_FIELDS
+    }
+    arrays["player"] = arrays["player"].astype(np.int32, copy=False)
+    return PlayByPlay(
+        match_ids=np.array(ids, dtype=object),
+        offsets=np.concatenate([[0], np.cumsum(counts, dtype=np.int64)]),
+        players=np.array(players, dtype=object),
+        **arrays,
+    )
@@ -0,0 +1,372 @@
+"""Team ratings per league season: Elo, Bradley-Terry and set-margin ratings."""
+
+import sqlite3
+from itertools import repeat
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from .dates import LOCAL_TZ
+
+ELO_START = 1500.0
+ELO_K = 32.0
+ELO_SCALE = 400.0
+
+# Every team is seeded with one virtual drawn match against an average team,
+# which keeps winless, unbeaten and disconnected teams finite
+PRIOR_MATCHES = 1.0
+
+# Fits stop once ratings are settled to about this much, far below the
+# precision ratings are read at
+TOLERANCE = 1e-4
+MAX_ITERATIONS = 500
+
+_COMPLETED_MATCHES = """
+SELECT start_time, home_team_id, away_team_id, home_sets, away_sets,
+       winner_team_id = home_team_id
+FROM matches
+WHERE league = ? AND COALESCE(season, '') = ? AND winner_team_id IS NOT NULL
+    AND home_team_id IS NOT NULL AND away_team_id IS NOT NULL
+    AND start_time IS NOT NULL AND start_time != ''
+ORDER BY start_time
+"""
+
+
+class Results(NamedTuple):
+    """Completed matches of one league season as parallel arrays."""
+
+    teams: np.ndarray  # team_id per team index
+    days: np.ndarray  # local match day, "YYYY-MM-DD", per match
+    home: np.ndarray  # home team index per match
+    away: np.ndarray  # away team index per match
+    home_won: np.ndarray  # 1.0 for a home win, 0.0 for an away win
+    margin: np.ndarray  # home sets minus away sets
+
+
+def local_days(start_times: pd.Series) -> np.ndarray:
+    """Calendar day in LOCAL_TZ of ISO-8601 UTC start times; dates pass through."""
+    unique, inverse = np.unique(start_times.to_numpy(dtype=str), return_inverse=True)
+    days = np.array([value[:10] for value in unique], dtype=object)
+    timed = np.array([len(value) > 10 for value in unique], dtype=bool)
+    if timed.any():
+        stamps = pd.to_datetime(pd.Series(unique[timed]), utc=True, format="ISO8601")
+        days[timed] = stamps.dt.tz_convert(LOCAL_TZ).dt.strftime("%Y-%m-%d")
+    return days.astype(str)[inverse]
+
+
+def load_results(conn: sqlite3.Connection, league: str, season: str) -> Results:
+    """Load a league season's completed matches, ordered by local day."""
+    frame = pd.DataFrame(
+        [tuple(row) for row in conn.execute(_COMPLETED_MATCHES, (league, season))],
+        columns=["start", "home", "away", "home_sets", "away_sets", "home_won"],
+    )
+    sides = np.concatenate([frame["home"].to_numpy(), frame["away"].to_numpy()])
+    teams, sides = np.unique(sides.astype(str), return_inverse=True)
+    days = local_days(frame["start"].astype(str))
+    order = np.argsort(days, kind="stable")
+    home, away = sides[: len(frame)], sides[len(frame):]
+    sets = frame[["home_sets", "away_sets"]].fillna(0).to_numpy(float)
+    margin = sets[:, 0] - sets[:, 1]
+    return Results(
+        teams=teams,
+        days=days[order],
+        home=home[order],
+        away=away[order],
+        home_won=frame["home_won"].to_numpy(float)[order],
+        margin=margin[order],
+    )
+
+
+def elo_day(
+    ratings: np.ndarray, home: np.ndarray, away: np.ndarray, home_won: np.ndarray
+) -> None:
+    """
+    Apply one day of matches to Elo ratings in place.
+
+    Every match of the day is scored against the ratings at the start of the
+    day, so the update is one vectorized step regardless of match order.
+    """
+    expected = 1.0 / (1.0 + 10.0 ** ((ratings[away] - ratings[home]) / ELO_SCALE))
+    delta = ELO_K * (home_won - expected)
+    np.add.at(ratings, home, delta)
+    np.add.at(ratings, away, -delta)
+
+
+def _pairwise(
+    home: np.ndarray, away: np.ndarray, weight: np.ndarray, n_teams: int
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Product with the weighted Laplacian of the match graph, never materialized."""
+
+    def apply(vector: np.ndarray) -> np.ndarray:
+        diff = weight * (vector[home] - vector[away])
+        return np.bincount(home, diff, n_teams) - np.bincount(away, diff, n_teams)
+
+    return apply
+
+
+def conjugate_gradient(
+    apply: Callable[[np.ndarray], np.ndarray],
+    rhs: np.ndarray,
+    start: np.ndarray,
+    diagonal: np.ndarray,
+    tolerance: float = TOLERANCE,
+) -> np.ndarray:
+    """
+    Solve a symmetric positive definite system with Jacobi-preconditioned CG.
+
+    Args:
+        apply: Product of the system matrix with a vector
+        rhs: Right-hand side
+        start: Initial guess, e.g. the previous day's solution
+        diagonal: Diagonal of the system matrix, the preconditioner
+        tolerance: Residual to stop at, relative to the right-hand side
+
+    Returns:
+        Solution to the system
+    """
+    solution = start.copy()
+    residual = rhs - apply(solution)
+    scaled = residual / diagonal
+    direction = scaled.copy()
+    norm = residual @ scaled
+    limit = (tolerance * max(np.linalg.norm(rhs), 1.0)) ** 2
+
+    for _ in range(min(MAX_ITERATIONS, len(rhs))):
+        if residual @ residual <= limit:
+            break
+        product = apply(direction)
+        step = norm / (direction @ product)
+        solution += step * direction
+        residual -= step * product
+        scaled = residual / diagonal
+        updated = residual @ scaled
+        direction = scaled + (updated / norm) * direction
+        norm = updated
+    return solution
+
+
+def bradley_terry(
+    home: np.ndarray,
+    away: np.ndarray,
+    home_won: np.ndarray,
+    n_teams: int,
+    start: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Fit Bradley-Terry log-strengths by Newton's method.
+
+    Each Newton step solves the Hessian, a weighted Laplacian of the match
+    graph plus the prior's diagonal, by conjugate gradient, until the
+    expected and actual wins of every team agree to TOLERANCE.
+
+    Args:
+        home, away: Team index per match
+        home_won: 1.0 for a home win, 0.0 for an away win
+        n_teams: Number of teams
+        start: Log-strengths to start from, e.g. the previous day's fit
+
+    Returns:
+        Log-strength per team; 0 is the strength of the virtual average team
+    """
+    strength = start.copy() if start is not None else np.zeros(n_teams)
+    for _ in range(MAX_ITERATIONS):
+        home_prob = 1.0 / (1.0 + np.exp(strength[away] - strength[home]))
+        prior_prob = 1.0 / (1.0 + np.exp(-strength))
+
+        surprise = home_won - home_prob
+        gradient = np.bincount(home, surprise, n_teams) - np.bincount(
+            away, surprise, n_teams
+        )
+        gradient += PRIOR_MATCHES * (0.5 - prior_prob)
+        if np.max(np.abs(gradient), initial=0.0) < TOLERANCE:
+            break
+
+        weight = home_prob * (1.0 - home_prob)
+        prior_weight = PRIOR_MATCHES * prior_prob * (1.0 - prior_prob)
+        laplacian = _pairwise(home, away, weight, n_teams)
+        diagonal = (
+            np.bincount(home, weight, n_teams)
+            + np.bincount(away, weight, n_teams)
+            + prior_weight
+        )
+        # Inexact Newton: far from the optimum a rough step does as well, so
+        # CG only reduces its residual in proportion to the gradient
+        norm = np.linalg.norm(gradient)
+        step = conjugate_gradient(
+            lambda vector: laplacian(vector) + prior_weight * vector,
+            gradient,
+            np.zeros(n_teams),
+            diagonal,
+            min(0.5, np.sqrt(norm)) * min(norm, 1.0),
+        )
+        strength += step
+    return strength
+
+
+def margin_ratings(
+    home: np.ndarray,
+    away: np.ndarray,
+    margin: np.ndarray,
+    n_teams: int,
+    start: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Fit least-squares set-margin (Massey) ratings by conjugate gradient.
+
+    Solves (X'X + PRIOR_MATCHES * I) r = X'y, where each match row of X has
+    +1 for the home team and -1 for the away team and y is the set margin.
+
+    Args:
+        home, away: Team index per match
+        margin: Home sets minus away sets per match
+        n_teams: Number of teams
+        start: Ratings to start from, e.g. the previous day's fit
+
+    Returns:
+        Expected set margin against an average team, per team
+    """
+    ones = np.ones(len(home))
+    laplacian = _pairwise(home, away, ones, n_teams)
+    diagonal = (
+        np.bincount(home, ones, n_teams)
+        + np.bincount(away, ones, n_teams)
+        + PRIOR_MATCHES
+    )
+    rhs = np.bincount(home, margin, n_teams) - np.bincount(away, margin, n_teams)
+    return conjugate_gradient(
+        lambda vector: laplacian(vector) + PRIOR_MATCHES * vector,
+        rhs,
+        start if start is not None else np.zeros(n_teams),
+        diagonal,
+    )
+
+
+def _last_snapshot(conn: sqlite3.Connection, league: str, season: str):
+    """Latest rating date of a league season and its ratings keyed by team."""
+    row = conn.execute(
+        "SELECT MAX(rating_date) FROM team_ratings WHERE league = ? AND season = ?",
+        (league, season),
+    ).fetchone()
+    if row is None or row[0] is None:
+        return None, {}
+    snapshot = conn.execute(
+        "SELECT team_id, matches, elo, bradley_terry, margin, wins, set_diff "
+        "FROM team_ratings WHERE league = ? AND season = ? AND rating_date = ?",
+        (league, season, row[0]),
+    )
+    return row[0], {team: tuple(values) for team, *values in snapshot}
+
+
+def _tallies(results: Results, end: int, n_teams: int) -> np.ndarray:
+    """Matches, wins and set difference per team over the first end matches."""
+    home, away = results.home[:end], results.away[:end]
+    home_won, margin = results.home_won[:end], results.margin[:end]
+    return np.stack(
+        [
+            np.bincount(home, minlength=n_teams) + np.bincount(away, minlength=n_teams),
+            np.bincount(home, home_won, n_teams)
+            + np.bincount(away, 1.0 - home_won, n_teams),
+            np.bincount(home, margin, n_teams) - np.bincount(away, margin, n_teams),
+        ]
+    )
+
+
+def update_ratings(
+    conn: sqlite3.Connection, league: str, season: str, rebuild: bool = False
+) -> int:
+    """
+    Write a team_ratings snapshot for each match day after the latest one.
+
+    Elo carries on from the last snapshot; the Bradley-Terry and margin fits
+    cover the season to date but start from the previous day's ratings, so
+    each new day only needs a few iterations. Each snapshot also records
+    every team's matches, wins and set difference to date; when those no
+    longer match the stored results (a late, removed or corrected result on
+    an earlier day) the season is replayed from the start, as it is with
+    rebuild=True.
+
+    Returns:
+        Number of rating dates written
+    """
+    results = load_results(conn, league, season)
+    n_teams = len(results.teams)
+    last_date, snapshot = (None, {}) if rebuild else _last_snapshot(
+        conn, league, season
+    )
+
+    elo = np.full(n_teams, ELO_START)
+    strength = np.zeros(n_teams)
+    margin = np.zeros(n_teams)
+    # Matches, wins and set difference per team to date
+    tally = np.zeros((3, n_teams))
+    done = 0
+
+    if last_date is not None:
+        done = int(np.searchsorted(results.days, last_date, side="right"))
+        for index, team in enumerate(results.teams):
+            if team in snapshot:
+                played, elo[index], strength[index], margin[index], *digest = (
+                    snapshot[team]
+                )
+                tally[:, index] = (played, *digest)
+        counted = _tallies(results, done, n_teams)
+        if len(snapshot) != np.count_nonzero(counted[0]) or np.any(counted != tally):
+            last_date, done = None, 0
+            elo[:], strength[:], margin[:], tally[:] = ELO_START, 0, 0, 0
+
+    conn.execute(
+        "DELETE FROM team_ratings WHERE league = ? AND season = ? "
+        "AND rating_date > COALESCE(?, '')",
+        (league, season, last_date),
+    )
+
+    days, bounds = np.unique(results.days[done:], return_index=True)
+    bounds = list(bounds + done) + [len(results.days)]
+
+    def snapshots() -> Iterator[tuple]:
+        """Rows of each day's snapshot, computed as executemany consumes them."""
+        nonlocal strength, margin
+        for day, begin, end in zip(days, bounds, bounds[1:]):
+            home, away = results.home[begin:end], results.away[begin:end]
+            elo_day(elo, home, away, results.home_won[begin:end])
+            tally[:] = _tallies(results, end, n_teams)
+
+            home, away = results.home[:end], results.away[:end]
+            strength = bradley_terry(
+                home, away, results.home_won[:end], n_teams, strength
+            )
+            margin = margin_ratings(home, away, results.margin[:end], n_teams, margin)
+
+            active = np.flatnonzero(tally[0])
+            played, wins, set_diff = tally[:, active].astype(int).tolist()
+            yield from zip(
+                repeat(league),
+                repeat(season),
+                repeat(str(day)),
+                results.teams[active].tolist(),
+                played,
+                elo[active].tolist(),
+                strength[active].tolist(),
+                margin[active].tolist(),
+                wins,
+                set_diff,
+            )
+
+    conn.executemany(
+        "INSERT OR REPLACE INTO team_ratings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        snapshots(),
+    )
+    return len(days)
+
+
+def rating_seasons(conn: sqlite3.Connection, league: str) -> List[str]:
+    """Seasons of a league with at least one completed match."""
+    return [
+        row[0]
+        for row in conn.execute(
+            "SELECT DISTINCT COALESCE(season, '') FROM matches "
+            "WHERE league = ? AND winner_team_id IS NOT NULL",
+            (league,),
+        )
+    ]
@@ -0,0 +1,139 @@
+"""Normalize scraped NCAA roster tables into ncaa*_players columns."""
+
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import pandas as pd
+
+NCAA_BASE_URL = "https://stats.ncaa.org"
+
+# Roster headings seen on stats.ncaa.org, lowercased, to the field they hold
+ROSTER_HEADERS = {
+    "name": "name",
+    "player": "name",
+    "#": "jersey",
+    "no.": "jersey",
+    "jersey": "jersey",
+    "number": "jersey",
+    "position": "position",
+    "pos": "position",
+    "pos.": "position",
+    "height": "height",
+    "ht": "height",
+    "ht.": "height",
+    "hometown": "hometown",
+    "home town": "hometown",
+    "high school": "high_school",
+    "previous school": "high_school",
+    "class": "class_year",
+    "yr": "class_year",
+    "cl.": "class_year",
+    "year": "class_year",
+}
+
+
+def name_slug(name: Any) -> str:
+    """Lowercased, hyphen-joined name standing in for a missing player id."""
+    if name is None or name != name:
+        return ""
+    return "-".join(str(name).lower().split())
+
+
+def roster_headers(headers: Sequence[str]) -> List[str]:
+    """
+    Rename one table's headings to roster fields, once per table.
+
+    Headings that name no field, and repeats of a field already taken by an
+    earlier column, keep their text, so every team's table lines up on the
+    same field names when the tables are concatenated.
+    """
+    renamed = []
+    taken = set()
+    for header in headers:
+        field = ROSTER_HEADERS.get(header.strip().lower())
+        if field and field not in taken:
+            taken.add(field)
+            renamed.append(field)
+        else:
+            renamed.append(header)
+    return renamed
+
+
+# Columns the crawler adds to every roster row, after "Player URL"
+TEAM_FIELDS = ("team_id", "year", "team_name", "team_short", "season_id")
+
+# One scraped table: renamed headings (ending in "Player URL"), its rows, and
+# the TEAM_FIELDS values of the team it lists
+RosterTable = Tuple[Sequence[str], List[List[Any]], Sequence[Any]]
+
+
+def combine_rosters(tables: Sequence[RosterTable]) -> pd.DataFrame:
+    """
+    Build one DataFrame from many roster tables.
+
+    Tables with the same headings are stacked as plain lists and become a
+    single DataFrame, so a crawl of hundreds of teams builds a handful of
+    frames rather than one per team.
+    """
+    groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+    for headers, rows, team in tables:
+        group = groups.setdefault(tuple(headers) + TEAM_FIELDS, [])
+        team = list(team)
+        group.extend(list(row) + team for row in rows)
+
+    frames = [pd.DataFrame(rows, columns=columns) for columns, rows in groups.items()]
+    if not frames:
+        return pd.DataFrame(columns=TEAM_FIELDS)
+    return pd.concat(frames, sort=False, ignore_index=True)
+
+
+def normalize_rosters(roster_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert concatenated roster tables to the ncaa*_players columns.
+
+    Args:
+        roster_df: Roster rows from combine_rosters
+
+    Returns:
+        DataFrame of standardized players, built with whole-column operations
+    """
+
+    def column(col: str) -> pd.Series:
+        if col in roster_df.columns:
+            return roster_df[col].fillna("").astype(str)
+        return pd.Series("", index=roster_df.index)
+
+    player_urls = column("Player URL")
+    has_url = player_urls != ""
+    names = column("name")
+    # Players without a profile link fall back to a name slug, so reloading
+    # the same roster updates their row instead of adding another
+    name_slugs = names.str.lower().str.split().str.join("-")
+
+    return pd.DataFrame(
+        {
+            "name": names,
+            "jersey": column("jersey"),
+            "position": column("position"),
+            "height": column("height"),
+            "hometown": column("hometown"),
+            "team": column("team_name"),
+            "team_short": column("team_short"),
+            "profile_url": (NCAA_BASE_URL + player_urls).where(has_url, ""),
+            "player_id": player_urls.str.split("/").str[-1].where(has_url, name_slugs),
+            "high_school": column("high_school"),
+            "class_year": column("class_year"),
+            "data_source": "NCAA",
+            "team_id": column("team_id"),
+            "year": column("year"),
+            "season_id": column("season_id").str.split("/").str[-1],
+        }
+    )
+
+
+def teams_by_id(rows: Iterable[Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Team rows keyed by team_id, first row winning, for O(1) lookups."""
+    teams: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        row = dict(row)
+        teams.setdefault(row["team_id"], row)
+    return teams
@@ -20,8 +20,7 @@ CREATE TABLE IF NOT EXISTS lovb_teams (
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_lovb_team_id ON lovb_teams(team_id);
-CREATE INDEX IF NOT EXISTS idx_lovb_conference ON lovb_teams(conference);
+CREATE INDEX IF NOT EXISTS idx_lovb_conference ON lovb_teams(conference, name);
 CREATE INDEX IF NOT EXISTS idx_lovb_conference_short ON lovb_teams(conference_short);
 CREATE INDEX IF NOT EXISTS idx_lovb_division ON lovb_teams(division);
 CREATE INDEX IF NOT EXISTS idx_lovb_level ON lovb_teams(level);
@@ -44,8 +43,7 @@ CREATE TABLE IF NOT EXISTS pvf_teams (
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_pvf_team_id ON pvf_teams(team_id);
-CREATE INDEX IF NOT EXISTS idx_pvf_conference ON pvf_teams(conference);
+CREATE INDEX IF NOT EXISTS idx_pvf_conference ON pvf_teams(conference, name);
 CREATE INDEX IF NOT EXISTS idx_pvf_conference_short ON pvf_teams(conference_short);
 CREATE INDEX IF NOT EXISTS idx_pvf_division ON pvf_teams(division);
 CREATE INDEX IF NOT EXISTS idx_pvf_level ON pvf_teams(level);
@@ -66,8 +64,7 @@ CREATE TABLE IF NOT EXISTS ncaam_teams (
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_ncaam_team_id ON ncaam_teams(team_id);
-CREATE INDEX IF NOT EXISTS idx_ncaam_conference ON ncaam_teams(conference);
+CREATE INDEX IF NOT EXISTS idx_ncaam_conference ON ncaam_teams(conference, name);
 CREATE INDEX IF NOT EXISTS idx_ncaam_conference_short ON ncaam_teams(conference_short);
 CREATE INDEX IF NOT EXISTS idx_ncaam_division ON ncaam_teams(division);
 CREATE INDEX IF NOT EXISTS idx_ncaam_level ON ncaam_teams(level);
@@ -88,8 +85,7 @@ CREATE TABLE IF NOT EXISTS ncaaw_teams (
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_ncaaw_team_id ON ncaaw_teams(team_id);
-CREATE INDEX IF NOT EXISTS idx_ncaaw_conference ON ncaaw_teams(conference);
+CREATE INDEX IF NOT EXISTS idx_ncaaw_conference ON ncaaw_teams(conference, name);
 CREATE INDEX IF NOT EXISTS idx_ncaaw_conference_short ON ncaaw_teams(conference_short);
 CREATE INDEX IF NOT EXISTS idx_ncaaw_division ON ncaaw_teams(division);
 CREATE INDEX IF NOT EXISTS idx_ncaaw_level ON ncaaw_teams(level);
@@ -115,7 +111,6 @@ CREATE TABLE IF NOT EXISTS lovb_players(
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_lovb_player_id ON lovb_players(player_id);
 CREATE INDEX IF NOT EXISTS idx_lovb_player_team_id ON lovb_players(team_id);
 CREATE INDEX IF NOT EXISTS idx_lovb_player_conference ON lovb_players(conference);
 CREATE INDEX IF NOT EXISTS idx_lovb_player_level ON lovb_players(level);
@@ -140,11 +135,12 @@ CREATE TABLE IF NOT EXISTS pvf_players(
     hometown TEXT,
     college TEXT,
     pro_experience TEXT,
+    season_id TEXT,
+    UNIQUE (player_id, team_id, season_id),
     FOREIGN KEY (team_id) REFERENCES pvf_teams(team_id)
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_pvf_player_id ON pvf_players(player_id);
 CREATE INDEX IF NOT EXISTS idx_pvf_player_team_id ON pvf_players(team_id);
 CREATE INDEX IF NOT EXISTS idx_pvf_player_conference ON pvf_players(conference);
 CREATE INDEX IF NOT EXISTS idx_pvf_player_level ON pvf_players(level);
@@ -170,11 +166,11 @@ CREATE TABLE IF NOT EXISTS ncaam_players(
     team_short TEXT,
     year TEXT,
     season_id TEXT,
+    UNIQUE (player_id, team_id, season_id),
     FOREIGN KEY (team_id) REFERENCES ncaam_teams(team_id)
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_ncaam_player_id ON ncaam_players(player_id);
 CREATE INDEX IF NOT EXISTS idx_ncaam_player_team_id ON ncaam_players(team_id);
 """
 
@@ -197,11 +193,11 @@ CREATE TABLE IF NOT EXISTS ncaaw_players(
     team_short TEXT,
     year TEXT,
     season_id TEXT,
+    UNIQUE (player_id, team_id, season_id),
     FOREIGN KEY (team_id) REFERENCES ncaaw_teams(team_id)
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_ncaaw_player_id ON ncaaw_players(player_id);
 CREATE INDEX IF NOT EXISTS idx_ncaaw_player_team_id ON ncaaw_players(team_id);
 """
 
@@ -218,12 +214,17 @@ CREATE TABLE IF NOT EXISTS lovb_results (
     scoreboard TEXT,
     match_url TEXT,
     home_team_id TEXT,
-    away_team_id TEXT
+    away_team_id TEXT,
+    home_sets INTEGER,
+    away_sets INTEGER,
+    winner_team_id TEXT,
+    start_time TEXT,
+    season TEXT
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_lovb_match_id ON lovb_results(match_id);
-CREATE INDEX IF NOT EXISTS idx_lovb_match_teams ON lovb_results(home_team_name, away_team_name);
+CREATE INDEX IF NOT EXISTS idx_lovb_match_start ON lovb_results(start_time);
+CREATE INDEX IF NOT EXISTS idx_lovb_match_winner ON lovb_results(winner_team_id);
 """
 
 # PVF Results table schema SQL
@@ -248,14 +249,17 @@ CREATE TABLE IF NOT EXISTS pvf_results (
     video TEXT,
     volley_station_match_id TEXT,
     status TEXT,
-    title TEXT
+    title TEXT,
+    home_sets INTEGER,
+    away_sets INTEGER,
+    winner_team_id TEXT,
+    start_time TEXT
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_pvf_match_id ON pvf_results(pvf_match_id);
-CREATE INDEX IF NOT EXISTS idx_pvf_teams ON pvf_results(home_team_id, away_team_id);
-CREATE INDEX IF NOT EXISTS idx_pvf_date ON pvf_results(date);
-CREATE INDEX IF NOT EXISTS idx_pvf_status ON pvf_results(status);
+CREATE INDEX IF NOT EXISTS idx_pvf_start ON pvf_results(start_time);
+CREATE INDEX IF NOT EXISTS idx_pvf_status ON pvf_results(status, start_time);
+CREATE INDEX IF NOT EXISTS idx_pvf_winner ON pvf_results(winner_team_id);
 """
 
 # NCAAM Results table schema SQL
@@ -279,16 +283,448 @@ CREATE TABLE IF NOT EXISTS ncaam_results (
     division TEXT,
     division_roman TEXT,
     year TEXT,
-    status TEXT
+    status TEXT,
+    home_sets INTEGER,
+    away_sets INTEGER,
+    winner_team_id TEXT,
+    start_time TEXT
 );
 
 -- Create index on common query fields
-CREATE INDEX IF NOT EXISTS idx_ncaam_match_id ON ncaam_results(match_id);
-CREATE INDEX IF NOT EXISTS idx_ncaam_teams ON ncaam_results(home_team_id, away_team_id);
-CREATE INDEX IF NOT EXISTS idx_ncaam_date ON ncaam_results(date);
-CREATE INDEX IF NOT EXISTS idx_ncaam_status ON ncaam_results(status);
+CREATE INDEX IF NOT EXISTS idx_ncaam_start ON ncaam_results(start_time);
+CREATE INDEX IF NOT EXISTS idx_ncaam_status ON ncaam_results(status, start_time);
+CREATE INDEX IF NOT EXISTS idx_ncaam_winner ON ncaam_results(winner_team_id);
+"""
+
+# NCAAW Results table schema SQL
+NCAAW_RESULTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ncaaw_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id TEXT UNIQUE NOT NULL,
+    date TEXT,
+    time TEXT,
+    location TEXT,
+    home_team_id TEXT,
+    home_team_name TEXT,
+    away_team_id TEXT,
+    away_team_name TEXT,
+    score TEXT,
+    attendance TEXT,
+    box_score TEXT,
+    officials TEXT,
+    pbp TEXT,
+    individual_stats TEXT,
+    division TEXT,
+    division_roman TEXT,
+    year TEXT,
+    status TEXT,
+    home_sets INTEGER,
+    away_sets INTEGER,
+    winner_team_id TEXT,
+    start_time TEXT
+);
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_ncaaw_start ON ncaaw_results(start_time);
+CREATE INDEX IF NOT EXISTS idx_ncaaw_status ON ncaaw_results(status, start_time);
+CREATE INDEX IF NOT EXISTS idx_ncaaw_winner ON ncaaw_results(winner_team_id);
+"""
+
+# Per-set points parsed from the results score strings by the writers
+MATCH_SETS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS match_sets (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    set_no INTEGER NOT NULL,
+    home_pts INTEGER NOT NULL,
+    away_pts INTEGER NOT NULL,
+    PRIMARY KEY (league, match_id, set_no)
+) WITHOUT ROWID;
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_match_sets_set_no ON match_sets(league, set_no);
+"""
+
+# One row per match across all leagues, kept in step by the results writers
+MATCHES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    start_time TEXT,
+    home_team_id TEXT,
+    home_team_name TEXT,
+    away_team_id TEXT,
+    away_team_name TEXT,
+    home_sets INTEGER,
+    away_sets INTEGER,
+    winner_team_id TEXT,
+    status TEXT,
+    location TEXT,
+    season TEXT,
+    PRIMARY KEY (league, match_id)
+);
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_matches_start ON matches(start_time);
+CREATE INDEX IF NOT EXISTS idx_matches_league_start ON matches(league, start_time);
+"""
+
+# Two rows per match, one from each team's side, clustered by team and time.
+# Unknown start times are stored as '' (sorting first) since they are part of the key.
+TEAM_MATCHES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS team_matches (
+    team_id TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    is_home INTEGER NOT NULL,
+    opponent_id TEXT,
+    PRIMARY KEY (team_id, start_time, league, match_id)
+) WITHOUT ROWID;
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_team_matches_match ON team_matches(league, match_id);
+"""
+
+# Win/loss and set records per team and season, refreshed by the results
+# writers for the teams a load touches
+STANDINGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS standings (
+    league TEXT NOT NULL,
+    season TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    conference TEXT,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    sets_won INTEGER NOT NULL,
+    sets_lost INTEGER NOT NULL,
+    points_for INTEGER NOT NULL,
+    points_against INTEGER NOT NULL,
+    form TEXT,
+    PRIMARY KEY (league, season, team_id)
+) WITHOUT ROWID;
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_standings_conference ON standings(league, season, conference, wins);
+"""
+
+# Daily rating snapshots per league season for every team that has played;
+# ratings.update_ratings appends the days after the latest snapshot
+TEAM_RATINGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS team_ratings (
+    league TEXT NOT NULL,
+    season TEXT NOT NULL,
+    rating_date TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    matches INTEGER NOT NULL,
+    elo REAL NOT NULL,
+    bradley_terry REAL NOT NULL,
+    margin REAL NOT NULL,
+    wins INTEGER NOT NULL DEFAULT 0,
+    set_diff INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (league, season, rating_date, team_id)
+) WITHOUT ROWID;
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_team_ratings_team ON team_ratings(team_id, league, season, rating_date);
+CREATE INDEX IF NOT EXISTS idx_team_ratings_elo ON team_ratings(league, season, rating_date, elo);
+"""
+
+# Normalized team names, short names and slugs per league, resolved to the
+# canonical team_id by aliases.TeamResolver
+TEAM_ALIASES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS team_aliases (
+    league TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (league, alias)
+) WITHOUT ROWID;
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_team_aliases_team ON team_aliases(league, team_id);
 """
 
+# One line per player per NCAA match from the individual stats pages
+PLAYER_MATCH_STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS player_match_stats (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    team_id TEXT,
+    name TEXT,
+    jersey TEXT,
+    sets_played INTEGER,
+    kills INTEGER,
+    errors INTEGER,
+    total_attacks INTEGER,
+    hit_pct REAL,
+    assists INTEGER,
+    aces INTEGER,
+    service_errors INTEGER,
+    digs INTEGER,
+    reception_errors INTEGER,
+    block_solos INTEGER,
+    block_assists INTEGER,
+    block_errors INTEGER,
+    points REAL,
+    ball_handling_errors INTEGER,
+    PRIMARY KEY (league, match_id, player_id)
+) WITHOUT ROWID;
+
+-- Create index on common query fields
+CREATE INDEX IF NOT EXISTS idx_player_match_stats_player ON player_match_stats(player_id, match_id);
+CREATE INDEX IF NOT EXISTS idx_player_match_stats_team ON player_match_stats(team_id, match_id);
+"""
+
+# One row per NCAA match; events are packed by vbdb_fetch.pbp into a
+# compressed columnar blob, and players is the JSON list of player_ids the
+# events' player column indexes into
+PLAY_BY_PLAY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS play_by_play (
+    league TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    n_events INTEGER NOT NULL,
+    players TEXT NOT NULL,
+    events BLOB NOT NULL,
+    PRIMARY KEY (league, match_id)
+);
+"""
+
+# stats.ncaa.org season path of each NCAA team by sport (MVB, WVB) and
+# academic year, read from the team's history page once a season
+TEAM_SEASONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS team_seasons (
+    sport TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    year TEXT NOT NULL,
+    season_id TEXT NOT NULL,
+    PRIMARY KEY (sport, team_id, year)
+) WITHOUT ROWID;
+"""
+
+# Stats iframe of each completed match, by the match details page it was
+# read from; completed matches keep their iframe, so each page is read once
+MATCH_DETAILS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS match_details (
+    league TEXT NOT NULL,
+    match_url TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    team_stats TEXT NOT NULL,
+    scoreboard TEXT NOT NULL,
+    PRIMARY KEY (league, match_url)
+) WITHOUT ROWID;
+"""
+
+# Individual stats and play-by-play pages of completed matches that were
+# fetched but held no data; they do not fill in later, so builds skip them.
+# page is the results column holding the URL (individual_stats or pbp)
+EMPTY_MATCH_PAGES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS empty_match_pages (
+    league TEXT NOT NULL,
+    page TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (league, page, match_id)
+) WITHOUT ROWID;
+"""
+
+# Images teams embed inline (LOVB's SVG logos), stored once by the SHA-256
+# of their bytes; the team row's img holds the asset_id
+ASSETS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    asset_id TEXT PRIMARY KEY,
+    content_type TEXT NOT NULL,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Column order of each table as bound positionally by the Database writers.
+# DataFrames are selected into this order; tuple batches must already match it.
+TABLE_COLUMNS = {
+    "lovb_teams": (
+        "team_id", "name", "name_short", "img", "url", "division",
+        "conference", "conference_short", "level",
+    ),
+    "pvf_teams": (
+        "team_id", "name", "name_short", "img", "url", "division",
+        "conference", "conference_short", "level",
+        "current_roster_id", "current_season_id",
+    ),
+    "ncaam_teams": (
+        "team_id", "name", "name_short", "img", "url", "division",
+        "conference", "conference_short", "level",
+    ),
+    "ncaaw_teams": (
+        "team_id", "name", "name_short", "img", "url", "division",
+        "conference", "conference_short", "level",
+    ),
+    "lovb_players": (
+        "player_id", "name", "jersey", "profile_url", "team_id", "conference",
+        "level", "division", "data_source", "position", "height", "hometown",
+    ),
+    "pvf_players": (
+        "player_id", "name", "jersey", "profile_url", "team_id", "conference",
+        "level", "division", "data_source", "position", "height", "hometown",
+        "college", "pro_experience", "season_id",
+    ),
+    "ncaam_players": (
+        "player_id", "name", "jersey", "profile_url", "team_id", "data_source",
+        "position", "height", "hometown", "high_school", "team", "class_year",
+        "team_short", "year", "season_id",
+    ),
+    "ncaaw_players": (
+        "player_id", "name", "jersey", "profile_url", "team_id", "data_source",
+        "position", "height", "hometown", "high_school", "team", "class_year",
+        "team_short", "year", "season_id",
+    ),
+    "lovb_results": (
+        "match_id", "date", "home_team_name", "away_team_name", "score",
+        "team_stats", "scoreboard", "match_url", "home_team_id", "away_team_id",
+        "season",
+    ),
+    "pvf_results": (
+        "pvf_match_id", "season_id", "date", "location", "home_team_id",
+        "home_team_name", "home_team_score", "away_team_id", "away_team_name",
+        "away_team_score", "score", "team_stats", "scoreboard", "video",
+        "volley_station_match_id", "status", "title",
+    ),
+    "ncaam_results": (
+        "match_id", "date", "time", "location", "home_team_id", "home_team_name",
+        "away_team_id", "away_team_name", "score", "attendance", "box_score",
+        "officials", "pbp", "individual_stats", "division", "division_roman",
+        "year", "status",
+    ),
+    "ncaaw_results": (
+        "match_id", "date", "time", "location", "home_team_id", "home_team_name",
+        "away_team_id", "away_team_name", "score", "attendance", "box_score",
+        "officials", "pbp", "individual_stats", "division", "division_roman",
+        "year", "status",
+    ),
+    "match_sets": ("league", "match_id", "set_no", "home_pts", "away_pts"),
+    "matches": (
+        "league", "match_id", "start_time", "home_team_id", "home_team_name",
+        "away_team_id", "away_team_name", "home_sets", "away_sets",
+        "winner_team_id", "status", "location", "season",
+    ),
+    "team_matches": (
+        "team_id", "start_time", "league", "match_id", "is_home", "opponent_id",
+    ),
+    "standings": (
+        "league", "season", "team_id", "conference", "wins", "losses",
+        "sets_won", "sets_lost", "points_for", "points_against", "form",
+    ),
+    "team_ratings": (
+        "league", "season", "rating_date", "team_id", "matches", "elo",
+        "bradley_terry", "margin", "wins", "set_diff",
+    ),
+    "team_aliases": ("league", "alias", "team_id", "source"),
+    "player_match_stats": (
+        "league", "match_id", "player_id", "team_id", "name", "jersey",
+        "sets_played", "kills", "errors", "total_attacks", "hit_pct", "assists",
+        "aces", "service_errors", "digs", "reception_errors", "block_solos",
+        "block_assists", "block_errors", "points", "ball_handling_errors",
+    ),
+    "play_by_play": ("league", "match_id", "n_events", "players", "events"),
+    "team_seasons": ("sport", "team_id", "year", "season_id"),
+    "match_details": ("league", "match_url", "match_id", "team_stats", "scoreboard"),
+    "empty_match_pages": ("league", "page", "match_id", "fetched_at"),
+    "assets": ("asset_id", "content_type", "data"),
+}
+
+
+# Columns the results writers compute from each row rather than take as input;
+# bound after the table's TABLE_COLUMNS
+SCORE_COLUMNS = ("home_sets", "away_sets", "winner_team_id")
+RESULT_DERIVED_COLUMNS = SCORE_COLUMNS + ("start_time",)
+
+
+# Column each league's results table identifies a match by
+MATCH_KEYS = {
+    "lovb": "match_id",
+    "pvf": "pvf_match_id",
+    "ncaam": "match_id",
+    "ncaaw": "match_id",
+}
+
+# Column holding each league's season
+SEASON_COLUMNS = {
+    "lovb": "season",
+    "pvf": "season_id",
+    "ncaam": "year",
+    "ncaaw": "year",
+}
+
+
+# Natural keys of tables loaded with upserts instead of INSERT OR REPLACE.
+# Key columns are stored as '' rather than NULL so the UNIQUE constraint holds.
+TABLE_KEYS = {
+    "lovb_teams": ("team_id",),
+    "pvf_teams": ("team_id",),
+    "ncaam_teams": ("team_id",),
+    "ncaaw_teams": ("team_id",),
+    "lovb_players": ("player_id",),
+    "pvf_players": ("player_id", "team_id", "season_id"),
+    "ncaam_players": ("player_id", "team_id", "season_id"),
+    "ncaaw_players": ("player_id", "team_id", "season_id"),
+    "matches": ("league", "match_id"),
+    "team_aliases": ("league", "alias"),
+    "player_match_stats": ("league", "match_id", "player_id"),
+    "play_by_play": ("league", "match_id"),
+    "team_seasons": ("sport", "team_id", "year"),
+    "match_details": ("league", "match_url"),
+    "empty_match_pages": ("league", "page", "match_id"),
+    "assets": ("asset_id",),
+}
+
+# Text columns indexed for full-text search, name first. Each table gets an
+# external-content FTS5 table <table>_fts kept in sync by triggers; writers to
+# these tables must upsert, since INSERT OR REPLACE deletes rows without
+# firing the delete trigger
+SEARCH_COLUMNS = {
+    "lovb_teams": ("name", "name_short", "conference"),
+    "pvf_teams": ("name", "name_short", "conference"),
+    "ncaam_teams": ("name", "name_short", "conference"),
+    "ncaaw_teams": ("name", "name_short", "conference"),
+    "lovb_players": ("name", "hometown"),
+    "pvf_players": ("name", "hometown", "college"),
+    "ncaam_players": ("name", "hometown", "high_school"),
+    "ncaaw_players": ("name", "hometown", "high_school"),
+}
+
+
+def search_schema(table: str) -> str:
+    """Get the FTS5 table and sync triggers for one of SEARCH_COLUMNS' tables."""
+    columns = ", ".join(SEARCH_COLUMNS[table])
+    new_values = ", ".join(f"new.{col}" for col in SEARCH_COLUMNS[table])
+    old_values = ", ".join(f"old.{col}" for col in SEARCH_COLUMNS[table])
+    fts = f"{table}_fts"
+    return f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+    {columns},
+    content='{table}',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} BEGIN
+    INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} BEGIN
+    INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+END;
+
+CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE ON {table} BEGIN
+    INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+    INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values});
+END;
+"""
+
+
+SEARCH_SCHEMA = "".join(search_schema(table) for table in SEARCH_COLUMNS)
+
+
 def create_schema_file(directory: Union[str, Path] = None) -> str:
     """
     Create a schema file with all schemas.
@@ -332,4 +768,18 @@ def get_schema_sql() -> str:
         + LOVB_RESULTS_SCHEMA
         + PVF_RESULTS_SCHEMA
         + NCAAM_RESULTS_SCHEMA
+        + NCAAW_RESULTS_SCHEMA
+        + MATCH_SETS_SCHEMA
+        + MATCHES_SCHEMA
+        + TEAM_MATCHES_SCHEMA
+        + STANDINGS_SCHEMA
+        + TEAM_RATINGS_SCHEMA
+        + SEARCH_SCHEMA
+        + TEAM_ALIASES_SCHEMA
+        + PLAYER_MATCH_STATS_SCHEMA
+        + PLAY_BY_PLAY_SCHEMA
+        + TEAM_SEASONS_SCHEMA
+        + MATCH_DETAILS_SCHEMA
+        + ASSETS_SCHEMA
+        + EMPTY_MATCH_PAGES_SCHEMA
     )
@@ -0,0 +1,134 @@
+"""Vectorized parsing of match score strings into set counts and set points."""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .schema import MATCH_KEYS
+
+# Which side each league's score strings list first: NCAA men's box scores
+# and LOVB list the visiting team first, NCAA women's and PVF the home team
+HOME_FIRST = {"lovb": False, "pvf": True, "ncaam": False, "ncaaw": True}
+
+_SETS = r"^\s*(\d+)\s*-\s*(\d+)"
+_SET_POINTS = r"(\d+)\s*-\s*(\d+)"
+
+
+def _ints(values: pd.Series) -> List[Optional[int]]:
+    """Convert a numeric Series to Python ints, with None for missing values."""
+    return [None if pd.isna(value) else int(value) for value in values.tolist()]
+
+
+def parse_scores(
+    scores: Sequence[Any], home_first: bool
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Parse score strings such as "3-1 [25-20, 22-25, 25-10, 25-23]" or "3-1".
+
+    Args:
+        scores: Score strings, one per match; None and '' parse as missing
+        home_first: Whether the home team's numbers come first
+
+    Returns:
+        (matches, sets): matches has home_sets and away_sets per input
+        position; sets has match (input position), set_no, home_pts and
+        away_pts for every bracketed set score
+    """
+    text = pd.Series(
+        [score if isinstance(score, str) else "" for score in scores], dtype=object
+    )
+
+    # Set points live inside the brackets; the leading pair is sets won
+    bracket = text.str.extract(r"\[(.*)\]", expand=False).fillna("")
+    leading = text.str.replace(r"\[.*\]", "", regex=True)
+
+    pairs = bracket.str.extractall(_SET_POINTS).astype(int)
+    if len(pairs):
+        pairs = pairs.reset_index()
+        pairs.columns = ["match", "set_no", "first", "second"]
+        pairs["set_no"] += 1
+    else:
+        pairs = pd.DataFrame(
+            {"match": [], "set_no": [], "first": [], "second": []}, dtype=int
+        )
+
+    counts = leading.str.extract(_SETS).astype(float)
+    counts.columns = ["first", "second"]
+
+    # Without a leading pair, count the sets each side won from the points
+    won = (
+        pairs.assign(
+            first=pairs["first"] > pairs["second"],
+            second=pairs["second"] > pairs["first"],
+        )
+        .groupby("match")[["first", "second"]]
+        .sum()
+        .reindex(counts.index)
+    )
+    missing = counts.isna().any(axis=1)
+    counts.loc[missing] = won.loc[missing].astype(float)
+
+    home, away = ("first", "second") if home_first else ("second", "first")
+    matches = pd.DataFrame({"home_sets": counts[home], "away_sets": counts[away]})
+    sets = pd.DataFrame(
+        {
+            "match": pairs["match"],
+            "set_no": pairs["set_no"],
+            "home_pts": pairs[home],
+            "away_pts": pairs[away],
+        }
+    )
+    return matches, sets
+
+
+def derive_scores(
+    league: str, rows: List[tuple], columns: Sequence[str]
+) -> Tuple[List[tuple], List[tuple]]:
+    """
+    Compute the score columns and match_sets rows for results rows.
+
+    Args:
+        league: League key (lovb, pvf, ncaam, ncaaw)
+        rows: Results rows as tuples in columns order
+        columns: Column names of the rows
+
+    Returns:
+        (derived, sets): a (home_sets, away_sets, winner_team_id) tuple per
+        row, and (league, match_id, set_no, home_pts, away_pts) rows
+    """
+    if not rows:
+        return [], []
+
+    frame = pd.DataFrame.from_records(rows, columns=list(columns))
+    matches, sets = parse_scores(frame["score"], HOME_FIRST[league])
+
+    # PVF also reports each side's sets won in their own columns
+    if "home_team_score" in frame.columns:
+        for side in ("home", "away"):
+            reported = pd.to_numeric(frame[f"{side}_team_score"], errors="coerce")
+            matches[f"{side}_sets"] = reported.fillna(matches[f"{side}_sets"])
+
+    home_sets = matches["home_sets"]
+    away_sets = matches["away_sets"]
+    winner = frame["home_team_id"].where(home_sets > away_sets)
+    winner = winner.where(~(away_sets > home_sets), frame["away_team_id"])
+
+    derived = list(
+        zip(
+            _ints(home_sets),
+            _ints(away_sets),
+            [value if isinstance(value, str) and value else None for value in winner],
+        )
+    )
+
+    match_ids = frame[MATCH_KEYS[league]].tolist()
+    set_rows = [
+        (league, match_ids[match], set_no, home_pts, away_pts)
+        for match, set_no, home_pts, away_pts in zip(
+            sets["match"].tolist(),
+            sets["set_no"].tolist(),
+            sets["home_pts"].tolist(),
+            sets["away_pts"].tolist(),
+        )
+    ]
+    return derived, set_rows
@@ -0,0 +1,93 @@
+"""Ranked full-text search over player and team names across leagues."""
+
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence
+
+from .schema import SEARCH_COLUMNS, TABLE_COLUMNS
+
+LEAGUES = ("lovb", "pvf", "ncaam", "ncaaw")
+KINDS = {"teams": "team", "players": "player"}
+
+# bm25 weight of a name match relative to the other indexed columns
+NAME_WEIGHT = 10.0
+
+# Players appear once per season; fetch extra hits per table so that
+# collapsing seasons still fills the limit
+_SEASONS_PER_HIT = 4
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn typed text into an FTS5 query matching every word as a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation in the input are
+    matched literally rather than parsed.
+    """
+    return " ".join(f'"{token}"*' for token in _TOKEN.findall(text))
+
+
+def search_names(
+    conn: sqlite3.Connection,
+    text: str,
+    leagues: Optional[Sequence[str]] = None,
+    kinds: Optional[Sequence[str]] = None,
+    limit: int = 20,
+) -> List[Dict[str, Any]]:
+    """
+    Search player and team names, hometowns, schools and conferences.
+
+    Args:
+        conn: Database connection
+        text: Typed text; every word must match the start of an indexed word
+        leagues: Leagues to search (default: all)
+        kinds: "players" and/or "teams" (default: both)
+        limit: Maximum number of hits
+
+    Returns:
+        Best hits first, as the source row's columns plus league, kind and
+        rank (lower is better). A player is returned once, for their most
+        recent season.
+    """
+    query = fts_query(text)
+    if not query:
+        return []
+
+    hits = []
+    for league in leagues or LEAGUES:
+        for kind in kinds or KINDS:
+            table = f"{league}_{kind}"
+            weights = ", ".join(
+                [str(NAME_WEIGHT)] + ["1.0"] * (len(SEARCH_COLUMNS[table]) - 1)
+            )
+            seasons = "season_id" in TABLE_COLUMNS[table]
+            order = ", t.season_id DESC" if seasons else ""
+            # Rank inside the FTS table and join only the top hits to content;
+            # among equal ranks later rows, i.e. later seasons, come first
+            cursor = conn.execute(
+                f"SELECT t.*, f.rank FROM ("
+                f"SELECT rowid, rank FROM {table}_fts WHERE {table}_fts MATCH ? "
+                f"AND rank MATCH 'bm25({weights})' ORDER BY rank, rowid DESC LIMIT ?"
+                f") AS f JOIN {table} AS t ON t.id = f.rowid ORDER BY f.rank{order}",
+                (query, limit * _SEASONS_PER_HIT),
+            )
+            columns = [col[0] for col in cursor.description]
+            for row in cursor:
+                hit = dict(zip(columns, row))
+                hit.update(league=league, kind=KINDS[kind])
+                hits.append(hit)
+
+    hits.sort(key=lambda hit: hit["rank"])
+    seen = set()
+    results = []
+    for hit in hits:
+        key = (hit["league"], hit["kind"], hit[f"{hit['kind']}_id"])
+        if key in seen:
+            continue
+        seen.add(key)
+        results.append(hit)
+        if len(results) == limit:
+            break
+    return results
@@ -0,0 +1,114 @@
+"""Incremental standings: recompute only the team-seasons a load touches."""
+
+import sqlite3
+from typing import Iterable, List, Set, Tuple
+
+# (league, season, team_id)
+StandingsKey = Tuple[str, str, str]
+
+# Number of most recent results in the form string, newest first
+FORM_LENGTH = 5
+
+_TEAM_RESULTS = """
+SELECT m.winner_team_id = tm.team_id,
+       CASE WHEN tm.is_home THEN m.home_sets ELSE m.away_sets END,
+       CASE WHEN tm.is_home THEN m.away_sets ELSE m.home_sets END,
+       SUM(CASE WHEN tm.is_home THEN s.home_pts ELSE s.away_pts END),
+       SUM(CASE WHEN tm.is_home THEN s.away_pts ELSE s.home_pts END)
+FROM team_matches AS tm
+JOIN matches AS m ON m.league = tm.league AND m.match_id = tm.match_id
+LEFT JOIN match_sets AS s ON s.league = m.league AND s.match_id = m.match_id
+WHERE tm.team_id = ? AND tm.league = ? AND COALESCE(m.season, '') = ?
+    AND m.winner_team_id IS NOT NULL
+GROUP BY tm.start_time, tm.match_id
+ORDER BY tm.start_time
+"""
+
+
+def touched_keys(
+    conn: sqlite3.Connection, league: str, match_ids: Iterable[str]
+) -> Set[StandingsKey]:
+    """
+    Collect the team-seasons that matches currently count towards.
+
+    Run before and after a load: a reloaded match may move between seasons
+    or teams, and both sides need recomputing.
+    """
+    keys = set()
+    for match_id in match_ids:
+        row = conn.execute(
+            "SELECT COALESCE(season, ''), home_team_id, away_team_id FROM matches "
+            "WHERE league = ? AND match_id = ?",
+            (league, match_id),
+        ).fetchone()
+        if row is None:
+            continue
+        season, home, away = row
+        keys.update((league, season, team) for team in (home, away) if team)
+    return keys
+
+
+def compute_standing(conn: sqlite3.Connection, key: StandingsKey) -> List:
+    """Aggregate one team-season's completed matches into a standings row."""
+    league, season, team_id = key
+    wins = losses = sets_won = sets_lost = points_for = points_against = 0
+    outcomes = []
+
+    for won, own_sets, other_sets, own_pts, other_pts in conn.execute(
+        _TEAM_RESULTS, (team_id, league, season)
+    ):
+        wins += bool(won)
+        losses += not won
+        sets_won += own_sets or 0
+        sets_lost += other_sets or 0
+        points_for += own_pts or 0
+        points_against += other_pts or 0
+        outcomes.append("W" if won else "L")
+
+    form = "".join(reversed(outcomes[-FORM_LENGTH:]))
+    return [wins, losses, sets_won, sets_lost, points_for, points_against, form]
+
+
+def refresh_standings(conn: sqlite3.Connection, keys: Iterable[StandingsKey]) -> int:
+    """
+    Recompute the standings rows for the given team-seasons.
+
+    Teams left without a completed match in the season lose their row.
+
+    Returns:
+        Number of team-seasons recomputed
+    """
+    count = 0
+    for key in keys:
+        league, season, team_id = key
+        totals = compute_standing(conn, key)
+        count += 1
+        if totals[0] + totals[1] == 0:
+            conn.execute(
+                "DELETE FROM standings WHERE league = ? AND season = ? AND team_id = ?",
+                key,
+            )
+            continue
+
+        conference = conn.execute(
+            f"SELECT conference FROM {league}_teams WHERE team_id = ?", (team_id,)
+        ).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO standings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (league, season, team_id, conference[0] if conference else None, *totals),
+        )
+    return count
+
+
+def rebuild_standings(conn: sqlite3.Connection) -> int:
+    """Recompute standings for every team-season with a completed match."""
+    conn.execute("DELETE FROM standings")
+    keys = conn.execute(
+        """
+        SELECT DISTINCT tm.league, COALESCE(m.season, ''), tm.team_id
+        FROM team_matches AS tm
+        JOIN matches AS m ON m.league = tm.league AND m.match_id = tm.match_id
+        WHERE m.winner_team_id IS NOT NULL
+        """
+    ).fetchall()
+    return refresh_standings(conn, [tuple(key) for key in keys])
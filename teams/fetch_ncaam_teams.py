@@ -1,5 +1,3 @@
-from typing import List, Dict, Any
-
 import pandas as pd
 from pathlib import Path
 
@@ -8,7 +6,7 @@ img_csv_path = data_dir / "ncaa_schools_imgs.csv"
 img_conf_path = data_dir / "conference_short_mapping_m.csv"
 
 
-def fetch_ncaam_teams() -> List[Dict[str, Any]]:
+def fetch_ncaam_teams() -> pd.DataFrame:
     # Get team code and short name
     df_team_codes = (
         pd.read_html("https://stats.ncaa.org/game_upload/team_codes")[0]
@@ -68,7 +66,8 @@ def fetch_ncaam_teams() -> List[Dict[str, Any]]:
             "level",
             "conference_short",
         ]
-    ].to_dict(orient="records")
+    ]
 
 
-print(fetch_ncaam_teams())
+if __name__ == "__main__":
+    print(fetch_ncaam_teams())
@@ -0,0 +1,125 @@
+"""
+Synthetic NCAA roster corpus and the per-row normalization path that
+vbdb_fetch.rosters replaced, kept as the reference its output is checked
+against. benchmarks/bench_rosters.py times both paths on the same corpus.
+"""
+
+import random
+
+import pandas as pd
+
+from vbdb_fetch.rosters import (
+    combine_rosters,
+    normalize_rosters,
+    roster_headers,
+    teams_by_id,
+)
+
+# Heading variants seen across stats.ncaa.org roster pages
+HEADER_SETS = [
+    ["#", "Name", "Position", "Height", "Class", "Hometown", "High School"],
+    ["No.", "Player", "Pos", "Ht", "Yr", "Home Town", "Previous School"],
+    ["Jersey", "Name", "Pos.", "Ht.", "Cl.", "Hometown", "High School"],
+]
+
+
+def make_tables(n_players, per_team, seed=5):
+    """Generate teams_df and per-team roster tables as the crawler builds them."""
+    rng = random.Random(seed)
+    n_teams = n_players // per_team
+    teams_df = pd.DataFrame(
+        {
+            "team_id": [str(1000 + t) for t in range(n_teams)],
+            "name": [f"Team {t}" for t in range(n_teams)],
+            "name_short": [f"T{t}" for t in range(n_teams)],
+        }
+    )
+    tables = []
+    for t in range(n_teams):
+        headings = HEADER_SETS[t % len(HEADER_SETS)]
+        rows = [
+            [
+                str(k),
+                f"Player {t}-{k}",
+                rng.choice(["OH", "S", "L", "MB", "OPP"]),
+                f"6-{rng.randint(0, 8)}",
+                rng.choice(["Fr.", "So.", "Jr.", "Sr."]),
+                "Somewhere, CA",
+                "Some High School",
+                f"/players/{t * 100 + k}" if k % 10 else None,
+            ]
+            for k in range(per_team)
+        ]
+        tables.append((str(1000 + t), headings, rows))
+    return teams_df, tables
+
+
+def legacy_normalize(tables, teams_df):
+    """The previous path: per-team filtering, then per-row column detection."""
+    frames = []
+    for team_id, headings, rows in tables:
+        team = teams_df[teams_df["team_id"] == team_id].iloc[0]
+        roster_df = pd.DataFrame(rows, columns=headings + ["Player URL"])
+        roster_df["team_id"] = team_id
+        roster_df["year"] = "2025-26"
+        roster_df["team_name"] = team.get("name")
+        roster_df["team_short"] = team.get("name_short")
+        roster_df["season_id"] = f"/teams/{team_id}"
+        frames.append(roster_df)
+    roster_df = pd.concat(frames, sort=False).reset_index(drop=True)
+
+    def find(row_columns, candidates, default):
+        return next((c for c in row_columns if c.lower() in candidates), default)
+
+    players = []
+    for _, row in roster_df.iterrows():
+        cols = roster_df.columns
+        name_col = find(cols, ["name", "player"], "Name")
+        jersey_col = find(cols, ["#", "no.", "jersey", "number"], "#")
+        position_col = find(cols, ["position", "pos", "pos."], "Position")
+        height_col = find(cols, ["height", "ht", "ht."], "Height")
+        hometown_col = find(cols, ["hometown", "home town"], "Hometown")
+        school_col = find(cols, ["high school", "previous school"], "High School")
+        class_col = find(cols, ["class", "yr", "cl.", "year"], "Class")
+        url = row.get("Player URL")
+        url = url if isinstance(url, str) else ""
+        players.append(
+            {
+                "name": row.get(name_col, ""),
+                "jersey": row.get(jersey_col, ""),
+                "position": row.get(position_col, ""),
+                "height": row.get(height_col, ""),
+                "hometown": row.get(hometown_col, ""),
+                "team": row.get("team_name", ""),
+                "team_short": row.get("team_short", ""),
+                "profile_url": f"https://stats.ncaa.org{url}" if url else "",
+                "player_id": url.split("/")[-1] if url else "",
+                "high_school": row.get(school_col, ""),
+                "class_year": row.get(class_col, ""),
+                "data_source": "NCAA",
+                "team_id": row.get("team_id", ""),
+                "year": row.get("year", ""),
+                "season_id": row.get("season_id", "").split("/")[-1],
+            }
+        )
+    return players
+
+
+def vectorized_normalize(tables, teams_df):
+    """The current path: headings mapped per table, columns derived at once."""
+    teams = teams_by_id(teams_df.to_dict("records"))
+    roster_tables = [
+        (
+            roster_headers(headings) + ["Player URL"],
+            rows,
+            (
+                team_id,
+                "2025-26",
+                teams[team_id]["name"],
+                teams[team_id]["name_short"],
+                f"/teams/{team_id}",
+            ),
+        )
+        for team_id, headings, rows in tables
+    ]
+    return normalize_rosters(combine_rosters(roster_tables))
@@ -0,0 +1,63 @@
+import logging
+
+from vbdb_fetch.aliases import LEAGUES, TeamResolver, normalize_name
+from vbdb_fetch.schema import TABLE_COLUMNS
+
+
+def test_normalize_name_folds_spelling_variants():
+    for name in ("Saint Mary's (CA)", "saint-marys-ca", "SAINT MARY'S CA"):
+        assert normalize_name(name) == "saint marys ca"
+    assert normalize_name("Texas A&M") == "texas a and m"
+    assert normalize_name("Québec") == "quebec"
+    assert normalize_name(None) == ""
+
+
+def resolver():
+    team_ids = {league: set() for league in LEAGUES}
+    team_ids["ncaam"] = {"10", "20"}
+    aliases = {("ncaam", "team ten"): "10", ("ncaam", "ten"): "10"}
+    return TeamResolver(aliases, team_ids)
+
+
+def test_resolve_prefers_known_ids_then_aliases():
+    teams = resolver()
+    assert teams.resolve("ncaam", "Anything", "20") == "20"
+    assert teams.resolve("ncaam", "Team Ten", "team-ten") == "10"
+    assert teams.resolve("ncaam", None, "TEN") == "10"
+
+
+def test_resolve_logs_each_unknown_team_once(caplog):
+    teams = resolver()
+    with caplog.at_level(logging.WARNING):
+        assert teams.resolve("ncaam", "Nobody U", "nobody") == "nobody"
+        assert teams.resolve("ncaam", "Nobody U", "nobody") == "nobody"
+        assert teams.resolve("ncaam", "", "") is None
+    assert len(caplog.records) == 1
+    assert teams.unresolved == {("ncaam", "Nobody U")}
+
+
+def test_add_lets_team_rows_replace_weaker_aliases():
+    teams = resolver()
+    teams.add([("ncaam", "ten", "30", "observed")])
+    assert teams.resolve("ncaam", "Ten") == "10"
+    teams.add([("ncaam", "ten", "30", "name")])
+    assert teams.resolve("ncaam", "Ten") == "30"
+    assert "30" in teams.team_ids["ncaam"]
+
+
+def test_resolve_rows_reports_names_seen_next_to_known_teams():
+    columns = TABLE_COLUMNS["ncaam_results"]
+    row = dict.fromkeys(columns)
+    row.update(
+        match_id="m1",
+        home_team_id="x",
+        home_team_name="Team Ten",
+        away_team_id="20",
+        away_team_name="Team 20",
+    )
+    rows, observed = resolver().resolve_rows(
+        "ncaam", [tuple(row[col] for col in columns)], columns
+    )
+    home, away = columns.index("home_team_id"), columns.index("away_team_id")
+    assert (rows[0][home], rows[0][away]) == ("10", "20")
+    assert observed == [("ncaam", "team 20", "20", "observed")]
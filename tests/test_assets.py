@@ -0,0 +1,45 @@
+import sqlite3
+
+from vbdb_fetch.assets import (
+    SVG,
+    asset_id,
+    assets_query,
+    inline_asset,
+    prune_assets,
+    split_inline_images,
+)
+from vbdb_fetch.migrations import split_statements
+from vbdb_fetch.schema import get_schema_sql
+
+LOGO = '<svg viewBox="0 0 10 10"><path fill="#fff"/></svg>'
+
+
+def test_inline_asset_only_takes_svg_markup():
+    data = LOGO.encode()
+    assert inline_asset("  " + LOGO + "\n") == (asset_id(data), SVG, data)
+    assert inline_asset("https://example.com/logo.png") is None
+    assert inline_asset(None) is None
+
+
+def test_split_inline_images_stores_each_logo_once():
+    rows = [("a", LOGO, "x"), ("b", LOGO, "y"), ("c", "https://e.com/c.png", "z")]
+    out, assets = split_inline_images(rows, 1)
+
+    logo_id = asset_id(LOGO.encode())
+    assert out == [("a", logo_id, "x"), ("b", logo_id, "y"), rows[2]]
+    assert assets == [(logo_id, SVG, LOGO.encode())]
+
+
+def test_prune_assets_drops_unreferenced_logos():
+    conn = sqlite3.connect(":memory:")
+    for statement in split_statements(get_schema_sql()):
+        conn.execute(statement)
+    rows, assets = split_inline_images([("a", "A", LOGO), ("b", "B", LOGO)], 2)
+    conn.executemany(assets_query(), assets)
+    conn.executemany(
+        "INSERT INTO lovb_teams (team_id, name, img) VALUES (?, ?, ?)", rows
+    )
+
+    assert prune_assets(conn) == 0
+    conn.execute("UPDATE lovb_teams SET img = NULL")
+    assert prune_assets(conn) == 1
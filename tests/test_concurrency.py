@@ -0,0 +1,107 @@
+import asyncio
+import threading
+
+import pytest
+
+from vbdb_fetch import AsyncDatabase, init_db
+from vbdb_fetch.maintenance import AUTO_VACUUM_INCREMENTAL
+from vbdb_fetch.migrations import SCHEMA_VERSION
+
+
+@pytest.fixture(params=["memory", "file"])
+def db(request, tmp_path):
+    if request.param == "memory":
+        db = init_db(in_memory=True, concurrent=True)
+    else:
+        db = init_db(tmp_path / "concurrent.db", concurrent=True)
+    yield db
+    db.close()
+
+
+def count(db, table):
+    db.execute(f"SELECT COUNT(*) AS n FROM {table}")
+    return db.fetchall()[0]["n"]
+
+
+def test_writes_from_many_threads_all_land(db):
+    def load(worker):
+        for i in range(20):
+            db.add_ncaam_teams([{"team_id": f"{worker}-{i}", "name": f"T{worker}-{i}"}])
+
+    threads = [threading.Thread(target=load, args=(w,)) for w in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert count(db, "ncaam_teams") == 160
+
+
+def test_a_failing_write_only_fails_its_own_future(db):
+    # Hold the writer so the next three writes are grouped into one batch
+    release = threading.Event()
+    held = db.submit(lambda conn: release.wait(), exclusive=True)
+
+    def insert(team_id):
+        return lambda conn: conn.execute(
+            "INSERT INTO ncaam_teams (team_id, name) VALUES (?, ?)", (team_id, "T")
+        ).rowcount
+
+    def fail(conn):
+        raise ValueError("bad row")
+
+    futures = [db.submit(insert("a")), db.submit(fail), db.submit(insert("b"))]
+    release.set()
+    held.result()
+
+    assert futures[0].result() == 1
+    with pytest.raises(ValueError, match="bad row"):
+        futures[1].result()
+    assert futures[2].result() == 1
+    assert count(db, "ncaam_teams") == 2
+
+
+def test_reads_see_committed_writes(db):
+    db.add_ncaam_teams([{"team_id": "10", "name": "Ten"}])
+    db.execute("SELECT name FROM ncaam_teams WHERE team_id = ?", ("10",))
+    assert db.fetchall() == [{"name": "Ten"}]
+
+    # Reads from another thread use their own connection
+    names = []
+    thread = threading.Thread(
+        target=lambda: names.append(count(db, "ncaam_teams")), daemon=True
+    )
+    thread.start()
+    thread.join()
+    assert names == [1]
+
+
+def test_pragma_reads_return_rows(db):
+    db.execute("PRAGMA user_version")
+    assert list(db.fetchall()[0].values()) == [SCHEMA_VERSION]
+
+
+def test_a_fresh_file_keeps_incremental_auto_vacuum_under_wal(tmp_path):
+    db = init_db(tmp_path / "fresh.db", concurrent=True)
+    try:
+        db.execute("PRAGMA auto_vacuum")
+        assert list(db.fetchall()[0].values()) == [AUTO_VACUUM_INCREMENTAL]
+        db.execute("PRAGMA journal_mode")
+        assert list(db.fetchall()[0].values()) == ["wal"]
+    finally:
+        db.close()
+
+
+def test_async_database_round_trip(tmp_path):
+    async def run():
+        async with AsyncDatabase(init_db(tmp_path / "async.db", concurrent=True)) as db:
+            assert await db.add_ncaam_teams([{"team_id": "10", "name": "Ten"}]) == 1
+            await db.write(
+                lambda conn: conn.execute(
+                    "UPDATE ncaam_teams SET conference = 'MIVA' WHERE team_id = '10'"
+                )
+            )
+            await db.flush()
+            return await db.fetch("SELECT team_id, conference FROM ncaam_teams")
+
+    assert asyncio.run(run()) == [{"team_id": "10", "conference": "MIVA"}]
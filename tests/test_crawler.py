@@ -0,0 +1,64 @@
+import threading
+
+from vbdb_fetch import crawler
+from vbdb_fetch.crawler import TokenBucket, percentile
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_a_burst_then_paces(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawler.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(crawler.time, "sleep", clock.sleep)
+    bucket = TokenBucket(rate=2.0, burst=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == 0.5
+    assert bucket.acquire() == 0.5
+    assert clock.now == 1.0
+
+
+def test_token_bucket_refills_up_to_burst(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawler.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(crawler.time, "sleep", clock.sleep)
+    bucket = TokenBucket(rate=1.0, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60.0
+    assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.acquire() == 1.0
+
+
+def test_token_bucket_hands_out_one_token_per_thread():
+    bucket = TokenBucket(rate=1000.0, burst=5)
+    waits = []
+    threads = [
+        threading.Thread(target=lambda: waits.append(bucket.acquire()))
+        for _ in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(waits) == 20
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 3.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.99) == 4.0
@@ -0,0 +1,46 @@
+from datetime import date
+
+from vbdb_fetch.dates import (
+    lovb_season,
+    ncaa_academic_year,
+    parse_display_start,
+    parse_iso_start,
+    parse_ncaa_start,
+)
+
+
+def test_parse_ncaa_start_converts_eastern_time_to_utc():
+    assert parse_ncaa_start("09/01/2024", "19:00") == "2024-09-01T23:00:00Z"
+    assert parse_ncaa_start("01/10/2025", "7:00 PM") == "2025-01-11T00:00:00Z"
+
+
+def test_parse_ncaa_start_without_a_time_is_local_midnight():
+    assert parse_ncaa_start("09/05/2024", "") == "2024-09-05T04:00:00Z"
+    assert parse_ncaa_start("01/20/2025", "") == "2025-01-20T05:00:00Z"
+    assert parse_ncaa_start("TBA", "19:00") is None
+
+
+def test_parse_iso_start_normalizes_to_utc_seconds():
+    assert parse_iso_start("2025-01-09T00:00:00.000000Z") == "2025-01-09T00:00:00Z"
+    assert parse_iso_start("2025-01-09T01:00:00+01:00") == "2025-01-09T00:00:00Z"
+    assert parse_iso_start("") is None
+
+
+def test_parse_display_start_takes_the_year_from_the_season():
+    assert parse_display_start("Sat, Jan 11 7:00 PM", "2025") == "2025-01-12T00:00:00Z"
+    assert parse_display_start("Sat, Apr 12", "2025") == "2025-04-12T04:00:00Z"
+    # Preseason dates fall in the year before the season
+    assert parse_display_start("Sat, Dec 14", "2025") == "2024-12-14T05:00:00Z"
+    assert parse_display_start("Date not found", "2025") is None
+    assert parse_display_start("Sat, Jan 11", None) is None
+
+
+def test_lovb_season_turns_over_in_july():
+    assert lovb_season(date(2025, 6, 30)) == "2025"
+    assert lovb_season(date(2025, 7, 1)) == "2026"
+
+
+def test_ncaa_academic_year_starts_in_july():
+    assert ncaa_academic_year(date(2025, 6, 30)) == "2024-25"
+    assert ncaa_academic_year(date(2025, 7, 1)) == "2025-26"
+    assert ncaa_academic_year(date(2099, 9, 1)) == "2099-00"
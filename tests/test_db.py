@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from vbdb_fetch import init_db
+from vbdb_fetch.db import iter_rows
+
+COLUMNS = ("team_id", "name", "img")
+
+
+def test_iter_rows_orders_every_input_kind():
+    expected = [("a", "A", None), ("b", "B", "x.png")]
+    frame = pd.DataFrame(
+        {"img": [None, "x.png"], "name": ["A", "B"], "team_id": ["a", "b"]},
+        dtype=object,
+    )
+    dicts = [
+        {"name": "A", "team_id": "a"},
+        {"team_id": "b", "name": "B", "img": "x.png"},
+    ]
+
+    assert list(iter_rows(frame, COLUMNS)) == expected
+    assert list(iter_rows(dicts, COLUMNS, required=("team_id",))) == expected
+    assert list(iter_rows(expected, COLUMNS, COLUMNS)) == expected
+    assert list(iter_rows([], COLUMNS)) == []
+
+
+def test_iter_rows_rejects_unknown_dict_keys():
+    with pytest.raises(ValueError, match="teamid"):
+        iter_rows([{"teamid": "a", "name": "A"}], COLUMNS)
+
+
+def test_iter_rows_rejects_dicts_missing_required_keys():
+    with pytest.raises(ValueError, match="team_id"):
+        iter_rows([{"name": "A"}], COLUMNS, required=("team_id",))
+
+
+def test_iter_rows_rejects_bad_tuples():
+    with pytest.raises(ValueError):
+        iter_rows([("a", "A")], COLUMNS)
+    with pytest.raises(ValueError):
+        iter_rows([("A", "a", None)], COLUMNS, ("name", "team_id", "img"))
+
+
+def test_writers_reject_misspelled_columns():
+    db = init_db(in_memory=True)
+    try:
+        with pytest.raises(ValueError):
+            db.add_ncaam_teams([{"team_id": "10", "name": "Ten", "confrence": "MIVA"}])
+        assert db.add_ncaam_teams([{"team_id": "10", "name": "Ten"}]) == 1
+    finally:
+        db.close()
+
+
+def test_players_without_ids_keep_a_row_each():
+    db = init_db(in_memory=True)
+    try:
+        db.add_ncaam_teams([{"team_id": "10", "name": "Ten"}])
+        roster = [
+            {"player_id": None, "name": "Jane Doe", "team_id": "10", "season_id": "s1"},
+            {"player_id": "", "name": "Ann Roe", "team_id": "10", "season_id": "s1"},
+        ]
+        db.add_ncaam_players(roster)
+        db.add_ncaam_players(roster)
+        assert [
+            row[0] for row in db.execute("SELECT player_id FROM ncaam_players ORDER BY 1")
+        ] == ["ann-roe", "jane-doe"]
+    finally:
+        db.close()
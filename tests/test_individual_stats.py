@@ -0,0 +1,41 @@
+from schedule.fetch_ncaa_individual_stats import parse_individual_stats, pending_matches
+from vbdb_fetch import init_db
+
+TABLE = """
+<table>
+  <thead><tr><th>#</th><th>Name</th><th>Kills</th></tr></thead>
+  <tbody>
+    <tr><td>7</td><td><a href="/players/123">Doe, Jane</a></td><td>12</td></tr>
+  </tbody>
+</table>
+"""
+
+
+def test_two_player_tables_are_assigned_to_the_teams():
+    rows = parse_individual_stats(
+        f"<html>{TABLE}{TABLE}</html>", "ncaaw", "m1", "10", "20"
+    )
+    assert [(row["team_id"], row["player_id"], row["kills"]) for row in rows] == [
+        ("10", "123", 12),
+        ("20", "123", 12),
+    ]
+
+
+def test_pages_without_two_player_tables_are_skipped():
+    for tables in (TABLE, TABLE * 3):
+        html = f"<html>{tables}</html>"
+        assert parse_individual_stats(html, "ncaaw", "m1", "10", "20") == []
+
+
+def test_empty_pages_of_completed_matches_are_not_fetched_again(tmp_path):
+    db = init_db(tmp_path / "stats.db")
+    db.add_ncaaw_results(
+        [
+            {"match_id": "m1", "individual_stats": "u1", "status": "completed"},
+            {"match_id": "m2", "individual_stats": "u2", "status": "completed"},
+        ]
+    )
+    db.add_empty_match_pages([("ncaaw", "individual_stats", "m1", "2025-01-01")])
+
+    assert [match["match_id"] for match in pending_matches(db, "ncaaw")] == ["m2"]
+    db.close()
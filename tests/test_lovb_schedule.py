@@ -0,0 +1,34 @@
+import schedule.fetch_lovb_schedule as lovb
+from vbdb_fetch import init_db
+
+STATS = "https://stats.example/team-stats/42"
+SCOREBOARD = "https://stats.example/scoreboard/42"
+
+
+def match(url, score="3-1 [25-20, 25-20, 20-25, 25-20]"):
+    return {
+        "match_url": url, "score": score, "match_id": "", "team_stats": "",
+        "scoreboard": "",
+    }  # fmt: skip
+
+
+def test_only_resolved_iframes_of_completed_matches_are_cached(tmp_path, monkeypatch):
+    details = {"https://lovb.com/a": ("42", STATS, SCOREBOARD)}
+    monkeypatch.setattr(
+        lovb, "resolve_match_details", lambda crawler, url: details.get(url)
+    )
+    db = init_db(tmp_path / "lovb.db")
+    matches = [
+        match("https://lovb.com/a"),
+        match("https://lovb.com/no-iframe"),
+        match("https://lovb.com/upcoming", score=""),
+    ]
+
+    assert lovb.add_match_details(matches, db, max_workers=2) == 3
+    assert matches[0]["match_id"] == "42"
+    assert matches[1]["match_id"] == ""
+    assert db.match_details("lovb") == details
+
+    # The page without an iframe is asked for again on the next run
+    assert lovb.add_match_details([match("https://lovb.com/no-iframe")], db) == 1
+    db.close()
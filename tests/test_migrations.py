@@ -0,0 +1,242 @@
+"""Migrating a pre-versioning database must reach the same schema as a fresh one."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from vbdb_fetch import init_db
+from vbdb_fetch.assets import asset_id
+from vbdb_fetch.migrations import SCHEMA_VERSION, get_version, migrate
+
+BASELINE_SCHEMA = Path(__file__).parent / "data" / "baseline_schema.sql"
+
+NCAAW_SCORE = "3-1 [25-20, 22-25, 25-10, 25-23]"
+LOVB_SCORE = "3-2 [25-20, 20-25, 25-23, 22-25, 15-13]"
+LOGO = '<svg viewBox="0 0 10 10"><path fill="#fff"/></svg>'
+
+
+def seed_baseline(path: Path) -> None:
+    """Create a baseline database holding the rows older builds left behind."""
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA.read_text())
+    conn.executemany(
+        "INSERT INTO ncaaw_results (match_id, score, home_team_id, away_team_id, "
+        "date, time, status, year, home_team_name, away_team_name) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("1", NCAAW_SCORE, "10", "20", "09/01/2024", "19:00", "completed",
+             "2024", "B", "A"),
+            ("1", NCAAW_SCORE, "10", "20", "09/01/2024", "19:00", "completed",
+             "2024", "B", "A"),
+            ("2", "", "20", "10", "09/05/2024", "", "unknown", "2024", "A", "B"),
+            ("", "x", "", "", "", "", "", "", "", ""),
+        ],
+    )  # fmt: skip
+    conn.executemany(
+        "INSERT INTO ncaam_players (player_id, name, team_id, season_id) "
+        "VALUES (?, ?, ?, ?)",
+        [("p1", "P1", "10", "s1"), ("p1", "P1", "10", "s1"),
+         ("p2", "P2", "10", "s1"), ("p1", "P1", "10", "s2"),
+         (None, "Jane Doe", "10", "s1"), ("", "Ann Roe", "10", "s1")],
+    )  # fmt: skip
+    conn.executemany(
+        "INSERT INTO ncaam_teams (team_id, name, conference) VALUES (?, ?, ?)",
+        [("10", "Team Ten", "MIVA"), ("20", "Team Twenty", "MIVA")],
+    )
+    conn.executemany(
+        "INSERT INTO ncaam_results (match_id, date, time, home_team_id, "
+        "away_team_id, home_team_name, away_team_name, score, year, status) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            ("m1", "01/10/2025", "19:00", "10", "20", "Team Ten", "Team Twenty",
+             "1-3 [20-25, 25-22, 20-25, 21-25]", "2025", "completed"),
+            ("m2", "01/20/2025", "", "20", "10", "Team Twenty", "Team Ten", "",
+             "2025", "unknown"),
+        ],
+    )  # fmt: skip
+    conn.execute(
+        "INSERT INTO pvf_results (pvf_match_id, date, home_team_id, away_team_id, "
+        "home_team_name, away_team_name, score, status, season_id) "
+        "VALUES ('99', '2025-01-09T00:00:00.000000Z', 't1', 't2', 'T1', 'T2', "
+        "'3-1', 'completed', '3')"
+    )
+    conn.executemany(
+        "INSERT INTO lovb_teams (team_id, name, img) VALUES (?, ?, ?)",
+        [("lovb-austin-volleyball", "LOVB Austin", LOGO),
+         ("lovb-houston-volleyball", "LOVB Houston", LOGO)],
+    )  # fmt: skip
+    conn.execute(
+        "INSERT INTO lovb_results (match_id, date, home_team_id, away_team_id, "
+        "home_team_name, away_team_name, score) VALUES ('l1', 'Sat, Jan 11', "
+        "'lovb-austin-volleyball', 'lovb-houston-volleyball', 'LOVB Austin', "
+        f"'LOVB Houston', '{LOVB_SCORE}')"
+    )
+    conn.commit()
+    conn.close()
+
+
+def fetch(conn: sqlite3.Connection, sql: str) -> list:
+    """Rows of a query as plain tuples."""
+    return [tuple(row) for row in conn.execute(sql)]
+
+
+def describe(conn: sqlite3.Connection) -> dict:
+    """Every table's columns and unique keys, and every index and trigger."""
+    out = {}
+    objects = conn.execute(
+        "SELECT type, name, tbl_name FROM sqlite_master "
+        "WHERE name NOT LIKE 'sqlite_%'"
+    ).fetchall()
+    for kind, name, table in objects:
+        if kind == "table":
+            out[(kind, name)] = [
+                (row[1], row[2], row[3], row[5])
+                for row in conn.execute(f"PRAGMA table_xinfo('{name}')")
+            ]
+            out[("unique", name)] = sorted(
+                tuple(col[2] for col in conn.execute(f"PRAGMA index_info('{idx[1]}')"))
+                for idx in conn.execute(f"PRAGMA index_list('{name}')")
+                if idx[2]
+            )
+        elif kind == "index":
+            out[(kind, name)] = (
+                table,
+                [row[2] for row in conn.execute(f"PRAGMA index_info('{name}')")],
+            )
+        else:
+            out[(kind, name)] = table
+    return out
+
+
+@pytest.fixture
+def migrated(tmp_path):
+    path = tmp_path / "legacy.db"
+    seed_baseline(path)
+    db = init_db(path)
+    yield db.conn
+    db.close()
+
+
+@pytest.fixture
+def fresh(tmp_path):
+    db = init_db(tmp_path / "fresh.db")
+    yield db.conn
+    db.close()
+
+
+def test_migrated_schema_matches_fresh(migrated, fresh):
+    assert get_version(migrated) == get_version(fresh) == SCHEMA_VERSION
+    before, after = describe(migrated), describe(fresh)
+    assert {k: v for k, v in before.items() if after.get(k) != v} == {}
+    assert set(before) == set(after)
+
+
+def test_migration_keeps_and_dedupes_rows(migrated):
+    assert fetch(
+        migrated,
+        "SELECT match_id, home_sets, away_sets, winner_team_id FROM ncaaw_results "
+        "ORDER BY match_id",
+    ) == [("1", 3, 1, "10"), ("2", None, None, None)]
+    assert fetch(
+        migrated, "SELECT player_id, season_id FROM ncaam_players ORDER BY 1, 2"
+    ) == [
+        ("ann-roe", "s1"), ("jane-doe", "s1"), ("p1", "s1"), ("p1", "s2"),
+        ("p2", "s1"),
+    ]  # fmt: skip
+
+
+def test_migration_parses_scores_and_fills_matches(migrated):
+    # NCAA men's and LOVB list the away side first
+    assert fetch(
+        migrated,
+        "SELECT home_sets, away_sets, winner_team_id FROM ncaam_results "
+        "WHERE match_id = 'm1'",
+    ) == [(3, 1, "10")]
+    assert fetch(
+        migrated,
+        "SELECT home_pts, away_pts FROM match_sets "
+        "WHERE league = 'lovb' AND match_id = 'l1' AND set_no = 5",
+    ) == [(13, 15)]
+    assert fetch(
+        migrated,
+        "SELECT league, match_id, season FROM matches WHERE league != 'lovb' "
+        "ORDER BY league, match_id",
+    ) == [
+        ("ncaam", "m1", "2025"),
+        ("ncaam", "m2", "2025"),
+        ("ncaaw", "1", "2024"),
+        ("ncaaw", "2", "2024"),
+        ("pvf", "99", "3"),
+    ]
+    assert fetch(
+        migrated,
+        "SELECT wins, losses FROM standings WHERE league = 'ncaam' AND team_id = '10'",
+    ) == [(1, 0)]
+
+
+def test_migration_moves_inline_logos_into_assets(migrated):
+    logo_id = asset_id(LOGO.encode())
+    assert fetch(migrated, "SELECT DISTINCT img FROM lovb_teams") == [(logo_id,)]
+    assert fetch(migrated, "SELECT asset_id, data FROM assets") == [
+        (logo_id, LOGO.encode())
+    ]
+
+
+def test_migration_records_lovb_seasons_and_utc_start_times(migrated):
+    assert fetch(
+        migrated,
+        "SELECT league, match_id, start_time, season FROM matches "
+        "WHERE match_id IN ('l1', 'm2') ORDER BY league",
+    ) == [
+        ("lovb", "l1", "2025-01-11T05:00:00Z", "2025"),
+        ("ncaam", "m2", "2025-01-20T05:00:00Z", "2025"),
+    ]
+    assert fetch(
+        migrated,
+        "SELECT team_id, start_time FROM team_matches WHERE match_id = 'l1' "
+        "ORDER BY team_id",
+    ) == [
+        ("lovb-austin-volleyball", "2025-01-11T05:00:00Z"),
+        ("lovb-houston-volleyball", "2025-01-11T05:00:00Z"),
+    ]
+
+
+def test_lovb_years_taken_from_the_load_date_are_repaired(migrated):
+    # A version 17 database whose LOVB rows were dated in a later year
+    migrated.execute("ALTER TABLE lovb_results DROP COLUMN season")
+    migrated.execute("ALTER TABLE team_ratings DROP COLUMN wins")
+    migrated.execute("ALTER TABLE team_ratings DROP COLUMN set_diff")
+    migrated.execute("UPDATE lovb_results SET start_time = '2027-01-11'")
+    migrated.execute(
+        "UPDATE matches SET start_time = '2027-01-11', season = '2027' "
+        "WHERE league = 'lovb'"
+    )
+    migrated.execute(
+        "UPDATE team_matches SET start_time = '2027-01-11' WHERE league = 'lovb'"
+    )
+    migrated.execute(
+        "INSERT INTO team_ratings VALUES "
+        "('lovb', '2027', '2027-01-11', 'lovb-austin-volleyball', 1, 1500, 0, 0)"
+    )
+    migrated.execute("PRAGMA user_version = 17")
+    migrated.commit()
+
+    assert migrate(migrated) == SCHEMA_VERSION - 17
+    assert fetch(
+        migrated, "SELECT start_time, season FROM matches WHERE league = 'lovb'"
+    ) == [("2025-01-11T05:00:00Z", "2025")]
+    assert fetch(
+        migrated,
+        "SELECT DISTINCT start_time FROM team_matches WHERE league = 'lovb'",
+    ) == [("2025-01-11T05:00:00Z",)]
+    assert fetch(
+        migrated,
+        "SELECT DISTINCT season FROM standings WHERE league = 'lovb'",
+    ) == [("2025",)]
+    assert fetch(migrated, "SELECT * FROM team_ratings WHERE league = 'lovb'") == []
+
+
+def test_migrating_a_current_database_is_a_no_op(migrated):
+    assert migrate(migrated) == 0
+    assert get_version(migrated) == SCHEMA_VERSION
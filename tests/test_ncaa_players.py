@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import players.fetch_ncaa_players as ncaa_players
+from players.fetch_ncaaw_players import fetch_ncaaw_players
+from vbdb_fetch import init_db
+from vbdb_fetch.dates import ncaa_academic_year
+
+# The team's latest season is an older academic year
+HISTORY = """
+<select><option value="10">Team Ten</option></select>
+<table><tr><td><a href="/teams/555">2022-23</a></td></tr></table>
+"""
+ROSTER = """
+<table id="roster_555">
+  <thead><tr><th>#</th><th>Name</th></tr></thead>
+  <tbody>
+    <tr><td>7</td><td><a href="/players/123">Jane Doe</a></td></tr>
+    <tr><td>9</td><td>Ann Roe</td></tr>
+  </tbody>
+</table>
+"""
+PAGES = {
+    "https://stats.ncaa.org/teams/history/WVB/10": HISTORY,
+    "https://stats.ncaa.org/teams/555/roster": ROSTER,
+}
+
+
+class FakeCrawler:
+    """Serves PAGES and records every URL requested."""
+
+    requested = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def get(self, url):
+        self.requested.append(url)
+        return SimpleNamespace(status_code=200, content=PAGES[url].encode())
+
+    def map(self, fn, items):
+        return [fn(item) for item in items]
+
+    def log_summary(self, label):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def test_rosters_are_read_and_older_seasons_stay_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(ncaa_players, "Crawler", FakeCrawler)
+    db = init_db(tmp_path / "players.db")
+    db.add_ncaaw_teams([{"team_id": "10", "name": "Team Ten"}])
+
+    players = fetch_ncaaw_players(db)
+    assert players[["name", "jersey", "player_id", "season_id"]].values.tolist() == [
+        ["Jane Doe", "7", "123", "555"],
+        ["Ann Roe", "9", "ann-roe", "555"],
+    ]
+    assert db.team_seasons("WVB", ncaa_academic_year()) == {"10": "/teams/555"}
+
+    # The next build reads the season from the cache
+    FakeCrawler.requested.clear()
+    fetch_ncaaw_players(db)
+    assert FakeCrawler.requested == ["https://stats.ncaa.org/teams/555/roster"]
+    db.close()
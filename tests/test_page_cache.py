@@ -0,0 +1,95 @@
+import gzip
+
+from vbdb_fetch import page_cache, pages
+from vbdb_fetch.browser import RenderedPage
+from vbdb_fetch.page_cache import PageCache, configure_page_cache, shared_page_cache
+
+URL = "https://www.lovb.com/schedule"
+
+
+def test_put_then_get(tmp_path):
+    cache = PageCache(tmp_path)
+    assert cache.get(URL) is None
+    assert cache.put(URL, "<html>a</html>")
+
+    page = cache.get(URL)
+    assert (page.url, page.html) == (URL, "<html>a</html>")
+
+
+def test_put_reports_whether_the_content_changed(tmp_path):
+    cache = PageCache(tmp_path)
+    assert cache.put(URL, "<html>a</html>")
+    assert not cache.put(URL, "<html>a</html>")
+    assert cache.put(URL, "<html>b</html>")
+    assert list(tmp_path.iterdir()) == [cache._path(URL)]
+
+
+def test_ttl_expires_pages(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(page_cache.time, "time", lambda: now[0])
+    cache = PageCache(tmp_path, ttl=60)
+    cache.put(URL, "<html/>")
+
+    now[0] += 59
+    assert cache.get(URL) is not None
+    now[0] += 2
+    assert cache.get(URL) is None
+    # Without a TTL every stored page is served
+    assert PageCache(tmp_path, ttl=None).get(URL) is not None
+
+
+def test_corrupt_and_tampered_files_are_dropped(tmp_path):
+    cache = PageCache(tmp_path)
+    path = cache._path(URL)
+
+    path.write_bytes(b"not gzip")
+    assert cache.get(URL) is None
+    assert not path.exists()
+
+    cache.put(URL, "<html>a</html>")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        text = f.read().replace("<html>a</html>", "<html>b</html>")
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(text)
+    assert cache.get(URL) is None
+    assert not path.exists()
+
+
+def test_configure_page_cache_zero_disables_the_shared_cache():
+    try:
+        configure_page_cache(0)
+        assert shared_page_cache() is None
+        configure_page_cache(None)
+        assert shared_page_cache().ttl is None
+    finally:
+        configure_page_cache(page_cache.DEFAULT_TTL)
+
+
+class FakePool:
+    """Browser pool whose renders give back fixed pages."""
+
+    def __init__(self, rendered):
+        self.rendered = rendered
+
+    def render_many(self, urls, wait_for_selector=None):
+        return [self.rendered[url] for url in urls]
+
+
+def test_only_pages_with_their_content_are_returned_and_cached(tmp_path, monkeypatch):
+    ready, timed_out = f"{URL}?week=1", f"{URL}?week=2"
+    cache = PageCache(tmp_path)
+    pool = FakePool(
+        {
+            ready: RenderedPage(ready, '<div class="week"></div>', 1.0),
+            timed_out: RenderedPage(timed_out, "<div></div>", 20.0, ready=False),
+        }
+    )
+    monkeypatch.setattr(pages, "shared_page_cache", lambda: cache)
+    monkeypatch.setattr(pages, "shared_browser_pool", lambda: pool)
+    monkeypatch.setattr(pages, "fetch_static", lambda urls, crawler: [None] * len(urls))
+
+    fetched = pages.fetch_pages([ready, timed_out], "div.week", crawler=object())
+
+    assert [page and page.source for page in fetched] == [pages.BROWSER, None]
+    assert cache.get(ready) is not None
+    assert cache.get(timed_out) is None
@@ -0,0 +1,66 @@
+import json
+
+import numpy as np
+import pytest
+
+from vbdb_fetch.pbp import (
+    EVENT_CODES,
+    EVENT_FIELDS,
+    HOME,
+    UNKNOWN,
+    classify_event,
+    decode_events,
+    encode_events,
+    pbp_row,
+)
+
+EVENTS = {
+    "set_no": [1, 1, 1, 5],
+    "home_score": [1, 1, 2, 15],
+    "away_score": [0, 1, 1, 13],
+    "serving": [HOME, UNKNOWN, HOME, 1],
+    "event": [EVENT_CODES["kill"], EVENT_CODES["ace"], EVENT_CODES["other"], 0],
+    "player": [0, -1, 1, 300],
+}
+
+
+def test_encode_decode_round_trip():
+    n_events, blob = encode_events(EVENTS)
+    columns = decode_events(blob, n_events)
+
+    assert n_events == 4
+    assert list(columns) == [field for field, _ in EVENT_FIELDS]
+    for field, dtype in EVENT_FIELDS:
+        assert columns[field].dtype == np.dtype(dtype)
+        assert columns[field].tolist() == EVENTS[field]
+
+
+def test_decoded_columns_are_read_only():
+    n_events, blob = encode_events(EVENTS)
+    with pytest.raises(ValueError):
+        decode_events(blob, n_events)["player"][0] = 7
+
+
+def test_encode_rejects_ragged_columns():
+    with pytest.raises(ValueError):
+        encode_events({**EVENTS, "player": [0, 1]})
+
+
+def test_empty_match_round_trips():
+    n_events, blob = encode_events({field: [] for field, _ in EVENT_FIELDS})
+    assert n_events == 0
+    assert all(len(column) == 0 for column in decode_events(blob, 0).values())
+
+
+def test_pbp_row_stores_the_player_list():
+    league, match_id, n_events, players, blob = pbp_row("ncaaw", "1", EVENTS, ["a"])
+    assert (league, match_id, n_events) == ("ncaaw", "1", 4)
+    assert json.loads(players) == ["a"]
+    assert decode_events(blob, n_events)["set_no"].tolist() == EVENTS["set_no"]
+
+
+def test_classify_event_takes_the_most_specific_pattern():
+    assert classify_event("Kill by SMITH, J (assist by DOE)") == EVENT_CODES["kill"]
+    assert classify_event("Attack error by SMITH") == EVENT_CODES["attack_error"]
+    assert classify_event("Service ace by DOE") == EVENT_CODES["ace"]
+    assert classify_event("Media break") == EVENT_CODES["other"]
@@ -0,0 +1,48 @@
+from vbdb_fetch import init_db
+
+SWEEP = "3-0 [25-20, 25-20, 25-20]"
+FOUR_SETS = "3-1 [25-20, 22-25, 25-10, 25-23]"
+COMEBACK = "2-3 [25-20, 25-20, 20-25, 20-25, 10-15]"
+
+
+def result(match_id, date, home, away, score):
+    return {
+        "match_id": match_id, "date": date, "time": "19:00", "home_team_id": home,
+        "away_team_id": away, "score": score, "status": "completed", "year": "2024",
+    }  # fmt: skip
+
+
+def ratings(db):
+    return [
+        tuple(row)
+        for row in db.execute(
+            "SELECT * FROM team_ratings ORDER BY rating_date, team_id"
+        ).fetchall()
+    ]
+
+
+def test_ratings_replay_when_an_earlier_result_is_corrected():
+    db = init_db(in_memory=True)
+    try:
+        db.add_ncaaw_results(
+            [
+                result("m1", "09/01/2024", "a", "b", SWEEP),
+                result("m2", "09/05/2024", "b", "c", FOUR_SETS),
+            ]
+        )
+        assert db.update_ratings("ncaaw") == 2
+        assert db.update_ratings("ncaaw") == 0
+
+        # Same teams and match count, but the first match's winner changed
+        db.add_ncaaw_results([result("m1", "09/01/2024", "a", "b", COMEBACK)])
+        assert db.update_ratings("ncaaw") == 2
+        incremental = ratings(db)
+
+        db.update_ratings("ncaaw", rebuild=True)
+        assert incremental == ratings(db)
+        assert [row[3:5] + row[8:] for row in incremental[:2]] == [
+            ("a", 1, 0, -1),
+            ("b", 1, 1, 1),
+        ]
+    finally:
+        db.close()
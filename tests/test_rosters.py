@@ -0,0 +1,52 @@
+import pandas as pd
+
+from tests.roster_oracle import (
+    HEADER_SETS,
+    legacy_normalize,
+    make_tables,
+    vectorized_normalize,
+)
+from vbdb_fetch.rosters import roster_headers
+
+
+def test_roster_headers_take_each_field_once():
+    assert roster_headers(["#", "Player", "No.", "Ht.", "Notes"]) == [
+        "jersey",
+        "name",
+        "No.",
+        "height",
+        "Notes",
+    ]
+
+
+def records(frame: pd.DataFrame) -> list:
+    """Rows as sorted tuples; tables with the same headings are grouped."""
+    return sorted(frame.astype(str).itertuples(index=False, name=None))
+
+
+def test_normalize_rosters_matches_the_legacy_path():
+    teams_df, tables = make_tables(n_players=300, per_team=12)
+    # The legacy path picked one column per heading for the whole crawl, so
+    # it only read rosters right when every team used the same headings
+    tables = [table for table in tables if table[1] == HEADER_SETS[0]]
+    legacy = pd.DataFrame(legacy_normalize(tables, teams_df)).fillna("")
+    current = vectorized_normalize(tables, teams_df)
+    assert list(current.columns) == list(legacy.columns)
+    assert len(current) == len(legacy) == 9 * 12
+
+    # The legacy path left player_id empty without a profile link; the
+    # current one falls back to a name slug
+    linked = legacy["profile_url"] != ""
+    assert (~linked).any()
+    slugs = legacy["name"].str.lower().str.split().str.join("-")
+    legacy["player_id"] = legacy["player_id"].where(linked, slugs)
+
+    assert records(current) == records(legacy)
+
+
+def test_normalize_rosters_reads_every_heading_variant():
+    teams_df, tables = make_tables(n_players=300, per_team=12)
+    players = vectorized_normalize(tables, teams_df)
+    fields = ["name", "jersey", "position", "height", "class_year", "high_school"]
+    assert len(players) == 300
+    assert (players[fields] != "").all().all()
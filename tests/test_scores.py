@@ -0,0 +1,65 @@
+from vbdb_fetch.schema import TABLE_COLUMNS
+from vbdb_fetch.scores import HOME_FIRST, derive_scores, parse_scores
+
+NCAAM_COLUMNS = TABLE_COLUMNS["ncaam_results"]
+
+
+def ncaam_row(match_id, score, home="10", away="20"):
+    row = dict.fromkeys(NCAAM_COLUMNS)
+    row.update(match_id=match_id, score=score, home_team_id=home, away_team_id=away)
+    return tuple(row[col] for col in NCAAM_COLUMNS)
+
+
+def test_home_first_covers_every_league():
+    assert HOME_FIRST == {"lovb": False, "pvf": True, "ncaam": False, "ncaaw": True}
+
+
+def test_parse_scores_orients_sets_by_home_side():
+    scores = ["3-1 [25-20, 22-25, 25-10, 25-23]"]
+    home_first, sets = parse_scores(scores, home_first=True)
+    away_first, _ = parse_scores(scores, home_first=False)
+
+    assert home_first[["home_sets", "away_sets"]].values.tolist() == [[3, 1]]
+    assert away_first[["home_sets", "away_sets"]].values.tolist() == [[1, 3]]
+    assert sets[["set_no", "home_pts", "away_pts"]].values.tolist() == [
+        [1, 25, 20],
+        [2, 22, 25],
+        [3, 25, 10],
+        [4, 25, 23],
+    ]
+
+
+def test_parse_scores_counts_sets_without_a_leading_pair():
+    matches, _ = parse_scores(["[25-20, 20-25, 15-10]", "", None], home_first=True)
+    assert matches["home_sets"].tolist()[0] == 2
+    assert matches["away_sets"].tolist()[0] == 1
+    assert matches["home_sets"].isna().tolist()[1:] == [True, True]
+
+
+def test_derive_scores_away_first_league():
+    rows = [ncaam_row("m1", "1-3 [20-25, 25-22, 20-25, 21-25]"), ncaam_row("m2", "")]
+    derived, sets = derive_scores("ncaam", rows, NCAAM_COLUMNS)
+
+    # The visitor's 1 comes first, so the home side won 3-1
+    assert derived == [(3, 1, "10"), (None, None, None)]
+    assert sets[0] == ("ncaam", "m1", 1, 25, 20)
+    assert len(sets) == 4
+
+
+def test_derive_scores_prefers_reported_pvf_set_counts():
+    columns = TABLE_COLUMNS["pvf_results"]
+    row = dict.fromkeys(columns)
+    row.update(
+        pvf_match_id="99",
+        score="25-20, 25-20, 25-20",
+        home_team_score="3",
+        away_team_score="0",
+        home_team_id="t1",
+        away_team_id="t2",
+    )
+    derived, _ = derive_scores("pvf", [tuple(row[col] for col in columns)], columns)
+    assert derived == [(3, 0, "t1")]
+
+
+def test_derive_scores_empty():
+    assert derive_scores("ncaaw", [], TABLE_COLUMNS["ncaaw_results"]) == ([], [])
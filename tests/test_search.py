@@ -0,0 +1,15 @@
+from vbdb_fetch.search import fts_query
+
+
+def test_fts_query_prefix_matches_every_word():
+    assert fts_query("kar sm") == '"kar"* "sm"*'
+
+
+def test_fts_query_quotes_operators_and_drops_punctuation():
+    text = 'O\'Neil AND "x" -y NEAR('
+    assert fts_query(text) == '"O"* "Neil"* "AND"* "x"* "y"* "NEAR"*'
+    assert fts_query("Québec") == '"Québec"*'
+
+
+def test_fts_query_without_words_is_empty():
+    assert fts_query("  -- ()  ") == ""
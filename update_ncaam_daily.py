@@ -25,8 +25,9 @@ except ImportError:
 # Import schedule fetcher
 try:
     from schedule.fetch_ncaam_schedule import fetch_ncaam_schedules
+    from schedule.fetch_ncaa_individual_stats import fetch_new_individual_stats
 except ImportError:
-    logger.error("Cannot import fetch_ncaam_schedule. Make sure the file exists.")
+    logger.error("Cannot import the NCAAM schedule fetchers. Make sure the files exist.")
     sys.exit(1)
 
 
@@ -51,6 +52,14 @@ def main():
     
     logger.info(f"Successfully added {count} NCAAM matches to database.")
 
+    # Rate the new match day from the previous day's snapshot
+    days = db.update_ratings("ncaam", "2025")
+    logger.info(f"Updated NCAAM ratings for {days} match days.")
+
+    # Player lines for the new matches, fetched concurrently
+    lines = fetch_new_individual_stats(db, "ncaam")
+    logger.info(f"Added {lines} NCAAM player match lines.")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file